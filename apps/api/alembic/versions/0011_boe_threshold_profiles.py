@@ -0,0 +1,45 @@
+"""workspace boe threshold profiles
+
+Revision ID: 0011_boe_threshold_profiles
+Revises: 0010_workspace_member_viewer
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0011_boe_threshold_profiles"
+down_revision = "0010_workspace_member_viewer"
+branch_labels = None
+depends_on = None
+
+
+workspace_edition = postgresql.ENUM("SYNDICATOR", "FUND", name="workspaceedition", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "boe_threshold_profiles",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("base_edition", workspace_edition, nullable=True),
+        sa.Column("overrides", sa.JSON(), nullable=False),
+        sa.Column("quorum_required", sa.Integer(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("workspace_id", "version", name="uq_boe_threshold_profiles_workspace_version"),
+    )
+    op.create_index("ix_boe_threshold_profiles_workspace_id", "boe_threshold_profiles", ["workspace_id"])
+    op.add_column("boe_runs", sa.Column("threshold_profile_version", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("boe_runs", "threshold_profile_version")
+    op.drop_index("ix_boe_threshold_profiles_workspace_id", table_name="boe_threshold_profiles")
+    op.drop_table("boe_threshold_profiles")
@@ -0,0 +1,53 @@
+"""boe regate jobs
+
+Revision ID: 0012_boe_regate_jobs
+Revises: 0011_boe_threshold_profiles
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0012_boe_regate_jobs"
+down_revision = "0011_boe_threshold_profiles"
+branch_labels = None
+depends_on = None
+
+
+boe_regate_status = sa.Enum("QUEUED", "RUNNING", "SUCCEEDED", "FAILED", name="boeregatestatus")
+
+
+def upgrade() -> None:
+    boe_regate_status.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "boe_regate_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("status", boe_regate_status, nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column("cursor_deal_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("total_deals", sa.Integer(), nullable=True),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("failed", sa.Integer(), nullable=False),
+        sa.Column("transitions", sa.Integer(), nullable=False),
+        sa.Column("elapsed_seconds", sa.Float(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("checkpointed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_boe_regate_jobs_workspace_id", "boe_regate_jobs", ["workspace_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_boe_regate_jobs_workspace_id", table_name="boe_regate_jobs")
+    op.drop_table("boe_regate_jobs")
+    boe_regate_status.drop(op.get_bind(), checkfirst=True)
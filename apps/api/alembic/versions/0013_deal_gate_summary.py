@@ -0,0 +1,85 @@
+"""deal gate summary read model
+
+Revision ID: 0013_deal_gate_summary
+Revises: 0012_boe_regate_jobs
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0013_deal_gate_summary"
+down_revision = "0012_boe_regate_jobs"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_SQL = """
+INSERT INTO deal_gate_summary (
+    deal_id, workspace_id, latest_run_id, computed_status, effective_status, has_override, ic_score,
+    pass_count, hard_veto_ok, binding_constraint, boe_max_bid, test_results, audit_trail_count, updated_at
+)
+SELECT
+    d.id,
+    d.workspace_id,
+    r.id,
+    CASE WHEN r.id IS NULL THEN 'NO_RUN' ELSE d.gate_status_computed::text END,
+    d.gate_status::text,
+    d.gate_override_status IS NOT NULL,
+    GREATEST(0, 100 - 25 * COALESCE(t.hard_fail, 0) - 10 * COALESCE(t.soft_fail, 0) - 5 * COALESCE(t.warn, 0)),
+    COALESCE(t.pass_count, 0),
+    COALESCE(t.hard_veto_ok, true),
+    r.binding_constraint,
+    CAST(r.outputs ->> 'boe_max_bid' AS double precision),
+    COALESCE(t.results, '{}'::json),
+    (SELECT count(*) FROM deal_gate_events e WHERE e.deal_id = d.id),
+    now()
+FROM deals d
+LEFT JOIN boe_runs r ON r.id = d.latest_boe_run_id
+LEFT JOIN LATERAL (
+    SELECT
+        count(*) FILTER (WHERE lower(tr.test_class::text) = 'hard' AND tr.result::text = 'FAIL') AS hard_fail,
+        count(*) FILTER (WHERE lower(tr.test_class::text) = 'soft' AND tr.result::text = 'FAIL') AS soft_fail,
+        count(*) FILTER (WHERE tr.result::text = 'WARN') AS warn,
+        count(*) FILTER (WHERE tr.result::text IN ('PASS', 'WARN')) AS pass_count,
+        bool_and(tr.result::text = 'PASS') FILTER (WHERE lower(tr.test_class::text) = 'hard') AS hard_veto_ok,
+        json_object_agg(tr.test_key, CASE tr.result::text WHEN 'NA' THEN 'N/A' ELSE tr.result::text END) AS results
+    FROM boe_test_results tr
+    WHERE tr.boe_run_id = r.id
+) t ON true
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "deal_gate_summary",
+        sa.Column("deal_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("latest_run_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("computed_status", sa.String(length=24), nullable=False),
+        sa.Column("effective_status", sa.String(length=24), nullable=False),
+        sa.Column("has_override", sa.Boolean(), nullable=False),
+        sa.Column("ic_score", sa.Integer(), nullable=False),
+        sa.Column("pass_count", sa.Integer(), nullable=False),
+        sa.Column("hard_veto_ok", sa.Boolean(), nullable=False),
+        sa.Column("binding_constraint", sa.String(length=100), nullable=True),
+        sa.Column("boe_max_bid", sa.Float(), nullable=True),
+        sa.Column("test_results", sa.JSON(), nullable=False),
+        sa.Column("audit_trail_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["deal_id"], ["deals.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["latest_run_id"], ["boe_runs.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("deal_id"),
+    )
+    op.create_index(
+        "ix_deal_gate_summary_workspace_status", "deal_gate_summary", ["workspace_id", "effective_status"]
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deal_gate_summary_workspace_status", table_name="deal_gate_summary")
+    op.drop_table("deal_gate_summary")
@@ -0,0 +1,56 @@
+"""workspace gate counters
+
+Revision ID: 0014_workspace_gate_counters
+Revises: 0013_deal_gate_summary
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0014_workspace_gate_counters"
+down_revision = "0013_deal_gate_summary"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_SQL = """
+INSERT INTO workspace_gate_counters (workspace_id, metric, bucket, value, updated_at)
+SELECT workspace_id, metric, bucket, value, now() FROM (
+    SELECT workspace_id, 'deals' AS metric, '' AS bucket, count(*) AS value
+    FROM deal_gate_summary GROUP BY workspace_id
+    UNION ALL
+    SELECT workspace_id, 'status', effective_status, count(*)
+    FROM deal_gate_summary GROUP BY workspace_id, effective_status
+    UNION ALL
+    SELECT workspace_id, 'overrides', '', count(*)
+    FROM deal_gate_summary WHERE has_override GROUP BY workspace_id
+    UNION ALL
+    SELECT workspace_id, 'ic_score_sum', '', sum(ic_score)
+    FROM deal_gate_summary GROUP BY workspace_id
+    UNION ALL
+    SELECT workspace_id, 'binding', binding_constraint, count(*)
+    FROM deal_gate_summary WHERE coalesce(binding_constraint, '') <> ''
+    GROUP BY workspace_id, binding_constraint
+) counters
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workspace_gate_counters",
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("metric", sa.String(length=24), nullable=False),
+        sa.Column("bucket", sa.String(length=100), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("workspace_id", "metric", "bucket"),
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    op.drop_table("workspace_gate_counters")
@@ -0,0 +1,33 @@
+"""deal list keyset indexes
+
+Revision ID: 0015_deal_list_indexes
+Revises: 0014_workspace_gate_counters
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0015_deal_list_indexes"
+down_revision = "0014_workspace_gate_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_deals_workspace_created_id", "deals", ["workspace_id", "created_at", "id"])
+    op.create_index(
+        "ix_deals_workspace_status_created_id", "deals", ["workspace_id", "gate_status", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_deals_workspace_name_prefix",
+        "deals",
+        ["workspace_id", "name"],
+        postgresql_ops={"name": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deals_workspace_name_prefix", table_name="deals")
+    op.drop_index("ix_deals_workspace_status_created_id", table_name="deals")
+    op.drop_index("ix_deals_workspace_created_id", table_name="deals")
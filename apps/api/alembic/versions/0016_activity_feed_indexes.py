@@ -0,0 +1,24 @@
+"""activity feed keyset indexes
+
+Revision ID: 0016_activity_feed_indexes
+Revises: 0015_deal_list_indexes
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0016_activity_feed_indexes"
+down_revision = "0015_deal_list_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_deal_gate_events_deal_created_id", "deal_gate_events", ["deal_id", "created_at", "id"])
+    op.create_index("ix_deal_comments_deal_created_id", "deal_comments", ["deal_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deal_comments_deal_created_id", table_name="deal_comments")
+    op.drop_index("ix_deal_gate_events_deal_created_id", table_name="deal_gate_events")
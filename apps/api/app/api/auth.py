@@ -1,8 +1,11 @@
+import math
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.passwords import PasswordHasherBusy
+from app.core.security import auth_attempts, create_access_token, hash_password, verify_and_update_password
 from app.db.session import get_db
 from app.models.entities import User
 from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
@@ -10,15 +13,38 @@ from app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _limit_attempts(email: str) -> None:
+    retry_after = auth_attempts.hit(email)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts for this email",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def _hashing(fn, *args):
+    try:
+        return fn(*args)
+    except PasswordHasherBusy as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is busy, retry shortly",
+            headers={"Retry-After": "1"},
+        ) from exc
+
+
 @router.post("/register", response_model=TokenResponse)
 def register(payload: RegisterRequest, db: Session = Depends(get_db)):
-    exists = db.scalar(select(User).where(User.email == payload.email.lower()))
+    email = payload.email.lower()
+    _limit_attempts(email)
+    exists = db.scalar(select(User).where(User.email == email))
     if exists:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
     user = User(
-        email=payload.email.lower(),
-        hashed_password=hash_password(payload.password),
+        email=email,
+        hashed_password=_hashing(hash_password, payload.password),
         full_name=payload.full_name,
     )
     db.add(user)
@@ -29,7 +55,16 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=TokenResponse)
 def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.scalar(select(User).where(User.email == payload.email.lower()))
-    if not user or not verify_password(payload.password, user.hashed_password):
+    email = payload.email.lower()
+    _limit_attempts(email)
+    user = db.scalar(select(User).where(User.email == email))
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = _hashing(verify_and_update_password, payload.password, user.hashed_password)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # The configured bcrypt cost changed since this hash was made; upgrade it while we hold the plaintext.
+        user.hashed_password = new_hash
+        db.commit()
     return TokenResponse(access_token=create_access_token(str(user.id)))
@@ -1,17 +1,40 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 
-from app.api.deps import get_current_user, get_deal_with_access
-from app.boe.engine import BOEInput, GateStatus, calculate_boe, serialize_output
-from app.db.session import get_db
-from app.models.entities import BOERun, BOETestResult, Deal, User
-from app.models.enums import DealStatus, TestClass, TestResult
-from app.schemas.boe import BOEDecisionSummaryOut, BOERunCreate, BOERunOut
+from app.api.deps import get_current_user, get_deal_with_access, require_workspace_member
+from app.boe.engine import BOEInput, GateStatus, serialize_output
+from app.boe.montecarlo import parse_distribution, simulate_boe
+from app.core.config import settings
+from app.db.session import SessionLocal, get_db
+from app.models.entities import BOERegateJob, BOERun, BOETestResult, Deal, User
+from app.models.enums import BOERegateStatus, DealStatus, MemberRole, TestClass, TestResult
+from app.schemas.boe import (
+    BOEBulkRunCreate,
+    BOEDecisionSummaryOut,
+    BOEMonteCarloRequest,
+    BOERegateCreate,
+    BOERunCreate,
+    BOERunOut,
+    BOESensitivityRequest,
+)
+from app.services.access import Membership
+from app.services.boe import calculate_boe
+from app.services.boe_bulk import stream_bulk_boe_runs
+from app.services.boe_profiles import resolve_threshold_profile
+from app.services.boe_regate import REGATE_REASON, regate_job_stalled, regate_progress
+from app.services.boe_sensitivity import SensitivityAxis, build_sensitivity_grid
+from app.services.boe_solver import solve_gate_flip
+from app.services.deal_gate_summary import gate_summary_row, record_gate_summaries
 from app.services.gating import apply_computed_gate_status, log_boe_run_created, map_decision_to_deal_status, transition_deal_gate
+from app.workers.jobs import process_boe_regate_job
+from app.workers.queue import get_boe_queue
 
 router = APIRouter(prefix="/deals/{deal_id}/boe/runs", tags=["boe"])
+deal_router = APIRouter(prefix="/deals/{deal_id}/boe", tags=["boe"])
+workspace_router = APIRouter(prefix="/workspaces/{workspace_id}/boe", tags=["boe"])
 
 
 def _compute_ic_score(run: BOERun) -> tuple[int, dict]:
@@ -76,6 +99,7 @@ def _serialize_boe_run(run: BOERun) -> dict:
         "hard_veto_ok": run.hard_veto_ok,
         "pass_count": run.pass_count,
         "advance": run.advance,
+        "threshold_profile_version": run.threshold_profile_version,
         "decision_summary": _decision_summary_from_tests(run),
         "created_by": run.created_by,
         "created_at": run.created_at,
@@ -95,8 +119,9 @@ def create_boe_run(
     max_version = db.scalar(select(func.max(BOERun.version)).where(BOERun.deal_id == deal_id)) or 0
     version = int(max_version) + 1
 
+    profile = resolve_threshold_profile(db, deal.workspace_id)
     boe_input = BOEInput(**payload.inputs)
-    output, tests, decision = calculate_boe(boe_input)
+    output, tests, decision = calculate_boe(boe_input, profile=profile)
     outputs = serialize_output(output)
     run = BOERun(
         deal_id=deal_id,
@@ -108,6 +133,7 @@ def create_boe_run(
         hard_veto_ok=decision.hard_veto_ok,
         pass_count=decision.pass_count,
         advance=decision.advance,
+        threshold_profile_version=profile.version,
         created_by=user.id,
     )
     db.add(run)
@@ -132,7 +158,7 @@ def create_boe_run(
     log_boe_run_created(db, run, user.id)
     transition_deal_gate(db, deal, run, user.id)
     computed_status = map_decision_to_deal_status(decision)
-    apply_computed_gate_status(
+    gate_changed = apply_computed_gate_status(
         db,
         deal,
         computed_status,
@@ -145,6 +171,19 @@ def create_boe_run(
             "advance": decision.advance,
         },
     )
+    record_gate_summaries(
+        db,
+        [
+            gate_summary_row(
+                deal,
+                latest_run_id=run.id,
+                binding_constraint=output.binding_constraint,
+                outputs=outputs,
+                tests=[(t.key, t.test_class.value, t.result.value) for t in tests],
+                audit_trail_count=1 + gate_changed,
+            )
+        ],
+    )
     db.commit()
     reloaded = db.scalar(select(BOERun).options(selectinload(BOERun.tests)).where(BOERun.id == run.id))
     return _serialize_boe_run(reloaded)
@@ -178,3 +217,196 @@ def get_boe_run(
     if not run:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="BOE run not found")
     return _serialize_boe_run(run)
+
+
+def _base_inputs(db: Session, deal_id: UUID, inputs: dict | None) -> dict:
+    if inputs is not None:
+        return inputs
+    latest = db.scalar(select(BOERun).where(BOERun.deal_id == deal_id).order_by(BOERun.version.desc()).limit(1))
+    if not latest:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No BOE run to base analysis on")
+    return latest.inputs
+
+
+@deal_router.post("/sensitivity")
+def create_boe_sensitivity(
+    deal_id: UUID,
+    payload: BOESensitivityRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    deal = get_deal_with_access(str(deal_id), db, user.id)
+    base_inputs = _base_inputs(db, deal_id, payload.inputs)
+    profile = resolve_threshold_profile(db, deal.workspace_id)
+    axes = [SensitivityAxis(field=a.field, start=a.start, stop=a.stop, steps=a.steps) for a in payload.axes]
+    try:
+        return build_sensitivity_grid(base_inputs, axes, profile=profile)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc))
+
+
+@deal_router.post("/montecarlo")
+def create_boe_montecarlo(
+    deal_id: UUID,
+    payload: BOEMonteCarloRequest,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    deal = get_deal_with_access(str(deal_id), db, user.id)
+    base_inputs = _base_inputs(db, deal_id, payload.inputs)
+    profile = resolve_threshold_profile(db, deal.workspace_id)
+    if payload.simulations > settings.boe_montecarlo_max_simulations:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Monte Carlo runs are limited to {settings.boe_montecarlo_max_simulations} simulations",
+        )
+    try:
+        distributions = {field: parse_distribution(spec) for field, spec in payload.distributions.items()}
+        result = simulate_boe(
+            base_inputs,
+            distributions,
+            payload.simulations,
+            seed=payload.seed,
+            workers=settings.boe_montecarlo_workers,
+            profile=profile,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc))
+    return {**result.summary(), "threshold_profile_version": profile.version}
+
+
+@deal_router.get("/solver")
+def get_boe_gate_flip(
+    deal_id: UUID,
+    field: str = "asking_price",
+    low: float | None = None,
+    high: float | None = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    deal = get_deal_with_access(str(deal_id), db, user.id)
+    base_inputs = _base_inputs(db, deal_id, None)
+    profile = resolve_threshold_profile(db, deal.workspace_id)
+    try:
+        return solve_gate_flip(base_inputs, field=field, low=low, high=high, profile=profile)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc))
+
+
+@workspace_router.post("/runs/bulk")
+def create_bulk_boe_runs(
+    workspace_id: UUID,
+    payload: BOEBulkRunCreate,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    member = _workspace_member(db, workspace_id, user.id)
+    if member.role not in {MemberRole.OWNER, MemberRole.MEMBER}:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role for BOE runs")
+    if len(payload.items) > settings.boe_bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Bulk BOE requests are limited to {settings.boe_bulk_max_items} items",
+        )
+
+    items = [(item.deal_id, item.inputs) for item in payload.items]
+    user_id = user.id
+
+    # The request session is not guaranteed to outlive the handler, so the stream owns its own.
+    def _stream():
+        session = SessionLocal()
+        try:
+            yield from stream_bulk_boe_runs(
+                session,
+                workspace_id=workspace_id,
+                items=items,
+                user_id=user_id,
+                chunk_size=settings.boe_bulk_chunk_size,
+            )
+        finally:
+            session.close()
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+def _workspace_member(db: Session, workspace_id, user_id) -> Membership:
+    return require_workspace_member(db, workspace_id, user_id)
+
+
+def _regate_job(db: Session, workspace_id, job_id) -> BOERegateJob:
+    job = db.scalar(
+        select(BOERegateJob).where(BOERegateJob.id == job_id, BOERegateJob.workspace_id == workspace_id)
+    )
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Re-gate job not found")
+    return job
+
+
+@workspace_router.post("/regate")
+def create_boe_regate_job(
+    workspace_id: UUID,
+    payload: BOERegateCreate,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    member = _workspace_member(db, workspace_id, user.id)
+    if member.role != MemberRole.OWNER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only workspace admins can re-gate deals")
+    chunk_size = payload.chunk_size or settings.boe_regate_chunk_size
+    if not 1 <= chunk_size <= settings.boe_bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"chunk_size must be between 1 and {settings.boe_bulk_max_items}",
+        )
+
+    job = BOERegateJob(
+        workspace_id=workspace_id,
+        status=BOERegateStatus.QUEUED,
+        reason=payload.reason or REGATE_REASON,
+        chunk_size=chunk_size,
+        processed=0,
+        failed=0,
+        transitions=0,
+        elapsed_seconds=0.0,
+        created_by=user.id,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    get_boe_queue().enqueue(process_boe_regate_job, str(job.id))
+    return regate_progress(job)
+
+
+@workspace_router.get("/regate/{job_id}")
+def get_boe_regate_job(
+    workspace_id: UUID,
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    _workspace_member(db, workspace_id, user.id)
+    return regate_progress(_regate_job(db, workspace_id, job_id))
+
+
+@workspace_router.post("/regate/{job_id}/resume")
+def resume_boe_regate_job(
+    workspace_id: UUID,
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    member = _workspace_member(db, workspace_id, user.id)
+    if member.role != MemberRole.OWNER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only workspace admins can re-gate deals")
+    job = _regate_job(db, workspace_id, job_id)
+    # A RUNNING job that stopped checkpointing lost its worker (crash, deploy, OOM) and is resumable too.
+    if job.status != BOERegateStatus.FAILED and not regate_job_stalled(job, settings.boe_regate_stale_after_seconds):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Only failed or stalled re-gate jobs can be resumed"
+        )
+
+    job.status = BOERegateStatus.QUEUED
+    db.commit()
+    get_boe_queue().enqueue(process_boe_regate_job, str(job.id))
+    return regate_progress(job)
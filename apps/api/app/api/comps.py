@@ -2,10 +2,11 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
+from app.api.deps import get_async_read_db, get_current_user, get_current_user_async, get_deal_with_access, get_read_db
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.entities import (
@@ -14,9 +15,7 @@ from app.models.entities import (
     CompRun,
     CompSubject,
     CompSubjectVariance,
-    Deal,
     User,
-    WorkspaceMember,
 )
 from app.models.enums import CompRunStatus, CompSourceType, ListingSourceType, VarianceBasis
 from app.schemas.comps import (
@@ -34,11 +33,11 @@ from app.schemas.comps import (
 from app.services.comps import (
     build_normalized_row,
     compute_rollups,
-    compute_subject_variance,
     dedupe_rows,
     flag_old_rows,
     flag_outliers_iqr,
 )
+from app.services.comps.persistence import listing_values, listing_writer, write_aggregates
 from app.workers.jobs import process_private_file_run, process_public_connector_run
 from app.workers.queue import get_comp_queue
 
@@ -46,59 +45,7 @@ router = APIRouter(prefix="/deals/{deal_id}/comps", tags=["comps"])
 
 
 def _assert_deal_access(db: Session, deal_id, user_id):
-    deal = db.scalar(select(Deal).where(Deal.id == deal_id))
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-    member = db.scalar(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == deal.workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-    )
-    if not member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Deal access denied")
-    return deal
-
-
-def _recompute_run_aggregates(db: Session, run: CompRun):
-    rows = list(db.scalars(select(CompListing).where(CompListing.comp_run_id == run.id)).all())
-
-    rollups = compute_rollups(rows)
-    db.execute(delete(CompRollup).where(CompRollup.comp_run_id == run.id))
-    db.execute(delete(CompSubjectVariance).where(CompSubjectVariance.comp_run_id == run.id))
-
-    for unit_type, payload in rollups.items():
-        db.add(
-            CompRollup(
-                comp_run_id=run.id,
-                unit_type=unit_type,
-                avg_rent=payload["avg_rent"],
-                avg_gross_rent=payload["avg_gross_rent"],
-                avg_discount_premium=payload["avg_discount_premium"],
-                median_rent=payload["median_rent"],
-                p25_rent=payload["p25_rent"],
-                p75_rent=payload["p75_rent"],
-                sample_size=payload["sample_size"],
-            )
-        )
-
-    subject_rows = list(db.scalars(select(CompSubject).where(CompSubject.deal_id == run.deal_id)).all())
-    subject_map = {
-        s.unit_type: {"subject_rent": s.subject_rent, "subject_gross_rent": s.subject_gross_rent}
-        for s in subject_rows
-    }
-    variances = compute_subject_variance(rollups, subject_map)
-    for unit_type, payload in variances.items():
-        db.add(
-            CompSubjectVariance(
-                comp_run_id=run.id,
-                unit_type=unit_type,
-                variance_net=payload["variance_net"],
-                variance_gross=payload["variance_gross"],
-                basis=payload["basis"],
-                computed_at=payload["computed_at"],
-            )
-        )
+    return get_deal_with_access(deal_id, db, user_id)
 
 
 @router.post("/runs/manual", response_model=CompRunOut)
@@ -145,35 +92,13 @@ def create_manual_comp_run(
     flag_outliers_iqr(rows)
     flag_old_rows(rows, max_age_days=settings.comp_old_days_threshold)
 
-    for row in rows:
-        db.add(
-            CompListing(
-                comp_run_id=run.id,
-                unit_type=row.unit_type,
-                address=row.address,
-                unit=row.unit,
-                beds=row.beds,
-                baths=row.baths,
-                rent=row.rent,
-                gross_rent=row.gross_rent,
-                discount_premium=row.discount_premium,
-                date_observed=row.date_observed,
-                link=row.link,
-                notes=row.notes,
-                source_type=row.source_type,
-                source_ref=row.source_ref,
-                observed_at=row.observed_at,
-                confidence_score=row.confidence_score,
-                dedupe_key=row.dedupe_key,
-                flags=row.flags,
-            )
-        )
+    writer = listing_writer(db)
+    writer.write(listing_values(run.id, row) for row in rows)
+    write_aggregates(db, run, compute_rollups(rows))
 
     run.status = CompRunStatus.SUCCEEDED
     run.finished_at = datetime.now(UTC)
-    run.parse_report = {"rows_written": len(rows), "mode": "manual"}
-
-    _recompute_run_aggregates(db, run)
+    run.parse_report = {"rows_written": len(rows), "mode": "manual", "write": writer.report()}
     db.commit()
     db.refresh(run)
     return run
@@ -251,13 +176,17 @@ def list_comp_runs(
 
 
 @router.get("/runs/{comp_run_id}/listings", response_model=list[CompListingOut])
-def list_comp_listings(
+async def list_comp_listings(
     deal_id: UUID,
     comp_run_id: UUID,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    user: User = Depends(get_current_user_async),
 ):
-    _assert_deal_access(db, deal_id, user.id)
+    return await db.run_sync(_comp_listings, deal_id, comp_run_id, user.id)
+
+
+def _comp_listings(db: Session, deal_id: UUID, comp_run_id: UUID, user_id) -> list[CompListing]:
+    _assert_deal_access(db, deal_id, user_id)
     stmt = select(CompListing).where(CompListing.comp_run_id == comp_run_id)
     return list(db.scalars(stmt).all())
 
@@ -266,7 +195,7 @@ def list_comp_listings(
 def list_comp_rollups(
     deal_id: UUID,
     comp_run_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ):
     _assert_deal_access(db, deal_id, user.id)
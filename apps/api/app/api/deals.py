@@ -1,16 +1,34 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
-from app.api.deps import get_current_user
-from app.db.session import get_db
-from app.models.entities import BOERun, BOETestResult, Deal, DealComment, DealGateEvent, DealOutcome, User, WorkspaceMember
-from app.models.enums import DealStatus, MemberRole
-from app.schemas.deal import DealCreate, DealOut, DealUpdate
+from app.api.deps import (
+    get_async_read_db,
+    get_current_user,
+    get_current_user_async,
+    get_deal_with_access,
+    get_read_db,
+    require_workspace_member,
+)
+from app.db.session import get_async_db, get_db
+from app.models.entities import BOERun, BOETestResult, Deal, DealComment, DealGateEvent, DealOutcome, User
+from app.models.enums import DealGateState, DealStatus, MemberRole
+from app.schemas.deal import DealCreate, DealOut, DealPageOut, DealUpdate
 from app.schemas.deal_workspace import DealActivityEventOut, DealCommentCreate, DealOverrideActionRequest
 from app.schemas.gate import DealOutcomeCreate, DealOutcomeOut, GateSummaryOut, ICPacketOut
+from app.services.access import Membership, resolve_membership
+from app.services.activity_feed import load_activity_feed
+from app.services.deal_gate_summary import (
+    forget_gate_summary,
+    gate_summary_row,
+    record_gate_override,
+    record_gate_summaries,
+)
+from app.services.deal_listing import DEAL_PAGE_MAX, DEAL_PAGE_SIZE, DealFilters, list_deals_page
 from app.services.gate_summary import build_gate_summary
 from app.services.gating import set_gate_override
 
@@ -18,37 +36,16 @@ router = APIRouter(prefix="/deals", tags=["deals"])
 
 
 def _assert_workspace_access(db: Session, workspace_id, user_id):
-    is_member = db.scalar(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-    )
-    if not is_member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace access denied")
-
-
-def _workspace_member(db: Session, workspace_id, user_id) -> WorkspaceMember | None:
-    return db.scalar(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-    )
+    require_workspace_member(db, workspace_id, user_id)
 
 
 def _get_deal_with_access(db: Session, deal_id, user_id) -> Deal:
-    deal = db.scalar(select(Deal).where(Deal.id == deal_id))
-    if not deal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-    member = _workspace_member(db, deal.workspace_id, user_id)
-    if not member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Deal access denied")
-    return deal
+    return get_deal_with_access(deal_id, db, user_id)
 
 
-def _get_deal_member(db: Session, deal: Deal, user_id) -> WorkspaceMember:
-    member = _workspace_member(db, deal.workspace_id, user_id)
+def _get_deal_member(db: Session, deal: Deal, user_id) -> Membership:
+    # Already resolved alongside the deal for this request, so this is normally free.
+    member = resolve_membership(db, deal.workspace_id, user_id)
     if not member:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Deal access denied")
     return member
@@ -78,15 +75,56 @@ def create_deal(
         created_by=user.id,
     )
     db.add(deal)
+    db.flush()
+    record_gate_summaries(db, [gate_summary_row(deal)])
     db.commit()
     db.refresh(deal)
     return deal
 
 
-@router.get("/workspace/{workspace_id}", response_model=list[DealOut])
-def list_deals(workspace_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    _assert_workspace_access(db, workspace_id, user.id)
-    return list(db.scalars(select(Deal).where(Deal.workspace_id == workspace_id).order_by(Deal.created_at.desc())).all())
+@router.get("/workspace/{workspace_id}", response_model=DealPageOut)
+async def list_deals(
+    workspace_id: str,
+    gate_status: DealStatus | None = None,
+    current_gate_state: DealGateState | None = None,
+    min_asking_price: Decimal | None = None,
+    max_asking_price: Decimal | None = None,
+    name_prefix: str | None = None,
+    cursor: str | None = None,
+    limit: int = DEAL_PAGE_SIZE,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_async),
+):
+    filters = DealFilters(
+        gate_status=gate_status,
+        current_gate_state=current_gate_state,
+        min_asking_price=min_asking_price,
+        max_asking_price=max_asking_price,
+        name_prefix=name_prefix or None,
+    )
+    return await db.run_sync(_deal_page, workspace_id, user.id, filters, cursor, limit)
+
+
+def _deal_page(db: Session, workspace_id, user_id, filters: DealFilters, cursor: str | None, limit: int):
+    _assert_workspace_access(db, workspace_id, user_id)
+    low, high = filters.min_asking_price, filters.max_asking_price
+    if low is not None and high is not None and low > high:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="min_asking_price cannot exceed max_asking_price",
+        )
+    try:
+        # The total only accompanies the first page; later pages reuse the client's copy.
+        return list_deals_page(
+            db,
+            workspace_id,
+            filters,
+            cursor=cursor,
+            limit=max(1, min(limit, DEAL_PAGE_MAX)),
+            include_total=cursor is None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
 
 
 @router.get("/{deal_id}", response_model=DealOut)
@@ -147,13 +185,14 @@ def override_deal_gate_status(
         }
         target_status = status_map[override_status_raw]
 
-    set_gate_override(
+    changed = set_gate_override(
         db,
         deal,
         override_status=target_status,
         reason=comment,
         override_by=str(user.id),
     )
+    record_gate_override(db, deal, audit_events=int(changed))
     db.commit()
     db.refresh(deal)
     return deal
@@ -186,90 +225,28 @@ def get_deal_activity(
     limit: int = 50,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
+    cursor: str | None = None,
 ):
     deal = _get_deal_with_access(db, deal_id, user.id)
     _ = _get_deal_member(db, deal, user.id)
     limit = max(1, min(limit, 200))
-
-    gate_events = list(
-        db.scalars(
-            select(DealGateEvent)
-            .where(DealGateEvent.deal_id == deal.id)
-            .order_by(DealGateEvent.created_at.desc())
-            .limit(limit)
-        ).all()
-    )
-    comments = list(
-        db.scalars(
-            select(DealComment)
-            .where(DealComment.deal_id == deal.id)
-            .order_by(DealComment.created_at.desc())
-            .limit(limit)
-        ).all()
-    )
-    actor_ids: set[str] = set()
-    for e in gate_events:
-        actor = (e.metadata_json or {}).get("override_by") or (e.metadata_json or {}).get("actor_user_id")
-        if actor:
-            actor_ids.add(str(actor))
-    for c in comments:
-        actor_ids.add(str(c.created_by))
-    users = {}
-    if actor_ids:
-        for u in db.scalars(select(User).where(User.id.in_(list(actor_ids)))).all():
-            users[str(u.id)] = u
-
-    events: list[dict] = []
-    for e in gate_events:
-        actor_id = (e.metadata_json or {}).get("override_by") or (e.metadata_json or {}).get("actor_user_id")
-        actor = users.get(str(actor_id)) if actor_id else None
-        if e.event_type == "BOE_RUN_CREATED":
-            event_type = "BOE_RUN_CREATED"
-            summary = "BOE run created"
-        elif e.event_type == "OVERRIDE_SET":
-            event_type = "GATE_OVERRIDE_SET"
-            summary = f"Gate override set to {e.to_status}"
-        elif e.event_type == "OVERRIDE_CLEARED":
-            event_type = "GATE_OVERRIDE_CLEARED"
-            summary = "Gate override cleared"
-        else:
-            event_type = e.event_type
-            summary = e.event_type.replace("_", " ").title()
-        events.append(
-            {
-                "id": f"gate-{e.id}",
-                "type": event_type,
-                "created_at": e.created_at,
-                "actor": {"id": str(actor.id) if actor else str(actor_id) if actor_id else None, "email": actor.email if actor else None, "name": actor.full_name if actor else None},
-                "summary": summary,
-                "metadata": e.metadata_json or {},
-            }
-        )
-
-    for c in comments:
-        actor = users.get(str(c.created_by))
-        events.append(
-            {
-                "id": f"comment-{c.id}",
-                "type": "COMMENT_ADDED",
-                "created_at": c.created_at,
-                "actor": {"id": str(c.created_by), "email": actor.email if actor else None, "name": actor.full_name if actor else None},
-                "summary": c.body,
-                "metadata": {"body": c.body},
-            }
-        )
-
-    events.sort(key=lambda x: (x["created_at"], x["id"]), reverse=True)
-    return events[:limit]
+    try:
+        return load_activity_feed(db, deal.id, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
 
 
 @router.get("/{deal_id}/gate_summary", response_model=GateSummaryOut)
-def get_deal_gate_summary(
+async def get_deal_gate_summary(
     deal_id: str,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    user: User = Depends(get_current_user_async),
 ):
-    deal = _get_deal_with_access(db, deal_id, user.id)
+    return await db.run_sync(_gate_summary, deal_id, user.id)
+
+
+def _gate_summary(db: Session, deal_id: str, user_id):
+    deal = _get_deal_with_access(db, deal_id, user_id)
     latest_run = _get_latest_run_with_tests(db, deal.id)
     tests = latest_run.tests if latest_run else []
     audit_trail_count = db.scalar(select(func.count()).select_from(DealGateEvent).where(DealGateEvent.deal_id == deal.id)) or 0
@@ -284,7 +261,7 @@ def get_deal_gate_summary(
 @router.get("/{deal_id}/ic_packet", response_model=ICPacketOut)
 def get_deal_ic_packet(
     deal_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ):
     deal = _get_deal_with_access(db, deal_id, user.id)
@@ -377,5 +354,6 @@ def create_or_update_deal_outcome(
 @router.delete("/{deal_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_deal(deal_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
     deal = _get_deal_with_access(db, deal_id, user.id)
+    forget_gate_summary(db, deal)
     db.delete(deal)
     db.commit()
@@ -1,50 +1,104 @@
+import secrets
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.db.session import get_db
-from app.models.entities import Deal, User, WorkspaceMember
+from app.core.tokens import decode_access_token
+from app.db.session import async_read_session, get_async_db, get_db, read_router, read_session
+from app.models.entities import Deal, User
 from app.models.enums import DealGateState
+from app.services.access import DealAccess, Membership, resolve_deal_access, resolve_membership, resolve_user
 
 bearer = HTTPBearer(auto_error=True)
+optional_bearer = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(bearer),
-    db: Session = Depends(get_db),
-) -> User:
-    token = creds.credentials
+def _token_user_id(token: str) -> UUID:
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        sub = payload.get("sub")
-        user_id = UUID(sub)
-    except (JWTError, ValueError, TypeError):
+        return UUID(decode_access_token(token))
+    except (ValueError, TypeError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.scalar(select(User).where(User.id == user_id))
+
+def _authenticated(db: Session, user_id: UUID) -> User:
+    user = resolve_user(db, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    # Lets the session's commit hook pin this user's next reads of the deals it wrote to the primary.
+    db.info["user_id"] = user.id
     return user
 
 
-def get_deal_with_access(deal_id: str, db: Session, user_id):
-    deal = db.scalar(select(Deal).where(Deal.id == deal_id))
-    if not deal:
+def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    db: Session = Depends(get_db),
+) -> User:
+    return _authenticated(db, _token_user_id(creds.credentials))
+
+
+async def get_current_user_async(
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """``get_current_user`` for ``async def`` routes; shares the route's ``AsyncSession``."""
+    return await db.run_sync(_authenticated, _token_user_id(creds.credentials))
+
+
+def require_metrics_token(creds: HTTPAuthorizationCredentials | None = Depends(optional_bearer)) -> None:
+    """Gate for operational endpoints: ``Authorization: Bearer $METRICS_TOKEN``, or 404 when no token is set."""
+    if not settings.metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if creds is None or not secrets.compare_digest(creds.credentials.encode(), settings.metrics_token.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+
+def _prefers_replica(request: Request, creds: HTTPAuthorizationCredentials) -> bool:
+    try:
+        user_id = decode_access_token(creds.credentials)
+    except ValueError:
+        return False
+    return read_router.use_replica(user_id, request.path_params.get("deal_id"))
+
+
+def get_read_db(request: Request, creds: HTTPAuthorizationCredentials = Depends(bearer)):
+    """Session for read-only routes: the replica unless it lags or this user just wrote to the deal."""
+    db = read_session(read_router.enabled and _prefers_replica(request, creds))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request, creds: HTTPAuthorizationCredentials = Depends(bearer)):
+    # The lag probe and the Redis lookup are blocking, so the decision runs off the event loop.
+    use_replica = read_router.enabled and await run_in_threadpool(_prefers_replica, request, creds)
+    async with async_read_session(use_replica) as db:
+        yield db
+
+
+def get_deal_access(deal_id: str, db: Session, user_id) -> DealAccess:
+    access = resolve_deal_access(db, deal_id, user_id)
+    if access is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Deal not found")
-    member = db.scalar(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == deal.workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-    )
-    if not member:
+    if access.member is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Deal access denied")
-    return deal
+    return access
+
+
+def get_deal_with_access(deal_id: str, db: Session, user_id) -> Deal:
+    return get_deal_access(deal_id, db, user_id).deal
+
+
+def require_workspace_member(db: Session, workspace_id, user_id) -> Membership:
+    member = resolve_membership(db, workspace_id, user_id)
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace access denied")
+    return member
 
 
 def require_deal_advance(
@@ -7,6 +7,8 @@ api_router.include_router(auth.router)
 api_router.include_router(workspaces.router)
 api_router.include_router(deals.router)
 api_router.include_router(boe.router)
+api_router.include_router(boe.deal_router)
+api_router.include_router(boe.workspace_router)
 api_router.include_router(comps.router)
 api_router.include_router(full_underwriting.router)
 api_router.include_router(portfolio.router)
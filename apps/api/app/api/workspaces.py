@@ -10,20 +10,17 @@ from app.models.entities import AuditLog, BOERun, Deal, DealGateEvent, User, Wor
 from app.models.enums import MemberRole, WorkspaceEdition
 from app.schemas.boe import BOEDecisionSummaryOut
 from app.schemas.deal_workspace import DealWorkspaceSummaryOut
-from app.schemas.workspace import WorkspaceCreate, WorkspaceEditionUpdate, WorkspaceOut
+from app.schemas.workspace import WorkspaceBOEProfileUpdate, WorkspaceCreate, WorkspaceEditionUpdate, WorkspaceOut
+from app.services.access import Membership, invalidate_membership, resolve_membership
+from app.services.boe_profiles import latest_threshold_profile_row, save_threshold_profile, threshold_profile_for
 from app.services.gate_summary import build_gate_summary
 from app.services.workspace_capabilities import capabilities_for_edition
 
 router = APIRouter(prefix="/workspaces", tags=["workspaces"])
 
 
-def _workspace_membership(db: Session, workspace_id, user_id) -> WorkspaceMember | None:
-    return db.scalar(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-    )
+def _workspace_membership(db: Session, workspace_id, user_id) -> Membership | None:
+    return resolve_membership(db, workspace_id, user_id)
 
 
 def _workspace_out(workspace: Workspace, *, is_admin: bool) -> dict:
@@ -52,6 +49,7 @@ def create_workspace(
     member = WorkspaceMember(workspace_id=workspace.id, user_id=user.id, role=MemberRole.OWNER)
     db.add(member)
     db.commit()
+    invalidate_membership(user.id, workspace.id)
     db.refresh(workspace)
     return _workspace_out(workspace, is_admin=True)
 
@@ -90,6 +88,57 @@ def get_workspace_capabilities(workspace_id: str, db: Session = Depends(get_db),
     return capabilities_for_edition(workspace.edition)
 
 
+def _boe_profile_out(workspace: Workspace, row) -> dict:
+    profile = threshold_profile_for(workspace.id, workspace.edition, row)
+    return {
+        **profile.describe(),
+        "source": "workspace" if row else "edition",
+        "base_edition": (row.base_edition if row and row.base_edition else workspace.edition).value,
+    }
+
+
+@router.get("/{workspace_id}/boe-profile")
+def get_workspace_boe_profile(workspace_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    workspace = db.scalar(select(Workspace).where(Workspace.id == workspace_id))
+    if not workspace:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+    member = _workspace_membership(db, workspace.id, user.id)
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace access denied")
+    return _boe_profile_out(workspace, latest_threshold_profile_row(db, workspace.id))
+
+
+@router.put("/{workspace_id}/boe-profile")
+def update_workspace_boe_profile(
+    workspace_id: str,
+    payload: WorkspaceBOEProfileUpdate,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    workspace = db.scalar(select(Workspace).where(Workspace.id == workspace_id))
+    if not workspace:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+    member = _workspace_membership(db, workspace.id, user.id)
+    if not member:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace access denied")
+    if member.role != MemberRole.OWNER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only workspace admins can change BOE thresholds")
+
+    try:
+        row = save_threshold_profile(
+            db,
+            workspace,
+            user.id,
+            overrides=payload.overrides,
+            quorum_required=payload.quorum_required,
+            base_edition=payload.base_edition,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc))
+    db.commit()
+    return _boe_profile_out(workspace, row)
+
+
 @router.get("/{workspace_id}/deals/{deal_id}/summary", response_model=DealWorkspaceSummaryOut)
 def get_workspace_deal_summary(
     workspace_id: str,
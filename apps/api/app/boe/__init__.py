@@ -1,10 +1,39 @@
-from app.boe.engine import BOEDecision, BOEInput, BOEOutput, BOETestOutcome, calculate_boe, serialize_output
+from app.boe.cache import BOECache
+from app.boe.engine import (
+    BOE_RULES,
+    BOERule,
+    BOEBatchResult,
+    BOEDecision,
+    BOEInput,
+    BOEOutput,
+    BOETestOutcome,
+    boe_input_columns,
+    calculate_boe,
+    calculate_boe_batch,
+    serialize_output,
+    with_thresholds,
+)
+from app.boe.montecarlo import Distribution, MonteCarloResult, parse_distribution, simulate_boe
+from app.boe.profiles import ThresholdProfile, edition_profile
 
 __all__ = [
     "BOEInput",
     "BOEOutput",
     "BOETestOutcome",
     "BOEDecision",
+    "BOEBatchResult",
     "calculate_boe",
+    "calculate_boe_batch",
+    "boe_input_columns",
     "serialize_output",
+    "BOERule",
+    "BOE_RULES",
+    "with_thresholds",
+    "BOECache",
+    "Distribution",
+    "MonteCarloResult",
+    "parse_distribution",
+    "simulate_boe",
+    "ThresholdProfile",
+    "edition_profile",
 ]
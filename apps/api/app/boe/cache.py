@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Mapping
+
+from app.boe import engine
+from app.boe.engine import (
+    BOE_INPUT_FIELDS,
+    BOEConstraintMaxBids,
+    BOEDecision,
+    BOEInput,
+    BOEOutput,
+    BOETestOutcome,
+    GateStatus,
+    TestClass,
+    TestResult,
+    _f,
+    calculate_boe,
+)
+from app.boe.profiles import ThresholdProfile
+
+CANONICAL_SIGNIFICANT_DIGITS = 12
+DEFAULT_CACHE_SIZE = 4096
+KEY_PREFIX = "boe_cache"
+
+BOEResult = tuple[BOEOutput, list[BOETestOutcome], BOEDecision]
+
+
+def canonical_inputs(inputs: BOEInput | Mapping[str, Any]) -> dict[str, float | None]:
+    raw = asdict(inputs) if isinstance(inputs, BOEInput) else dict(inputs)
+    unknown = sorted(set(raw) - set(BOE_INPUT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown BOE inputs: {', '.join(unknown)}")
+    canonical: dict[str, float | None] = {}
+    for name in sorted(BOE_INPUT_FIELDS):
+        value = _f(raw.get(name))
+        canonical[name] = None if value is None or value != value else float(f"{value:.{CANONICAL_SIGNIFICANT_DIGITS}g}")
+    return canonical
+
+
+def engine_fingerprint() -> str:
+    # Read at call time so threshold changes (including test monkeypatches) roll the key space.
+    parts = {
+        "version": engine.ENGINE_VERSION,
+        "target_coc": engine.TARGET_COC,
+        "target_capex_multiple": engine.TARGET_CAPEX_MULTIPLE,
+        "quorum_required": engine.QUORUM_REQUIRED,
+        "passing_results": sorted(r.value for r in engine.PASSING_RESULTS),
+        "rules": [
+            [rule.key, rule.metric, rule.threshold, rule.threshold_metric, rule.threshold_offset, rule.comparator, rule.warn_threshold]
+            for rule in engine.BOE_RULES
+        ],
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def boe_cache_key(canonical: Mapping[str, float | None], profile: ThresholdProfile | None = None) -> str:
+    raw = json.dumps(
+        {"engine": engine_fingerprint(), "profile": profile.fingerprint if profile else None, "inputs": canonical},
+        sort_keys=True,
+    )
+    return f"{KEY_PREFIX}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+
+def dump_result(result: BOEResult) -> dict[str, Any]:
+    output, tests, decision = result
+    return {"output": asdict(output), "tests": [asdict(t) for t in tests], "decision": asdict(decision)}
+
+
+def load_result(payload: Mapping[str, Any]) -> BOEResult:
+    output = dict(payload["output"])
+    output["max_bid_by_constraint"] = BOEConstraintMaxBids(**output["max_bid_by_constraint"])
+    tests = [
+        BOETestOutcome(**{**t, "test_class": TestClass(t["test_class"]), "result": TestResult(t["result"])})
+        for t in payload["tests"]
+    ]
+    decision = {k: list(v) if isinstance(v, list) else v for k, v in payload["decision"].items()}
+    decision["status"] = GateStatus(decision["status"])
+    return BOEOutput(**output), tests, BOEDecision(**decision)
+
+
+@dataclass
+class BOECacheStats:
+    hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    redis_errors: int = 0
+
+
+class BOECache:
+    """Content-addressed memo for ``calculate_boe`` with an in-process LRU and optional Redis tier."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, redis: Any = None, ttl_seconds: int | None = None):
+        self.maxsize = maxsize
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.stats = BOECacheStats()
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = BOECacheStats()
+
+    def snapshot(self) -> dict[str, Any]:
+        stats = asdict(self.stats)
+        lookups = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        return {
+            **stats,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": (stats["hits"] + stats["redis_hits"]) / lookups if lookups else None,
+        }
+
+    def _remember(self, key: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _redis_get(self, key: str) -> dict[str, Any] | None:
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(key)
+        except Exception:
+            with self._lock:
+                self.stats.redis_errors += 1
+            return None
+        return json.loads(raw) if raw else None
+
+    def _redis_set(self, key: str, payload: dict[str, Any]) -> None:
+        if self.redis is None:
+            return
+        try:
+            raw = json.dumps(payload)
+            if self.ttl_seconds:
+                self.redis.setex(key, self.ttl_seconds, raw)
+            else:
+                self.redis.set(key, raw)
+        except Exception:
+            with self._lock:
+                self.stats.redis_errors += 1
+
+    def calculate(self, inputs: BOEInput | Mapping[str, Any], profile: ThresholdProfile | None = None) -> BOEResult:
+        canonical = canonical_inputs(inputs)
+        key = boe_cache_key(canonical, profile)
+
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+        if payload is not None:
+            return load_result(payload)
+
+        payload = self._redis_get(key)
+        if payload is not None:
+            with self._lock:
+                self.stats.redis_hits += 1
+            self._remember(key, payload)
+            return load_result(payload)
+
+        with self._lock:
+            self.stats.misses += 1
+        if profile is None:
+            result = calculate_boe(BOEInput(**canonical))
+        else:
+            result = calculate_boe(BOEInput(**canonical), profile.rules, profile.quorum_required)
+        payload = dump_result(result)
+        self._remember(key, payload)
+        self._redis_set(key, payload)
+        return result
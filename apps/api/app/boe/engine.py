@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields, replace
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+import numpy as np
 
 
 class TestClass(str, Enum):
@@ -101,11 +104,42 @@ class BOEOutput:
     binding_constraint: str | None
 
 
+# Bump when formulas change in a way the thresholds below do not capture; cached results key on it.
+ENGINE_VERSION = "1"
 TARGET_COC = 0.045
 TARGET_CAPEX_MULTIPLE = 2.0
 QUORUM_REQUIRED = 4
 PASSING_RESULTS = {TestResult.PASS, TestResult.WARN}
 
+BOE_INPUT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(BOEInput))
+BOE_OUTPUT_METRICS: tuple[str, ...] = (
+    "market_cap_rate",
+    "seller_noi_from_om",
+    "asking_cap_rate",
+    "analysis_cap_rate",
+    "y1_exit_cap_rate",
+    "y1_dscr",
+    "y1_capex_value_multiple",
+    "y1_expense_ratio",
+    "y1_cash_on_cash",
+    "y1_yield_on_cost_unlevered",
+    "residual_sale_at_exit_cap",
+    "profit_potential",
+    "max_price_at_yoc",
+    "max_price_at_capex_multiple",
+    "max_price_at_coc_threshold",
+    "boe_max_bid",
+    "delta_vs_asking",
+    "deposit_amount",
+)
+BINDING_CONSTRAINTS: tuple[str, ...] = ("YOC", "CapEx Multiple", "CoC")
+
+# Batch results carry small integer codes; a code is the index into these tuples.
+RESULT_CODES: tuple[TestResult, ...] = (TestResult.PASS, TestResult.FAIL, TestResult.WARN, TestResult.NA)
+STATUS_CODES: tuple[GateStatus, ...] = (GateStatus.BLOCKED, GateStatus.NEEDS_WORK, GateStatus.ADVANCE)
+_PASS, _FAIL, _WARN, _NA = range(len(RESULT_CODES))
+_BLOCKED, _NEEDS_WORK, _ADVANCE = range(len(STATUS_CODES))
+
 
 def _f(v: Any) -> float | None:
     if v is None:
@@ -116,12 +150,6 @@ def _f(v: Any) -> float | None:
         return None
 
 
-def _safe_div(n: float | None, d: float | None) -> float | None:
-    if n is None or d in (None, 0):
-        return None
-    return n / d
-
-
 def _fmt_pct(v: float | None) -> str:
     return "N/A" if v is None else f"{v:.2%}"
 
@@ -134,292 +162,438 @@ def _fmt_mult(v: float | None) -> str:
     return "N/A" if v is None else f"{v:.2f}x"
 
 
-def _counts_as_pass(result: TestResult) -> bool:
-    return result in PASSING_RESULTS
+@dataclass(frozen=True)
+class BOERule:
+    """One row of the BOE test table: ``metric`` compared against a fixed or metric-derived threshold.
 
+    ``threshold_metric`` (plus ``threshold_offset``) takes precedence over ``threshold``. A failing
+    value still at or beyond ``warn_threshold`` grades WARN. ``positive_only`` grades N/A when the
+    actual or threshold is not positive.
+    """
 
-def _evaluate_tests(metrics: BOEOutput, interest_rate: float | None) -> tuple[list[BOETestOutcome], BOEDecision]:
-    tests: list[BOETestOutcome] = []
+    key: str
+    name: str
+    test_class: TestClass
+    metric: str
+    format_actual: Callable[[float | None], str]
+    format_threshold: Callable[[BOERule, float | None, BOEOutput], str]
+    threshold: float | None = None
+    threshold_metric: str | None = None
+    threshold_offset: float = 0.0
+    comparator: str = ">="
+    warn_threshold: float | None = None
+    positive_only: bool = False
+
+
+BOE_RULES: tuple[BOERule, ...] = (
+    BOERule(
+        "yield_on_cost",
+        "Yield on Cost Test",
+        TestClass.HARD,
+        "y1_yield_on_cost_unlevered",
+        _fmt_pct,
+        lambda r, _t, out: f">= Exit Cap + {_fmt_pct(r.threshold_offset)} ({_fmt_pct(out.y1_exit_cap_rate)} + {_fmt_pct(r.threshold_offset)})",
+        threshold_metric="y1_exit_cap_rate",
+        threshold_offset=0.01,
+    ),
+    BOERule(
+        "capex_value_multiple",
+        "CapEx Value Multiple Test",
+        TestClass.HARD,
+        "y1_capex_value_multiple",
+        _fmt_mult,
+        lambda _r, t, _out: f">= {_fmt_mult(t)}",
+        threshold=TARGET_CAPEX_MULTIPLE,
+    ),
+    BOERule(
+        "positive_leverage",
+        "Positive Leverage Test",
+        TestClass.HARD,
+        "y1_yield_on_cost_unlevered",
+        _fmt_pct,
+        lambda _r, t, _out: f">= Interest Rate ({_fmt_pct(t)})",
+        threshold_metric="interest_rate",
+        positive_only=True,
+    ),
+    BOERule(
+        "cash_on_cash",
+        "Cash on Cash Test",
+        TestClass.SOFT,
+        "y1_cash_on_cash",
+        _fmt_pct,
+        lambda _r, t, _out: f">= {_fmt_pct(t)}",
+        threshold=TARGET_COC,
+    ),
+    BOERule(
+        "dscr",
+        "DSCR Test",
+        TestClass.SOFT,
+        "y1_dscr",
+        _fmt_num,
+        lambda r, t, _out: f"PASS>={_fmt_num(t)} | WARN>={_fmt_num(r.warn_threshold)} | FAIL<{_fmt_num(r.warn_threshold)}",
+        threshold=1.25,
+        warn_threshold=1.15,
+        positive_only=True,
+    ),
+    BOERule(
+        "expense_ratio",
+        "Expense Ratio Test",
+        TestClass.SOFT,
+        "y1_expense_ratio",
+        _fmt_pct,
+        lambda _r, t, _out: f">= {_fmt_pct(t)}",
+        threshold=0.28,
+    ),
+    BOERule(
+        "market_cap_rate",
+        "Market Cap Rate Test",
+        TestClass.SOFT,
+        "market_cap_rate",
+        _fmt_pct,
+        lambda _r, t, _out: f">= Asking Cap Rate ({_fmt_pct(t)})",
+        threshold_metric="asking_cap_rate",
+        positive_only=True,
+    ),
+)
+
+
+def with_thresholds(overrides: Mapping[str, Mapping[str, float | None]], rules: tuple[BOERule, ...] = BOE_RULES) -> tuple[BOERule, ...]:
+    """Return ``rules`` with per-key field overrides, e.g. ``{"dscr": {"threshold": 1.3}}``."""
+    unknown = sorted(set(overrides) - {rule.key for rule in rules})
+    if unknown:
+        raise ValueError(f"Unknown BOE tests: {', '.join(unknown)}")
+    return tuple(replace(rule, **overrides[rule.key]) if rule.key in overrides else rule for rule in rules)
 
-    yoc = metrics.y1_yield_on_cost_unlevered
-    exit_cap = metrics.y1_exit_cap_rate
-    if yoc is None or exit_cap is None:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if yoc >= exit_cap + 0.01 else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="yield_on_cost",
-            name="Yield on Cost Test",
-            test_class=TestClass.HARD,
-            threshold=(exit_cap + 0.01) if exit_cap is not None else None,
-            actual=yoc,
-            threshold_display=f">= Exit Cap + 1.00% ({_fmt_pct(exit_cap)} + 1.00%)",
-            actual_display=_fmt_pct(yoc),
-            result=result,
-        )
-    )
 
-    capex_multiple = metrics.y1_capex_value_multiple
-    if capex_multiple is None:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if capex_multiple >= TARGET_CAPEX_MULTIPLE else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="capex_value_multiple",
-            name="CapEx Value Multiple Test",
-            test_class=TestClass.HARD,
-            threshold=TARGET_CAPEX_MULTIPLE,
-            actual=capex_multiple,
-            threshold_display=">= 2.00x",
-            actual_display=_fmt_mult(capex_multiple),
-            result=result,
+@dataclass(frozen=True)
+class _CompiledRules:
+    rules: tuple[BOERule, ...]
+    keys: tuple[str, ...]
+    metrics: tuple[str, ...]
+    threshold_metrics: tuple[str | None, ...]
+    thresholds: np.ndarray
+    offsets: np.ndarray
+    warn: np.ndarray
+    at_most: np.ndarray
+    positive_only: np.ndarray
+    hard: np.ndarray
+    yoc_spread: float
+    capex_multiple: float
+    target_coc: float
+
+    def evaluate(self, metrics: Mapping[str, np.ndarray], shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        column = (len(self.rules),) + (1,) * len(shape)
+        actual = np.stack([metrics[m] for m in self.metrics])
+        threshold = np.stack(
+            [
+                np.full(shape, t) if m is None else metrics[m] + off if off else metrics[m]
+                for m, t, off in zip(self.threshold_metrics, self.thresholds, self.offsets)
+            ]
         )
+        positive = self.positive_only.reshape(column)
+        na = np.isnan(actual) | np.isnan(threshold) | (positive & ((actual <= 0) | (threshold <= 0)))
+        at_most = self.at_most.reshape(column)
+        passed = np.where(at_most, actual <= threshold, actual >= threshold)
+        warn = self.warn.reshape(column)
+        warned = ~np.isnan(warn) & np.where(at_most, actual <= warn, actual >= warn)
+        results = np.where(na, _NA, np.where(passed, _PASS, np.where(warned, _WARN, _FAIL))).astype(np.int8)
+        return threshold, actual, results
+
+
+def _fixed_threshold(rule: BOERule | None, default: float) -> float:
+    return default if rule is None or rule.threshold_metric is not None or rule.threshold is None else rule.threshold
+
+
+@lru_cache(maxsize=64)
+def compile_rules(rules: tuple[BOERule, ...] = BOE_RULES) -> _CompiledRules:
+    by_key = {rule.key: rule for rule in rules}
+    for rule in rules:
+        if rule.comparator not in {">=", "<="}:
+            raise ValueError(f"Unsupported comparator for {rule.key}: {rule.comparator}")
+        if rule.threshold is None and rule.threshold_metric is None:
+            raise ValueError(f"BOE test {rule.key} needs a threshold or threshold_metric")
+    return _CompiledRules(
+        rules=rules,
+        keys=tuple(rule.key for rule in rules),
+        metrics=tuple(rule.metric for rule in rules),
+        threshold_metrics=tuple(rule.threshold_metric for rule in rules),
+        thresholds=np.array([np.nan if rule.threshold is None else rule.threshold for rule in rules], dtype=np.float64),
+        offsets=np.array([rule.threshold_offset for rule in rules], dtype=np.float64),
+        warn=np.array([np.nan if rule.warn_threshold is None else rule.warn_threshold for rule in rules], dtype=np.float64),
+        at_most=np.array([rule.comparator == "<=" for rule in rules]),
+        positive_only=np.array([rule.positive_only for rule in rules]),
+        hard=np.array([rule.test_class == TestClass.HARD for rule in rules]),
+        # The max-bid candidates solve for the same targets the tests grade against.
+        yoc_spread=by_key["yield_on_cost"].threshold_offset if "yield_on_cost" in by_key else 0.01,
+        capex_multiple=_fixed_threshold(by_key.get("capex_value_multiple"), TARGET_CAPEX_MULTIPLE),
+        target_coc=_fixed_threshold(by_key.get("cash_on_cash"), TARGET_COC),
     )
 
-    if yoc is None or interest_rate is None or yoc <= 0 or interest_rate <= 0:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if yoc >= interest_rate else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="positive_leverage",
-            name="Positive Leverage Test",
-            test_class=TestClass.HARD,
-            threshold=interest_rate,
-            actual=yoc,
-            threshold_display=f">= Interest Rate ({_fmt_pct(interest_rate)})",
-            actual_display=_fmt_pct(yoc),
-            result=result,
-        )
-    )
 
-    coc = metrics.y1_cash_on_cash
-    if coc is None:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if coc >= TARGET_COC else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="cash_on_cash",
-            name="Cash on Cash Test",
-            test_class=TestClass.SOFT,
-            threshold=TARGET_COC,
-            actual=coc,
-            threshold_display=">= 4.50%",
-            actual_display=_fmt_pct(coc),
-            result=result,
-        )
-    )
+def _opt(v: Any) -> float | None:
+    v = float(v)
+    return None if v != v else v
 
-    dscr = metrics.y1_dscr
-    if dscr is None or dscr <= 0:
-        result = TestResult.NA
-    elif dscr >= 1.25:
-        result = TestResult.PASS
-    elif dscr >= 1.15:
-        result = TestResult.WARN
-    else:
-        result = TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="dscr",
-            name="DSCR Test",
-            test_class=TestClass.SOFT,
-            threshold=1.25,
-            actual=dscr,
-            threshold_display="PASS>=1.25 | WARN>=1.15 | FAIL<1.15",
-            actual_display=_fmt_num(dscr),
-            result=result,
-        )
-    )
 
-    expense_ratio = metrics.y1_expense_ratio
-    if expense_ratio is None:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if expense_ratio >= 0.28 else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="expense_ratio",
-            name="Expense Ratio Test",
-            test_class=TestClass.SOFT,
-            threshold=0.28,
-            actual=expense_ratio,
-            threshold_display=">= 28.00%",
-            actual_display=_fmt_pct(expense_ratio),
-            result=result,
+@dataclass(frozen=True)
+class BOEBatchResult:
+    outputs: dict[str, np.ndarray]
+    binding_index: np.ndarray
+    thresholds: dict[str, np.ndarray]
+    actuals: dict[str, np.ndarray]
+    results: dict[str, np.ndarray]
+    status: np.ndarray
+    hard_veto_ok: np.ndarray
+    pass_count: np.ndarray
+    advance: np.ndarray
+    rules: tuple[BOERule, ...] = BOE_RULES
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.status.shape
+
+    @property
+    def size(self) -> int:
+        return int(self.status.size)
+
+    @property
+    def total_tests(self) -> int:
+        return len(self.rules)
+
+    @property
+    def binding_constraint(self) -> np.ndarray:
+        labels = np.array((*BINDING_CONSTRAINTS, None), dtype=object)
+        return labels[self.binding_index]
+
+    def row(self, index: int) -> tuple[BOEOutput, list[BOETestOutcome], BOEDecision]:
+        metrics = {name: _opt(col.flat[index]) for name, col in self.outputs.items()}
+        binding = int(self.binding_index.flat[index])
+        output = BOEOutput(
+            **metrics,
+            max_bid_by_constraint=BOEConstraintMaxBids(
+                max_price_at_yoc=metrics["max_price_at_yoc"],
+                max_price_at_capex_multiple=metrics["max_price_at_capex_multiple"],
+                max_price_at_coc_threshold=metrics["max_price_at_coc_threshold"],
+            ),
+            binding_constraint=BINDING_CONSTRAINTS[binding] if binding >= 0 else None,
         )
-    )
 
-    market_cap = metrics.market_cap_rate
-    asking_cap = metrics.asking_cap_rate
-    if market_cap is None or asking_cap is None or market_cap <= 0 or asking_cap <= 0:
-        result = TestResult.NA
-    else:
-        result = TestResult.PASS if market_cap >= asking_cap else TestResult.FAIL
-    tests.append(
-        BOETestOutcome(
-            key="market_cap_rate",
-            name="Market Cap Rate Test",
-            test_class=TestClass.SOFT,
-            threshold=asking_cap,
-            actual=market_cap,
-            threshold_display=f">= Asking Cap Rate ({_fmt_pct(asking_cap)})",
-            actual_display=_fmt_pct(market_cap),
-            result=result,
+        tests: list[BOETestOutcome] = []
+        for rule in self.rules:
+            threshold = _opt(self.thresholds[rule.key].flat[index])
+            actual = _opt(self.actuals[rule.key].flat[index])
+            tests.append(
+                BOETestOutcome(
+                    key=rule.key,
+                    name=rule.name,
+                    test_class=rule.test_class,
+                    threshold=threshold,
+                    actual=actual,
+                    threshold_display=rule.format_threshold(rule, threshold, output),
+                    actual_display=rule.format_actual(actual),
+                    result=RESULT_CODES[int(self.results[rule.key].flat[index])],
+                )
+            )
+
+        by_result: dict[TestResult, list[str]] = {r: [] for r in RESULT_CODES}
+        failed_hard_tests: list[str] = []
+        failed_soft_tests: list[str] = []
+        for t in tests:
+            by_result[t.result].append(t.key)
+            if t.result == TestResult.FAIL:
+                (failed_hard_tests if t.test_class == TestClass.HARD else failed_soft_tests).append(t.key)
+
+        decision = BOEDecision(
+            status=STATUS_CODES[int(self.status.flat[index])],
+            hard_veto_ok=bool(self.hard_veto_ok.flat[index]),
+            pass_count=int(self.pass_count.flat[index]),
+            total_tests=self.total_tests,
+            failed_hard_tests=failed_hard_tests,
+            failed_soft_tests=failed_soft_tests,
+            warn_tests=by_result[TestResult.WARN],
+            pass_tests=by_result[TestResult.PASS],
+            na_tests=by_result[TestResult.NA],
+            advance=bool(self.advance.flat[index]),
         )
-    )
+        return output, tests, decision
+
+    def rows(self) -> Iterator[tuple[BOEOutput, list[BOETestOutcome], BOEDecision]]:
+        for index in range(self.size):
+            yield self.row(index)
+
+
+def _coerce_column(values: Any) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(np.float64)
+    flat = [_f(v) for v in arr.ravel().tolist()]
+    return np.array([np.nan if v is None else v for v in flat], dtype=np.float64).reshape(arr.shape)
+
+
+def boe_input_columns(inputs: Iterable[BOEInput | Mapping[str, Any]]) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {name: [] for name in BOE_INPUT_FIELDS}
+    for item in inputs:
+        record = item if isinstance(item, BOEInput) else BOEInput(**item)
+        for name in BOE_INPUT_FIELDS:
+            columns[name].append(getattr(record, name))
+    return columns
+
 
-    hard_veto_ok = all(t.result == TestResult.PASS for t in tests if t.test_class == TestClass.HARD)
-    pass_count = sum(1 for t in tests if _counts_as_pass(t.result))
-    total_tests = len(tests)
-    failed_hard_tests = [
-        t.key for t in tests
-        if t.test_class == TestClass.HARD and t.result == TestResult.FAIL
-    ]
-    failed_soft_tests = [
-        t.key for t in tests
-        if t.test_class == TestClass.SOFT and t.result == TestResult.FAIL
-    ]
-    warn_tests = [
-        t.key for t in tests
-        if t.result == TestResult.WARN
-    ]
-    pass_tests = [
-        t.key for t in tests
-        if t.result == TestResult.PASS
-    ]
-    na_tests = [
-        t.key for t in tests
-        if t.result == TestResult.NA
-    ]
-    quorum_met = pass_count >= QUORUM_REQUIRED
-
-    advance = hard_veto_ok and quorum_met
-    if not hard_veto_ok:
-        status = GateStatus.BLOCKED
-    elif advance:
-        status = GateStatus.ADVANCE
+def _input_columns(inputs: np.ndarray | Mapping[str, Any]) -> dict[str, np.ndarray]:
+    if isinstance(inputs, np.ndarray):
+        if inputs.dtype.names is None:
+            raise ValueError("BOE batch input arrays must be structured arrays with named fields")
+        raw = {name: inputs[name] for name in inputs.dtype.names}
     else:
-        status = GateStatus.NEEDS_WORK
+        raw = dict(inputs)
 
-    return tests, BOEDecision(
+    unknown = sorted(set(raw) - set(BOE_INPUT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown BOE input columns: {', '.join(unknown)}")
+
+    coerced = {name: _coerce_column(values) for name, values in raw.items()}
+    try:
+        shape = np.broadcast_shapes(*(col.shape for col in coerced.values()))
+    except ValueError as exc:
+        raise ValueError("BOE input columns must have matching lengths") from exc
+
+    missing = np.full(shape, np.nan)
+    columns: dict[str, np.ndarray] = {}
+    for name in BOE_INPUT_FIELDS:
+        col = coerced.get(name, missing)
+        columns[name] = col if col.shape == shape else np.broadcast_to(col, shape)
+    return columns
+
+
+def _or_zero(v: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(v), 0.0, v)
+
+
+def _coalesce(v: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(v), fallback, v)
+
+
+def _safe_div(n: np.ndarray, d: np.ndarray) -> np.ndarray:
+    return np.where(d == 0, np.nan, n / d)
+
+
+def calculate_boe_batch(
+    inputs: np.ndarray | Mapping[str, Any],
+    rules: tuple[BOERule, ...] = BOE_RULES,
+    quorum: int | None = None,
+) -> BOEBatchResult:
+    """Score many BOE cases in one vectorized pass.
+
+    ``inputs`` is a structured array or a mapping of ``BOEInput`` field name to a column of
+    values; columns broadcast against each other and omitted fields count as missing. Missing
+    and N/A values are NaN in the returned float columns. ``rules`` and ``quorum`` replace the
+    default test table and ``QUORUM_REQUIRED``.
+    """
+    compiled = compile_rules(rules)
+    cols = _input_columns(inputs)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        asking_price = cols["asking_price"]
+        deposit_pct = _or_zero(cols["deposit_pct"])
+        interest_rate = cols["interest_rate"]
+        ltc = _or_zero(cols["ltc"])
+        capex_budget = _or_zero(cols["capex_budget"])
+        soft_cost_pct = _or_zero(cols["soft_cost_pct"])
+        reserves = _or_zero(cols["reserves"])
+        seller_noi = cols["seller_noi_from_om"]
+        gross_income = cols["gross_income"]
+        operating_expenses = cols["operating_expenses"]
+
+        y1_noi = _coalesce(cols["y1_noi"], gross_income - operating_expenses)
+
+        total_project_cost = asking_price * (1 + soft_cost_pct) + capex_budget + reserves
+        debt_amount = total_project_cost * ltc
+        equity_required = total_project_cost - debt_amount
+        debt_service = debt_amount * interest_rate
+
+        market_cap_rate = _coalesce(cols["market_cap_rate"], _safe_div(y1_noi, asking_price))
+        asking_cap_rate = _safe_div(seller_noi, asking_price)
+        analysis_cap_rate = _safe_div(y1_noi, asking_price)
+        y1_exit_cap_rate = _coalesce(cols["y1_exit_cap_rate"], market_cap_rate)
+
+        y1_dscr = _safe_div(y1_noi, debt_service)
+        residual_sale = _safe_div(y1_noi, y1_exit_cap_rate)
+        y1_capex_value_multiple = np.where(capex_budget > 0, (residual_sale - asking_price) / capex_budget, np.nan)
+
+        y1_expense_ratio = _safe_div(operating_expenses, gross_income)
+        y1_cash_on_cash = _safe_div(y1_noi - debt_service, equity_required)
+        y1_yoc = _safe_div(y1_noi, total_project_cost)
+
+        max_price_at_yoc = _safe_div(y1_noi, y1_exit_cap_rate + compiled.yoc_spread)
+        max_price_at_capex_multiple = residual_sale - compiled.capex_multiple * capex_budget
+        coeff = _or_zero(interest_rate) * ltc + compiled.target_coc * (1 - ltc)
+        max_price_at_coc_threshold = np.where(
+            coeff > 0,
+            (y1_noi / coeff - capex_budget - reserves) / (1 + soft_cost_pct),
+            np.nan,
+        )
+
+        # Same tie-break as min() over the ordered candidates: the first minimal label wins.
+        candidates = np.stack([max_price_at_yoc, max_price_at_capex_multiple, max_price_at_coc_threshold])
+        valid = ~np.isnan(candidates)
+        any_valid = valid.any(axis=0)
+        binding_index = np.argmin(np.where(valid, candidates, np.inf), axis=0)
+        binding_index = np.where(
+            np.take_along_axis(valid, binding_index[np.newaxis], axis=0)[0], binding_index, np.argmax(valid, axis=0)
+        )
+        boe_max_bid = np.where(any_valid, np.take_along_axis(candidates, binding_index[np.newaxis], axis=0)[0], np.nan)
+        binding_index = np.where(any_valid, binding_index, -1).astype(np.int8)
+
+        outputs = {
+            "market_cap_rate": market_cap_rate,
+            "seller_noi_from_om": seller_noi,
+            "asking_cap_rate": asking_cap_rate,
+            "analysis_cap_rate": analysis_cap_rate,
+            "y1_exit_cap_rate": y1_exit_cap_rate,
+            "y1_dscr": y1_dscr,
+            "y1_capex_value_multiple": y1_capex_value_multiple,
+            "y1_expense_ratio": y1_expense_ratio,
+            "y1_cash_on_cash": y1_cash_on_cash,
+            "y1_yield_on_cost_unlevered": y1_yoc,
+            "residual_sale_at_exit_cap": residual_sale,
+            "profit_potential": residual_sale - boe_max_bid,
+            "max_price_at_yoc": max_price_at_yoc,
+            "max_price_at_capex_multiple": max_price_at_capex_multiple,
+            "max_price_at_coc_threshold": max_price_at_coc_threshold,
+            "boe_max_bid": boe_max_bid,
+            "delta_vs_asking": boe_max_bid - asking_price,
+            "deposit_amount": asking_price * deposit_pct,
+        }
+        outputs = {name: np.array(outputs[name], dtype=np.float64) for name in BOE_OUTPUT_METRICS}
+
+        threshold_matrix, actual_matrix, stacked = compiled.evaluate({**cols, **outputs}, interest_rate.shape)
+
+    passing = np.zeros(stacked.shape, dtype=bool)
+    for result in PASSING_RESULTS:
+        passing |= stacked == RESULT_CODES.index(result)
+    hard_veto_ok = (stacked[compiled.hard] == _PASS).all(axis=0)
+    pass_count = passing.sum(axis=0)
+    advance = hard_veto_ok & (pass_count >= (QUORUM_REQUIRED if quorum is None else quorum))
+    status = np.where(~hard_veto_ok, _BLOCKED, np.where(advance, _ADVANCE, _NEEDS_WORK)).astype(np.int8)
+
+    return BOEBatchResult(
+        outputs=outputs,
+        binding_index=binding_index,
+        thresholds=dict(zip(compiled.keys, threshold_matrix)),
+        actuals=dict(zip(compiled.keys, actual_matrix)),
+        results=dict(zip(compiled.keys, stacked)),
         status=status,
         hard_veto_ok=hard_veto_ok,
         pass_count=pass_count,
-        total_tests=total_tests,
-        failed_hard_tests=failed_hard_tests,
-        failed_soft_tests=failed_soft_tests,
-        warn_tests=warn_tests,
-        pass_tests=pass_tests,
-        na_tests=na_tests,
         advance=advance,
+        rules=rules,
     )
 
 
-def calculate_boe(inputs: BOEInput) -> tuple[BOEOutput, list[BOETestOutcome], BOEDecision]:
-    asking_price = _f(inputs.asking_price)
-    deposit_pct = _f(inputs.deposit_pct) or 0.0
-    interest_rate = _f(inputs.interest_rate)
-    ltc = _f(inputs.ltc) or 0.0
-    capex_budget = _f(inputs.capex_budget) or 0.0
-    soft_cost_pct = _f(inputs.soft_cost_pct) or 0.0
-    reserves = _f(inputs.reserves) or 0.0
-    seller_noi = _f(inputs.seller_noi_from_om)
-    gross_income = _f(inputs.gross_income)
-    operating_expenses = _f(inputs.operating_expenses)
-
-    y1_noi = _f(inputs.y1_noi)
-    if y1_noi is None and gross_income is not None and operating_expenses is not None:
-        y1_noi = gross_income - operating_expenses
-
-    total_project_cost = None
-    if asking_price is not None:
-        total_project_cost = asking_price * (1 + soft_cost_pct) + capex_budget + reserves
-
-    debt_amount = total_project_cost * ltc if total_project_cost is not None else None
-    equity_required = total_project_cost - debt_amount if total_project_cost is not None and debt_amount is not None else None
-    debt_service = debt_amount * interest_rate if debt_amount is not None and interest_rate is not None else None
-
-    market_cap_rate = _f(inputs.market_cap_rate)
-    if market_cap_rate is None:
-        market_cap_rate = _safe_div(y1_noi, asking_price)
-
-    asking_cap_rate = _safe_div(seller_noi, asking_price)
-    analysis_cap_rate = _safe_div(y1_noi, asking_price)
-
-    y1_exit_cap_rate = _f(inputs.y1_exit_cap_rate)
-    if y1_exit_cap_rate is None:
-        y1_exit_cap_rate = market_cap_rate
-
-    y1_dscr = _safe_div(y1_noi, debt_service)
-    residual_sale = _safe_div(y1_noi, y1_exit_cap_rate)
-
-    y1_capex_value_multiple = None
-    if residual_sale is not None and asking_price is not None and capex_budget > 0:
-        y1_capex_value_multiple = (residual_sale - asking_price) / capex_budget
-
-    y1_expense_ratio = _safe_div(operating_expenses, gross_income)
-    y1_cash_on_cash = _safe_div((y1_noi - debt_service) if y1_noi is not None and debt_service is not None else None, equity_required)
-    y1_yoc = _safe_div(y1_noi, total_project_cost)
-
-    max_price_at_yoc = _safe_div(y1_noi, (y1_exit_cap_rate + 0.01) if y1_exit_cap_rate is not None else None)
-
-    max_price_at_capex_multiple = None
-    if residual_sale is not None and capex_budget is not None:
-        max_price_at_capex_multiple = residual_sale - TARGET_CAPEX_MULTIPLE * capex_budget
-
-    max_price_at_coc_threshold = None
-    if y1_noi is not None:
-        coeff = (interest_rate or 0) * ltc + TARGET_COC * (1 - ltc)
-        if coeff > 0:
-            target_total_cost = y1_noi / coeff
-            max_price_at_coc_threshold = (target_total_cost - capex_budget - reserves) / (1 + soft_cost_pct)
-
-    candidates = {
-        "YOC": max_price_at_yoc,
-        "CapEx Multiple": max_price_at_capex_multiple,
-        "CoC": max_price_at_coc_threshold,
-    }
-    valid_candidates = {k: v for k, v in candidates.items() if v is not None}
-    boe_max_bid = min(valid_candidates.values()) if valid_candidates else None
-    binding_constraint = min(valid_candidates, key=valid_candidates.get) if valid_candidates else None
-
-    delta_vs_asking = boe_max_bid - asking_price if boe_max_bid is not None and asking_price is not None else None
-    deposit_amount = asking_price * deposit_pct if asking_price is not None else None
-    profit_potential = residual_sale - boe_max_bid if residual_sale is not None and boe_max_bid is not None else None
-
-    output = BOEOutput(
-        market_cap_rate=market_cap_rate,
-        seller_noi_from_om=seller_noi,
-        asking_cap_rate=asking_cap_rate,
-        analysis_cap_rate=analysis_cap_rate,
-        y1_exit_cap_rate=y1_exit_cap_rate,
-        y1_dscr=y1_dscr,
-        y1_capex_value_multiple=y1_capex_value_multiple,
-        y1_expense_ratio=y1_expense_ratio,
-        y1_cash_on_cash=y1_cash_on_cash,
-        y1_yield_on_cost_unlevered=y1_yoc,
-        residual_sale_at_exit_cap=residual_sale,
-        profit_potential=profit_potential,
-        max_price_at_yoc=max_price_at_yoc,
-        max_price_at_capex_multiple=max_price_at_capex_multiple,
-        max_price_at_coc_threshold=max_price_at_coc_threshold,
-        max_bid_by_constraint=BOEConstraintMaxBids(
-            max_price_at_yoc=max_price_at_yoc,
-            max_price_at_capex_multiple=max_price_at_capex_multiple,
-            max_price_at_coc_threshold=max_price_at_coc_threshold,
-        ),
-        boe_max_bid=boe_max_bid,
-        delta_vs_asking=delta_vs_asking,
-        deposit_amount=deposit_amount,
-        binding_constraint=binding_constraint,
-    )
-
-    tests, decision = _evaluate_tests(output, interest_rate=interest_rate)
-    return output, tests, decision
+def calculate_boe(
+    inputs: BOEInput, rules: tuple[BOERule, ...] = BOE_RULES, quorum: int | None = None
+) -> tuple[BOEOutput, list[BOETestOutcome], BOEDecision]:
+    batch = calculate_boe_batch({name: [getattr(inputs, name)] for name in BOE_INPUT_FIELDS}, rules, quorum)
+    return batch.row(0)
 
 
 def serialize_output(output: BOEOutput) -> dict[str, Any]:
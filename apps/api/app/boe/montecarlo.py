@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import numpy as np
+
+from app.boe.engine import (
+    BOE_INPUT_FIELDS,
+    BOE_RULES,
+    PASSING_RESULTS,
+    RESULT_CODES,
+    STATUS_CODES,
+    calculate_boe_batch,
+    with_thresholds,
+)
+from app.boe.profiles import ThresholdProfile
+
+DISTRIBUTION_PARAMS: dict[str, tuple[str, ...]] = {
+    "normal": ("mean", "sd"),
+    "uniform": ("low", "high"),
+    "triangular": ("low", "mode", "high"),
+    "lognormal": ("median", "sigma"),
+}
+DEFAULT_CHUNK_SIZE = 25_000
+MAX_BID_PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+
+@dataclass(frozen=True)
+class Distribution:
+    kind: str
+    params: tuple[float, ...]
+    low: float | None = None
+    high: float | None = None
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.kind == "normal":
+            values = rng.normal(self.params[0], self.params[1], size)
+        elif self.kind == "uniform":
+            values = rng.uniform(self.params[0], self.params[1], size)
+        elif self.kind == "triangular":
+            values = rng.triangular(*self.params, size)
+        else:
+            values = rng.lognormal(np.log(self.params[0]), self.params[1], size)
+        if self.low is not None or self.high is not None:
+            values = np.clip(values, self.low, self.high)
+        return values
+
+
+def parse_distribution(spec: Mapping[str, Any]) -> Distribution:
+    kind = spec.get("dist")
+    if kind not in DISTRIBUTION_PARAMS:
+        raise ValueError(f"Unsupported distribution: {kind}")
+    try:
+        params = tuple(float(spec[name]) for name in DISTRIBUTION_PARAMS[kind])
+    except KeyError as exc:
+        raise ValueError(f"Distribution {kind} requires {', '.join(DISTRIBUTION_PARAMS[kind])}") from exc
+    if kind in {"normal", "lognormal"} and params[1] < 0:
+        raise ValueError(f"Distribution {kind} spread must be non-negative")
+    if kind == "uniform" and params[0] > params[1]:
+        raise ValueError("Distribution uniform requires low <= high")
+    if kind == "triangular" and not params[0] <= params[1] <= params[2]:
+        raise ValueError("Distribution triangular requires low <= mode <= high")
+    if kind == "lognormal" and params[0] <= 0:
+        raise ValueError("Distribution lognormal requires a positive median")
+    low = spec.get("min")
+    high = spec.get("max")
+    return Distribution(
+        kind=kind,
+        params=params,
+        low=None if low is None else float(low),
+        high=None if high is None else float(high),
+    )
+
+
+@dataclass(frozen=True)
+class _ChunkResult:
+    test_keys: tuple[str, ...]
+    max_bid: np.ndarray
+    status_counts: np.ndarray
+    result_counts: np.ndarray
+
+
+def _simulate_chunk(
+    base_inputs: Mapping[str, Any],
+    distributions: Mapping[str, Distribution],
+    size: int,
+    seed: np.random.SeedSequence,
+    overrides: Mapping[str, Mapping[str, float | None]],
+    quorum: int | None,
+) -> _ChunkResult:
+    rng = np.random.default_rng(seed)
+    # Sample in sorted field order so a given seed draws the same values however the request was written.
+    columns = dict(base_inputs)
+    for field in sorted(distributions):
+        columns[field] = distributions[field].sample(rng, size)
+    batch = calculate_boe_batch(columns, with_thresholds(overrides) if overrides else BOE_RULES, quorum)
+    return _ChunkResult(
+        test_keys=tuple(spec.key for spec in batch.rules),
+        max_bid=np.broadcast_to(batch.outputs["boe_max_bid"], batch.shape).ravel(),
+        status_counts=np.bincount(batch.status.ravel(), minlength=len(STATUS_CODES)),
+        result_counts=np.stack(
+            [np.bincount(batch.results[spec.key].ravel(), minlength=len(RESULT_CODES)) for spec in batch.rules]
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    simulations: int
+    seed: int
+    # Keys of the rules the draws were graded with, one per row of ``result_counts``.
+    test_keys: tuple[str, ...]
+    max_bid: np.ndarray
+    status_counts: np.ndarray
+    result_counts: np.ndarray
+
+    def summary(self) -> dict[str, Any]:
+        valid = self.max_bid[~np.isnan(self.max_bid)]
+        max_bid: dict[str, Any] = {"valid": int(valid.size)}
+        if valid.size:
+            max_bid.update(
+                mean=float(valid.mean()),
+                std=float(valid.std()),
+                min=float(valid.min()),
+                max=float(valid.max()),
+                percentiles={f"p{p}": float(v) for p, v in zip(MAX_BID_PERCENTILES, np.percentile(valid, MAX_BID_PERCENTILES))},
+            )
+        passing = [RESULT_CODES.index(result) for result in PASSING_RESULTS]
+        return {
+            "simulations": self.simulations,
+            "seed": self.seed,
+            "boe_max_bid": max_bid,
+            "status_probability": {
+                status.value: float(count) / self.simulations for status, count in zip(STATUS_CODES, self.status_counts)
+            },
+            "tests": {
+                key: {
+                    "pass_rate": float(counts[passing].sum()) / self.simulations,
+                    "results": {result.value: float(count) / self.simulations for result, count in zip(RESULT_CODES, counts)},
+                }
+                for key, counts in zip(self.test_keys, self.result_counts)
+            },
+        }
+
+
+def simulate_boe(
+    base_inputs: Mapping[str, Any],
+    distributions: Mapping[str, Distribution],
+    simulations: int,
+    *,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    profile: ThresholdProfile | None = None,
+) -> MonteCarloResult:
+    """Run ``simulations`` BOE draws with the given inputs replaced by sampled columns.
+
+    Work is split into fixed-size chunks, each seeded from a child of one ``SeedSequence``, so the
+    result for a given ``seed`` does not depend on ``workers``.
+    """
+    if simulations < 1:
+        raise ValueError("simulations must be positive")
+    if not distributions:
+        raise ValueError("At least one input distribution is required")
+    unknown = sorted((set(base_inputs) | set(distributions)) - set(BOE_INPUT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown BOE inputs: {', '.join(unknown)}")
+
+    root = np.random.SeedSequence(seed)
+    sizes = [min(chunk_size, simulations - start) for start in range(0, simulations, chunk_size)]
+    seeds = root.spawn(len(sizes))
+    # Profiles carry compiled lambdas, so workers get the plain overrides and rebuild the rules.
+    overrides = dict(profile.overrides) if profile else {}
+    quorum = profile.quorum if profile else None
+    n = len(sizes)
+    args = ([base_inputs] * n, [distributions] * n, sizes, seeds, [overrides] * n, [quorum] * n)
+
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as pool:
+            chunks = list(pool.map(_simulate_chunk, *args))
+    else:
+        chunks = list(map(_simulate_chunk, *args))
+
+    return MonteCarloResult(
+        simulations=simulations,
+        seed=int(root.entropy),
+        test_keys=chunks[0].test_keys,
+        max_bid=np.concatenate([chunk.max_bid for chunk in chunks]),
+        status_counts=sum(chunk.status_counts for chunk in chunks),
+        result_counts=sum(chunk.result_counts for chunk in chunks),
+    )
@@ -4,7 +4,17 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.boe.engine import BOEInput, calculate_boe, serialize_output
+from app.boe.cache import BOECache
+from app.boe.engine import (
+    BOEDecision,
+    BOEInput,
+    BOEOutput,
+    BOETestOutcome,
+    boe_input_columns,
+    calculate_boe,
+    calculate_boe_batch,
+    serialize_output,
+)
 
 
 @dataclass(frozen=True)
@@ -40,9 +50,28 @@ def load_fixture(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def compare_case(case: dict, tolerance: Tolerance = Tolerance()) -> list[str]:
+def compare_case(case: dict, tolerance: Tolerance = Tolerance(), cache: BOECache | None = None) -> list[str]:
+    inputs = BOEInput(**case["inputs"])
+    return compare_result(case, cache.calculate(inputs) if cache is not None else calculate_boe(inputs), tolerance)
+
+
+def compare_cases_batch(cases: list[dict], tolerance: Tolerance = Tolerance()) -> list[str]:
+    if not cases:
+        return []
+    batch = calculate_boe_batch(boe_input_columns(case["inputs"] for case in cases))
+    errs: list[str] = []
+    for case, result in zip(cases, batch.rows()):
+        errs.extend(f"[batch] {err}" for err in compare_result(case, result, tolerance))
+    return errs
+
+
+def compare_result(
+    case: dict,
+    result: tuple[BOEOutput, list[BOETestOutcome], BOEDecision],
+    tolerance: Tolerance = Tolerance(),
+) -> list[str]:
     errs: list[str] = []
-    output, tests, decision = calculate_boe(BOEInput(**case["inputs"]))
+    output, tests, decision = result
     actual_outputs = serialize_output(output)
     expected = case["expected"]
 
@@ -94,11 +123,14 @@ def compare_case(case: dict, tolerance: Tolerance = Tolerance()) -> list[str]:
 
 def run_fixture_parity(fixtures_dir: Path) -> list[str]:
     errs: list[str] = []
+    cases = []
     for path in sorted(fixtures_dir.glob("*.json")):
         case = load_fixture(path)
         if "expected" not in case:
             continue
+        cases.append(case)
         errs.extend(compare_case(case))
+    errs.extend(compare_cases_batch(cases))
     return errs
 
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Mapping
+
+from app.boe import engine
+from app.boe.engine import BOE_RULES, BOERule, with_thresholds
+
+PROFILE_FIELDS = ("threshold", "warn_threshold", "threshold_offset")
+EDITION_PROFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ThresholdProfile:
+    """A named set of BOE threshold overrides applied on top of ``BOE_RULES``."""
+
+    version: str
+    overrides: Mapping[str, Mapping[str, float | None]] = field(default_factory=dict)
+    quorum: int | None = None
+
+    @cached_property
+    def rules(self) -> tuple[BOERule, ...]:
+        return with_thresholds(self.overrides)
+
+    @property
+    def quorum_required(self) -> int:
+        return engine.QUORUM_REQUIRED if self.quorum is None else self.quorum
+
+    @cached_property
+    def fingerprint(self) -> str:
+        raw = json.dumps({"overrides": self.overrides, "quorum": self.quorum}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "quorum_required": self.quorum_required,
+            "tests": [
+                {
+                    "key": rule.key,
+                    "name": rule.name,
+                    "test_class": rule.test_class.value,
+                    "threshold": rule.threshold,
+                    "threshold_metric": rule.threshold_metric,
+                    "threshold_offset": rule.threshold_offset,
+                    "warn_threshold": rule.warn_threshold,
+                }
+                for rule in self.rules
+            ],
+        }
+
+
+# Starting criteria per edition. Both ship with the engine's own thresholds so existing
+# workspaces grade exactly as before; stricter criteria are workspace overrides set by owners.
+EDITION_OVERRIDES: dict[str, dict[str, Any]] = {
+    "SYNDICATOR": {"overrides": {}, "quorum": None},
+    "FUND": {"overrides": {}, "quorum": None},
+}
+
+
+def edition_profile(edition: str) -> ThresholdProfile:
+    spec = EDITION_OVERRIDES[edition]
+    return ThresholdProfile(
+        version=f"{edition}.v{EDITION_PROFILE_VERSION}",
+        overrides=spec["overrides"],
+        quorum=spec["quorum"],
+    )
+
+
+def merge_overrides(
+    base: Mapping[str, Mapping[str, float | None]], extra: Mapping[str, Mapping[str, float | None]]
+) -> dict[str, dict[str, float | None]]:
+    merged = {key: dict(values) for key, values in base.items()}
+    for key, values in extra.items():
+        merged.setdefault(key, {}).update(values)
+    return merged
+
+
+def validate_overrides(overrides: Mapping[str, Any], quorum: int | None) -> dict[str, dict[str, float | None]]:
+    rules = {rule.key: rule for rule in BOE_RULES}
+    cleaned: dict[str, dict[str, float | None]] = {}
+    for key, values in overrides.items():
+        if key not in rules:
+            raise ValueError(f"Unknown BOE test: {key}")
+        if not isinstance(values, Mapping):
+            raise ValueError(f"Overrides for {key} must be an object")
+        unknown = sorted(set(values) - set(PROFILE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unsupported fields for {key}: {', '.join(unknown)}")
+        if "threshold" in values and rules[key].threshold_metric is not None:
+            raise ValueError(f"{key} is graded against {rules[key].threshold_metric}; it has no fixed threshold")
+        if values.get("threshold", 0.0) is None or values.get("threshold_offset", 0.0) is None:
+            raise ValueError(f"{key} threshold and threshold_offset cannot be null")
+        try:
+            cleaned[key] = {name: None if value is None else float(value) for name, value in values.items()}
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Overrides for {key} must be numeric") from exc
+    if quorum is not None and not 1 <= quorum <= len(BOE_RULES):
+        raise ValueError(f"quorum_required must be between 1 and {len(BOE_RULES)}")
+    return cleaned
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Every hashing worker is busy and the wait queue is full."""
+
+
+@dataclass
+class PasswordHashStats:
+    completed: int = 0
+    rejected: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+    hash_seconds_total: float = 0.0
+    hash_seconds_max: float = 0.0
+
+
+class PasswordHasher:
+    """Runs a passlib context on its own small thread pool.
+
+    Hashing cost is capped at ``workers`` cores; at most ``queue_depth`` more callers
+    may wait for a worker, and anyone beyond that gets ``PasswordHasherBusy`` straight away
+    rather than tying up a request thread behind a login burst.
+    """
+
+    def __init__(self, context: Any, workers: int, queue_depth: int):
+        self.context = context
+        self.workers = max(1, workers)
+        self.queue_depth = max(0, queue_depth)
+        self.stats = PasswordHashStats()
+        self._in_flight = 0
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_depth)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+
+    def hash(self, password: str) -> str:
+        return self.run(self.context.hash, password)
+
+    def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        return self.run(self.context.verify_and_update, password, hashed)
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.stats.rejected += 1
+            raise PasswordHasherBusy("Password hashing queue is full")
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return self._executor.submit(self._timed, time.perf_counter(), fn, args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def _timed(self, enqueued_at: float, fn: Callable[..., Any], args: tuple) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            waited, took = started - enqueued_at, time.perf_counter() - started
+            with self._lock:
+                self.stats.completed += 1
+                self.stats.queue_wait_seconds_total += waited
+                self.stats.queue_wait_seconds_max = max(self.stats.queue_wait_seconds_max, waited)
+                self.stats.hash_seconds_total += took
+                self.stats.hash_seconds_max = max(self.stats.hash_seconds_max, took)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+            in_flight = self._in_flight
+        completed = stats["completed"]
+        return {
+            **stats,
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "in_flight": in_flight,
+            "queue_wait_seconds_avg": stats["queue_wait_seconds_total"] / completed if completed else None,
+            "hash_seconds_avg": stats["hash_seconds_total"] / completed if completed else None,
+        }
+
+
+class AttemptLimiter:
+    """Sliding-window attempt counter per key; process-local, so each API worker enforces its own window."""
+
+    _SWEEP_EVERY = 1024
+
+    def __init__(self, attempts: int, window_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.attempts = attempts
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._hits: dict[str, deque[float]] = {}
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def hit(self, key: str) -> float | None:
+        """Record an attempt; returns seconds until the next one is allowed when over the limit."""
+        if self.attempts <= 0:
+            return None
+        now = self._clock()
+        with self._lock:
+            self._calls += 1
+            if self._calls % self._SWEEP_EVERY == 0:
+                self._sweep(now)
+            hits = self._hits.setdefault(key, deque())
+            while hits and hits[0] <= now - self.window_seconds:
+                hits.popleft()
+            if len(hits) >= self.attempts:
+                return hits[0] + self.window_seconds - now
+            hits.append(now)
+            return None
+
+    def reset(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._hits.clear()
+            else:
+                self._hits.pop(key, None)
+
+    def _sweep(self, now: float) -> None:
+        for key in [key for key, hits in self._hits.items() if not hits or hits[-1] <= now - self.window_seconds]:
+            del self._hits[key]
@@ -4,16 +4,40 @@ from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.passwords import AttemptLimiter, PasswordHasher
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def password_context(rounds: int) -> CryptContext:
+    # Pinning min and max to the configured cost makes verify_and_update flag hashes made at any other cost.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = password_context(settings.password_bcrypt_rounds)
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=settings.password_hash_workers,
+    queue_depth=settings.password_hash_queue_depth,
+)
+auth_attempts = AttemptLimiter(settings.auth_rate_limit_attempts, settings.auth_rate_limit_window_seconds)
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    return password_hasher.verify_and_update(password, hashed)[0]
+
+
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """``(valid, new_hash)``; ``new_hash`` is set when ``hashed`` was made at a different cost."""
+    return password_hasher.verify_and_update(password, hashed)
 
 
 def create_access_token(subject: str) -> str:
@@ -0,0 +1,115 @@
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+class InvalidTokenError(ValueError):
+    pass
+
+
+class VerifiedTokenCache:
+    """LRU of ``sha256(token) -> (exp, sub)`` for tokens whose signature already checked out.
+
+    Entries are only served until the token's own ``exp``, so a hit never extends a token's life.
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> str | None:
+        key = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, token: str, sub: str, exp: float) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[hashlib.sha256(token.encode()).digest()] = (exp, sub)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _jose_claims(token: str) -> dict[str, Any]:
+    try:
+        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    except JWTError as exc:
+        raise InvalidTokenError(str(exc)) from exc
+
+
+def _hmac_claims(token: str) -> dict[str, Any]:
+    """Compact-JWS check for the HS* algorithms we issue: signature, ``alg``, ``exp`` and ``nbf``."""
+    digest = _HMAC_DIGESTS.get(settings.jwt_algorithm)
+    if digest is None:
+        raise InvalidTokenError(f"HMAC verifier does not support {settings.jwt_algorithm}")
+    signing_input, _, signature = token.rpartition(".")
+    header_segment, _, payload_segment = signing_input.partition(".")
+    try:
+        header = json.loads(_b64decode(header_segment))
+        claims = json.loads(_b64decode(payload_segment))
+        signature_bytes = _b64decode(signature)
+    except ValueError as exc:
+        raise InvalidTokenError("Malformed token") from exc
+    if not isinstance(header, dict) or not isinstance(claims, dict) or header.get("alg") != settings.jwt_algorithm:
+        raise InvalidTokenError("Malformed token")
+    expected = hmac.new(settings.jwt_secret_key.encode(), signing_input.encode(), digest).digest()
+    if not hmac.compare_digest(expected, signature_bytes):
+        raise InvalidTokenError("Signature verification failed")
+    now = time.time()
+    exp, nbf = claims.get("exp"), claims.get("nbf")
+    if not isinstance(exp, (int, float)) or exp <= now:
+        raise InvalidTokenError("Token expired")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        raise InvalidTokenError("Token not yet valid")
+    return claims
+
+
+_VERIFIERS = {"jose": _jose_claims, "hmac": _hmac_claims}
+
+token_cache = VerifiedTokenCache(settings.jwt_cache_size)
+
+
+def decode_access_token(token: str) -> str:
+    """The token's ``sub``, from the verified-token cache or the configured ``JWT_VERIFIER``."""
+    sub = token_cache.get(token)
+    if sub is not None:
+        return sub
+    claims = _VERIFIERS[settings.jwt_verifier](token)
+    sub = claims.get("sub")
+    if not isinstance(sub, str):
+        raise InvalidTokenError("Token has no subject")
+    if isinstance(claims.get("exp"), (int, float)):
+        token_cache.put(token, sub, claims["exp"])
+    return sub
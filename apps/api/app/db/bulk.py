@@ -0,0 +1,92 @@
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from sqlalchemy import JSON, Table, insert
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class BulkWriteStats:
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float | None:
+        return round(self.rows / self.seconds) if self.seconds else None
+
+
+class BulkWriter:
+    """Appends plain row dicts to one table without building ORM objects.
+
+    On PostgreSQL through psycopg 3 rows are streamed with ``COPY ... FROM
+    STDIN``; anywhere else they go out as multi-row ``INSERT ... VALUES``
+    statements of ``batch_size`` rows. Either way the rows join the
+    session's current transaction. Python-side column defaults (ids,
+    timestamps) are filled in here because COPY never sees them.
+    """
+
+    def __init__(self, db: Session, model: Any, batch_size: int = 1000):
+        self.db = db
+        self.table: Table = model.__table__
+        self.batch_size = batch_size
+        self.stats = BulkWriteStats()
+        dialect = db.get_bind().dialect
+        self.method = "copy" if dialect.name == "postgresql" and dialect.driver == "psycopg" else "insert"
+        self._columns = list(self.table.columns)
+        self._processors = [column.type.bind_processor(dialect) for column in self._columns]
+        self._json = [isinstance(column.type, JSON) for column in self._columns]
+
+    def _with_defaults(self, row: dict) -> dict:
+        missing = [c for c in self._columns if c.key not in row and c.default is not None]
+        if not missing:
+            return row
+        row = dict(row)
+        for column in missing:
+            default = column.default
+            row[column.key] = default.arg(None) if default.is_callable else default.arg
+        return row
+
+    def _copy_record(self, row: dict) -> tuple:
+        record = []
+        for column, process, is_json in zip(self._columns, self._processors, self._json):
+            value = row.get(column.key)
+            if value is not None and is_json:
+                value = json.dumps(value)
+            elif value is not None and process is not None:
+                value = process(value)
+            record.append(value)
+        return tuple(record)
+
+    def _copy(self, rows: list[dict]) -> None:
+        preparer = self.db.get_bind().dialect.identifier_preparer
+        names = ", ".join(preparer.quote(column.name) for column in self._columns)
+        # COPY goes straight to the driver, so anything the rows reference (the run itself) must be flushed first.
+        self.db.flush()
+        raw = self.db.connection().connection.dbapi_connection
+        with raw.cursor() as cursor:
+            with cursor.copy(f"COPY {preparer.format_table(self.table)} ({names}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(self._copy_record(row))
+
+    def write(self, rows: Iterable[dict]) -> int:
+        started = time.perf_counter()
+        batch = [self._with_defaults(row) for row in rows]
+        if batch:
+            if self.method == "copy":
+                self._copy(batch)
+            else:
+                for start in range(0, len(batch), self.batch_size):
+                    self.db.execute(insert(self.table).values(batch[start : start + self.batch_size]))
+        self.stats.rows += len(batch)
+        self.stats.seconds += time.perf_counter() - started
+        return len(batch)
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "rows": self.stats.rows,
+            "seconds": round(self.stats.seconds, 4),
+            "rows_per_second": self.stats.rows_per_second,
+        }
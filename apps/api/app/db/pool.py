@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+
+
+class _TimedCheckout:
+    """Records how long ``connect()`` waited for a connection and how often it gave up."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._stats_lock = threading.Lock()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.stats.timeouts += 1
+            logger.warning("Connection pool exhausted: %s", pool_snapshot(self))
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.stats.checkouts += 1
+                self.stats.checkout_wait_seconds_total += waited
+                self.stats.checkout_wait_seconds_max = max(self.stats.checkout_wait_seconds_max, waited)
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_snapshot(target: Engine | QueuePool) -> dict[str, Any]:
+    pool = target.pool if isinstance(target, Engine) else target
+    stats = getattr(pool, "stats", None)
+    snapshot = {
+        "size": pool.size(),
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool starts this at -size; only positive values are connections beyond the pool size.
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": pool._max_overflow,
+    }
+    if stats is not None:
+        snapshot.update(asdict(stats))
+        checkouts = stats.checkouts
+        snapshot["checkout_wait_seconds_avg"] = stats.checkout_wait_seconds_total / checkouts if checkouts else None
+    return snapshot
@@ -0,0 +1,205 @@
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.entities import Deal
+
+logger = logging.getLogger(__name__)
+
+# Zero when the replica has replayed everything it received; otherwise the age of the last replayed transaction.
+# On a primary both LSN functions are NULL, so a misconfigured "replica" reports no lag rather than failing.
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class RecentWrites:
+    """``(user_id, deal_id)`` pairs written within the last ``window_seconds``.
+
+    Kept in-process, plus in Redis when one is given so every API process sees
+    writes taken by the others. Redis errors count as "recent", which keeps the
+    request on the primary.
+    """
+
+    _SWEEP_AT = 10_000
+
+    def __init__(self, window_seconds: float, redis: Any = None, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self.redis = redis
+        self._clock = clock
+        self._until: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _redis_key(user_id, deal_id) -> str:
+        return f"replica_sticky:{user_id}:{deal_id}"
+
+    def record(self, user_id, deal_ids: Iterable) -> None:
+        if self.window_seconds <= 0:
+            return
+        keys = [(str(user_id), str(deal_id)) for deal_id in deal_ids]
+        now = self._clock()
+        with self._lock:
+            if len(self._until) >= self._SWEEP_AT:
+                for key in [key for key, until in self._until.items() if until <= now]:
+                    del self._until[key]
+            for key in keys:
+                self._until[key] = now + self.window_seconds
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                for user, deal in keys:
+                    pipe.set(self._redis_key(user, deal), 1, ex=max(1, int(self.window_seconds)))
+                pipe.execute()
+            except Exception:  # pragma: no cover - the local entry still covers this process
+                logger.warning("Could not share recent deal writes through Redis", exc_info=True)
+
+    def is_recent(self, user_id, deal_id) -> bool:
+        if self.window_seconds <= 0:
+            return False
+        key = (str(user_id), str(deal_id))
+        with self._lock:
+            until = self._until.get(key)
+        if until is not None and until > self._clock():
+            return True
+        if self.redis is None:
+            return False
+        try:
+            return bool(self.redis.exists(self._redis_key(*key)))
+        except Exception:
+            return True
+
+
+@dataclass
+class ReplicaStatus:
+    lag_seconds: float | None = None
+    healthy: bool = False
+    checked_at: float | None = None
+    check_errors: int = 0
+
+
+class ReplicaMonitor:
+    """Samples replica lag at most once per ``check_interval_seconds`` and marks the replica unusable past ``max_lag_seconds``."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.status = ReplicaStatus()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def due(self) -> bool:
+        checked_at = self.status.checked_at
+        return checked_at is None or self._clock() - checked_at >= self.check_interval_seconds
+
+    def refresh(self) -> None:
+        # One caller samples; the rest keep routing on the previous reading instead of queueing behind it.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if not self.due():
+                return
+            try:
+                with self.engine.connect() as conn:
+                    lag = float(conn.execute(REPLICA_LAG_SQL).scalar() or 0.0)
+            except Exception:
+                logger.warning("Replica lag check failed; reading from the primary", exc_info=True)
+                self.status = ReplicaStatus(healthy=False, checked_at=self._clock(), check_errors=self.status.check_errors + 1)
+                return
+            self.status = ReplicaStatus(
+                lag_seconds=lag,
+                healthy=lag <= self.max_lag_seconds,
+                checked_at=self._clock(),
+                check_errors=self.status.check_errors,
+            )
+        finally:
+            self._lock.release()
+
+    def usable(self) -> bool:
+        if self.due():
+            self.refresh()
+        return self.status.healthy
+
+
+@dataclass
+class RoutingStats:
+    replica: int = 0
+    primary_recent_write: int = 0
+    primary_replica_lagging: int = 0
+
+
+class ReadRouter:
+    """Decides whether a read-only request may use the replica."""
+
+    def __init__(self, monitor: ReplicaMonitor | None, recent_writes: RecentWrites):
+        self.monitor = monitor
+        self.recent_writes = recent_writes
+        self.stats = RoutingStats()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.monitor is not None
+
+    def use_replica(self, user_id, deal_id) -> bool:
+        if self.monitor is None:
+            return False
+        if user_id is not None and deal_id is not None and self.recent_writes.is_recent(user_id, deal_id):
+            outcome = "primary_recent_write"
+        elif not self.monitor.usable():
+            outcome = "primary_replica_lagging"
+        else:
+            outcome = "replica"
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+        return outcome == "replica"
+
+    def snapshot(self) -> dict[str, Any]:
+        if self.monitor is None:
+            return {"enabled": False}
+        status = self.monitor.status
+        return {
+            "enabled": True,
+            "lag_seconds": status.lag_seconds,
+            "healthy": status.healthy,
+            "max_lag_seconds": self.monitor.max_lag_seconds,
+            "check_errors": status.check_errors,
+            "routed": asdict(self.stats),
+        }
+
+
+def collect_deal_writes(session: Session, _flush_context) -> None:
+    """``after_flush`` hook: note which deals this unit of work touched."""
+    deal_ids = session.info.setdefault("written_deal_ids", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        deal_id = obj.id if isinstance(obj, Deal) else getattr(obj, "deal_id", None)
+        if deal_id is not None:
+            deal_ids.add(deal_id)
+
+
+def forget_deal_writes(session: Session, *_args) -> None:
+    session.info.pop("written_deal_ids", None)
+
+
+def deal_writes_committed(recent_writes: RecentWrites) -> Callable[[Session], None]:
+    def _after_commit(session: Session) -> None:
+        deal_ids = session.info.pop("written_deal_ids", None)
+        user_id = session.info.get("user_id")
+        if deal_ids and user_id is not None:
+            recent_writes.record(user_id, deal_ids)
+
+    return _after_commit
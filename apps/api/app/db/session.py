@@ -1,12 +1,130 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from app.db.replica import (
+    ReadRouter,
+    RecentWrites,
+    ReplicaMonitor,
+    collect_deal_writes,
+    deal_writes_committed,
+    forget_deal_writes,
+)
+from app.workers.queue import get_redis
+
+
+def engine_options(url: str, *, pool_size: int, max_overflow: int, statement_timeout_ms: int) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    parsed = make_url(url)
+    if statement_timeout_ms > 0 and parsed.get_backend_name() == "postgresql":
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout_ms}"}
+    return options
 
 
-engine = create_engine(settings.database_url, future=True)
+engine = create_engine(
+    settings.database_url,
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    **engine_options(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+    ),
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
+# RQ jobs run one at a time per worker and may legitimately run long, so they get a small pool of their own.
+worker_engine = create_engine(
+    settings.database_url,
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    **engine_options(
+        settings.database_url,
+        pool_size=settings.worker_db_pool_size,
+        max_overflow=settings.worker_db_max_overflow,
+        statement_timeout_ms=settings.worker_db_statement_timeout_ms,
+    ),
+)
+WorkerSessionLocal = sessionmaker(bind=worker_engine, autoflush=False, autocommit=False, class_=Session)
+
+# psycopg 3 drives both engines from the same URL; set DATABASE_ASYNC_URL to use asyncpg instead.
+async_database_url = settings.database_async_url or settings.database_url
+async_engine = create_async_engine(
+    async_database_url,
+    poolclass=InstrumentedAsyncQueuePool,
+    **engine_options(
+        async_database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+    ),
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+
+
+def _replica_engines():
+    if not settings.database_replica_url:
+        return None, None
+    async_url = settings.database_replica_async_url or settings.database_replica_url
+    pool = {"pool_size": settings.db_pool_size, "max_overflow": settings.db_max_overflow}
+    timeout = settings.db_statement_timeout_ms
+    return (
+        create_engine(
+            settings.database_replica_url,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            **engine_options(settings.database_replica_url, statement_timeout_ms=timeout, **pool),
+        ),
+        create_async_engine(
+            async_url,
+            poolclass=InstrumentedAsyncQueuePool,
+            **engine_options(async_url, statement_timeout_ms=timeout, **pool),
+        ),
+    )
+
+
+replica_engine, async_replica_engine = _replica_engines()
+ReplicaSessionLocal = (
+    sessionmaker(bind=replica_engine, autoflush=False, autocommit=False, class_=Session) if replica_engine else None
+)
+AsyncReplicaSessionLocal = (
+    async_sessionmaker(bind=async_replica_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+    if async_replica_engine
+    else None
+)
+
+recent_deal_writes = RecentWrites(
+    settings.replica_read_your_writes_seconds,
+    redis=get_redis() if settings.replica_sticky_redis_enabled else None,
+)
+read_router = ReadRouter(
+    ReplicaMonitor(replica_engine, settings.replica_max_lag_seconds, settings.replica_lag_check_interval_seconds)
+    if replica_engine
+    else None,
+    recent_deal_writes,
+)
+
+# Every ORM session (sync, or the sync half of an AsyncSession) reports which deals it committed for
+# the authenticated user, so that user's next reads of those deals stay on the primary.
+event.listen(Session, "after_flush", collect_deal_writes)
+event.listen(Session, "after_rollback", forget_deal_writes)
+event.listen(Session, "after_commit", deal_writes_committed(recent_deal_writes))
+
 
 def get_db():
     db = SessionLocal()
@@ -14,3 +132,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def read_session(use_replica: bool) -> Session:
+    return ReplicaSessionLocal() if use_replica and ReplicaSessionLocal is not None else SessionLocal()
+
+
+def async_read_session(use_replica: bool) -> AsyncSession:
+    return AsyncReplicaSessionLocal() if use_replica and AsyncReplicaSessionLocal is not None else AsyncSessionLocal()
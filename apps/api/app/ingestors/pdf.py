@@ -0,0 +1,169 @@
+"""Rent-roll / OM table extraction with pdfplumber (``pip install prodigy-api[pdf]``), one page per task."""
+
+from __future__ import annotations
+
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Iterator
+
+try:
+    import pdfplumber
+except ImportError:  # pragma: no cover - optional dependency
+    pdfplumber = None
+
+from app.ingestors.xlsx import compile_column_map
+from app.models.enums import ListingSourceType
+from app.services.comps import NormalizedCompRow, build_normalized_row
+
+_NUMBER_NOISE = re.compile(r"[$,\s]")
+_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%b %d, %Y", "%B %d, %Y")
+
+
+@dataclass
+class PageResult:
+    page: int
+    rows: list[NormalizedCompRow] = field(default_factory=list)
+    spans: list[dict] = field(default_factory=list)
+    tables: int = 0
+    rows_dropped: int = 0
+    unmapped_columns: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def available() -> bool:
+    return pdfplumber is not None
+
+
+def _text(value: str | None) -> str | None:
+    return " ".join(value.split()) if value and value.strip() else None
+
+
+def _number(value: str | None) -> float | None:
+    if not value:
+        return None
+    cleaned = _NUMBER_NOISE.sub("", value)
+    negative = cleaned.startswith("(") and cleaned.endswith(")")
+    try:
+        number = float(cleaned.strip("()"))
+    except ValueError:
+        return None
+    return -number if negative else number
+
+
+def _date(value: str | None) -> date | None:
+    text = _text(value)
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _row(cells: dict[str, Any], source_ref: str) -> NormalizedCompRow:
+    return build_normalized_row(
+        address=_text(cells.get("address")),
+        unit=_text(cells.get("unit")),
+        beds=_number(cells.get("beds")),
+        baths=_number(cells.get("baths")),
+        rent=_number(cells.get("rent")),
+        gross_rent=_number(cells.get("gross_rent")),
+        date_observed=_date(cells.get("date_observed")),
+        link=_text(cells.get("link")),
+        notes=_text(cells.get("notes")),
+        source_type=ListingSourceType.PRIVATE_FILE,
+        source_ref=source_ref,
+        confidence_score=0.8,
+    )
+
+
+def extract_page(file_path: str, page_number: int) -> PageResult:
+    """Tables on one 1-based page: mapped comp rows plus a span (with bbox) for every non-empty cell."""
+    started = time.perf_counter()
+    result = PageResult(page=page_number)
+    source_ref = f"{file_path}#page={page_number}"
+    with pdfplumber.open(file_path) as pdf:
+        page = pdf.pages[page_number - 1]
+        for t, table in enumerate(page.find_tables()):
+            grid = table.extract()
+            if len(grid) < 2:
+                continue
+            result.tables += 1
+            for r, (texts, cells) in enumerate(zip(grid, (row.cells for row in table.rows))):
+                for c, (text, bbox) in enumerate(zip(texts, cells)):
+                    if bbox is None or not _text(text):
+                        continue
+                    x0, top, x1, bottom = bbox
+                    result.spans.append(
+                        {
+                            "page": page_number,
+                            "bbox": {"x0": x0, "top": top, "x1": x1, "bottom": bottom},
+                            "text_span": text,
+                            "table_cell": f"t{t}r{r}c{c}",
+                        }
+                    )
+
+            column_map = compile_column_map([_text(h) for h in grid[0]])
+            result.unmapped_columns.extend(column_map.unmapped)
+            if "address" not in column_map.indices:
+                continue
+            cells_of = column_map.getter()
+            for texts in grid[1:]:
+                cells = cells_of(texts)
+                if not _text(cells["address"]):
+                    result.rows_dropped += 1
+                    continue
+                result.rows.append(_row(cells, source_ref))
+    result.seconds = round(time.perf_counter() - started, 4)
+    return result
+
+
+def page_count(file_path: str) -> int:
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_pages(file_path: str, workers: int = 1) -> Iterator[PageResult]:
+    """Yield pages in order, each as soon as it (and every page before it) has been extracted."""
+    pages = range(1, page_count(file_path) + 1)
+    if workers > 1 and len(pages) > 1:
+        # map() rather than as_completed(): dedupe keeps the last of equally confident duplicates,
+        # so page order must not depend on which worker finishes first.
+        with ProcessPoolExecutor(max_workers=min(workers, len(pages))) as pool:
+            yield from pool.map(extract_page, [file_path] * len(pages), pages)
+    else:
+        yield from map(extract_page, [file_path] * len(pages), pages)
+
+
+def new_report() -> dict:
+    return {
+        "type": "pdf",
+        "rows_parsed": 0,
+        "rows_dropped": 0,
+        "unmapped_columns": [],
+        "tables": 0,
+        "spans": 0,
+        "pages": [],
+    }
+
+
+def record_page(report: dict, result: PageResult) -> None:
+    report["rows_parsed"] += len(result.rows)
+    report["rows_dropped"] += result.rows_dropped
+    report["tables"] += result.tables
+    report["spans"] += len(result.spans)
+    for column in result.unmapped_columns:
+        if column not in report["unmapped_columns"]:
+            report["unmapped_columns"].append(column)
+    report["pages"].append(
+        {"page": result.page, "tables": result.tables, "rows_parsed": len(result.rows), "seconds": result.seconds}
+    )
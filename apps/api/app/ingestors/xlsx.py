@@ -0,0 +1,278 @@
+"""Workbook parsing for comp exports: pluggable readers, header aliases and one process per sheet."""
+
+from __future__ import annotations
+
+import difflib
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Any, Iterator
+
+from openpyxl import load_workbook
+
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover - optional dependency
+    python_calamine = None
+
+from app.ingestors import columnar
+from app.models.enums import ListingSourceType
+from app.services.comps import build_normalized_row
+
+# Compared after _header_key(), so case, punctuation and spacing never matter.
+HEADER_ALIASES: dict[str, tuple[str, ...]] = {
+    "address": ("address", "property address", "street address", "building address", "property"),
+    "unit": ("unit", "unit number", "unit no", "apt", "apartment", "suite"),
+    "beds": ("beds", "bedrooms", "bed", "br", "bd"),
+    "baths": ("baths", "bathrooms", "bath", "ba"),
+    "rent": ("rent", "net rent", "net effective rent", "monthly rent", "asking rent", "contract rent"),
+    "gross_rent": ("gross rent", "gross", "gross monthly rent"),
+    "date_observed": ("date rented", "date observed", "lease date", "lease start", "lease start date", "date"),
+    "link": ("link", "url", "listing url", "listing link"),
+    "notes": ("notes", "note", "comments", "remarks"),
+}
+_ALIAS_FIELDS = {alias: name for name, aliases in HEADER_ALIASES.items() for alias in aliases}
+FUZZY_CUTOFF = 0.85
+_NUMERIC = {"beds", "baths", "rent", "gross_rent"}
+BACKENDS = ("auto", "openpyxl", "calamine")
+
+
+def _header_key(value: Any) -> str:
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", str(value).lower()).split()) if value not in (None, "") else ""
+
+
+@dataclass
+class ColumnMap:
+    """Header row compiled once per sheet: comp field -> column index, plus the headers nothing claimed."""
+
+    indices: dict[str, int]
+    headers: dict[str, str]
+    unmapped: list[str] = field(default_factory=list)
+
+    @property
+    def width(self) -> int:
+        return max(self.indices.values(), default=-1) + 1
+
+    def getter(self):
+        fields = list(self.indices)
+        pick = itemgetter(*self.indices.values())
+        if len(fields) == 1:
+            return lambda values: {fields[0]: pick(values)}
+        return lambda values: dict(zip(fields, pick(values)))
+
+
+def compile_column_map(header: list[Any], cutoff: float = FUZZY_CUTOFF) -> ColumnMap:
+    indices: dict[str, int] = {}
+    headers: dict[str, str] = {}
+    fuzzy: list[tuple[int, str]] = []
+    for idx, raw in enumerate(header):
+        key = _header_key(raw)
+        if not key:
+            continue
+        name = _ALIAS_FIELDS.get(key)
+        if name is None or name in indices:
+            fuzzy.append((idx, key))
+            continue
+        indices[name] = idx
+        headers[name] = str(raw).strip()
+
+    unmapped = []
+    for idx, key in fuzzy:
+        # Exact aliases win; a fuzzy match only fills a field no column claimed outright.
+        match = difflib.get_close_matches(key, _ALIAS_FIELDS, n=1, cutoff=cutoff)
+        name = _ALIAS_FIELDS[match[0]] if match else None
+        if name is None or name in indices:
+            unmapped.append(str(header[idx]).strip())
+            continue
+        indices[name] = idx
+        headers[name] = str(header[idx]).strip()
+    return ColumnMap(indices=indices, headers=headers, unmapped=unmapped)
+
+
+def _cell_text(value: Any) -> str | None:
+    if not value:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        # calamine returns every number as float; keep "7" a unit 7, not "7.0".
+        return str(int(value))
+    return str(value)
+
+
+def _cell_date(value: Any) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    return value if isinstance(value, date) else None
+
+
+def _to_float(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _OpenpyxlReader:
+    def __init__(self, file_path: str):
+        self._wb = load_workbook(file_path, read_only=True, data_only=True)
+
+    def sheet_names(self) -> list[str]:
+        return [ws.title for ws in self._wb.worksheets]
+
+    def iter_rows(self, sheet: str) -> Iterator[tuple]:
+        return self._wb[sheet].iter_rows(values_only=True)
+
+    def close(self) -> None:
+        self._wb.close()
+
+
+class _CalamineReader:
+    def __init__(self, file_path: str):
+        self._wb = python_calamine.CalamineWorkbook.from_path(file_path)
+
+    def sheet_names(self) -> list[str]:
+        return list(self._wb.sheet_names)
+
+    def iter_rows(self, sheet: str) -> Iterator[list]:
+        return self._wb.get_sheet_by_name(sheet).iter_rows()
+
+    def close(self) -> None:
+        self._wb.close()
+
+
+def resolve_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown XLSX backend: {backend}")
+    if backend == "calamine" and python_calamine is None:
+        raise RuntimeError("python-calamine is not installed")
+    if backend == "auto":
+        return "calamine" if python_calamine is not None else "openpyxl"
+    return backend
+
+
+def open_workbook(file_path: str, backend: str = "auto"):
+    return _CalamineReader(file_path) if resolve_backend(backend) == "calamine" else _OpenpyxlReader(file_path)
+
+
+def _row_from_cells(cells: dict[str, Any], file_path: str):
+    return build_normalized_row(
+        address=_cell_text(cells.get("address")),
+        unit=_cell_text(cells.get("unit")),
+        beds=_to_float(cells.get("beds")),
+        baths=_to_float(cells.get("baths")),
+        rent=_to_float(cells.get("rent")),
+        gross_rent=_to_float(cells.get("gross_rent")),
+        date_observed=_cell_date(cells.get("date_observed")),
+        link=_cell_text(cells.get("link")),
+        notes=_cell_text(cells.get("notes")),
+        source_type=ListingSourceType.PRIVATE_FILE,
+        source_ref=file_path,
+        confidence_score=0.9,
+    )
+
+
+def _columnar_cell(name: str, value: Any) -> str | None:
+    # Same coercions as _row_from_cells, expressed as the strings the columnar normalizer expects.
+    if name in _NUMERIC:
+        return None if value in (None, "") else str(value)
+    if name == "date_observed":
+        observed = _cell_date(value)
+        return observed.isoformat() if observed else None
+    return _cell_text(value)
+
+
+def parse_sheet(file_path: str, sheet: str, backend: str = "auto", use_columnar: bool = False) -> tuple[list, dict]:
+    started = time.perf_counter()
+    reader = open_workbook(file_path, backend)
+    try:
+        rows_iter = reader.iter_rows(sheet)
+        header = next(rows_iter, None) or []
+        column_map = compile_column_map(list(header))
+        report = {
+            "name": sheet,
+            "rows_parsed": 0,
+            "rows_dropped": 0,
+            "columns": column_map.headers,
+            "unmapped_columns": column_map.unmapped,
+        }
+        if "address" not in column_map.indices:
+            report["skipped"] = "no address column"
+            # Every data row still counts as dropped, as when a single sheet was read without an address column.
+            report["rows_dropped"] = sum(1 for _ in rows_iter)
+            rows: list = []
+        else:
+            rows, report["rows_dropped"] = _parse_rows(rows_iter, column_map, file_path, use_columnar)
+            report["rows_parsed"] = len(rows)
+    finally:
+        reader.close()
+    report["seconds"] = round(time.perf_counter() - started, 4)
+    return rows, report
+
+
+def _parse_rows(rows_iter, column_map: ColumnMap, file_path: str, use_columnar: bool) -> tuple[list, int]:
+    width, cells_of = column_map.width, column_map.getter()
+    padding = (None,) * width
+
+    def cells(values):
+        return cells_of(values if len(values) >= width else (*values, *padding[len(values) :]))
+
+    if use_columnar:
+        values: dict[str, list] = {name: [] for name in column_map.indices}
+        for raw in rows_iter:
+            for name, value in cells(raw).items():
+                values[name].append(_columnar_cell(name, value))
+        return columnar.normalize_columns(
+            {name: columnar.pa.array(column, type=columnar.pa.string()) for name, column in values.items()},
+            source_type=ListingSourceType.PRIVATE_FILE,
+            source_ref=file_path,
+            confidence_score=0.9,
+        )
+
+    rows, dropped = [], 0
+    for raw in rows_iter:
+        row_cells = cells(raw)
+        if not row_cells["address"]:
+            dropped += 1
+            continue
+        rows.append(_row_from_cells(row_cells, file_path))
+    return rows, dropped
+
+
+def parse_workbook(
+    file_path: str, *, backend: str = "auto", workers: int = 1, use_columnar: bool = False
+) -> tuple[list, dict]:
+    """Parse every sheet that has an address column, one worker process per sheet when ``workers > 1``."""
+    started = time.perf_counter()
+    backend = resolve_backend(backend)
+    reader = open_workbook(file_path, backend)
+    try:
+        sheets = reader.sheet_names()
+    finally:
+        reader.close()
+
+    n = len(sheets)
+    args = ([file_path] * n, sheets, [backend] * n, [use_columnar] * n)
+    if workers > 1 and n > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+            results = list(pool.map(parse_sheet, *args))
+    else:
+        results = list(map(parse_sheet, *args))
+
+    rows = [row for sheet_rows, _ in results for row in sheet_rows]
+    sheet_reports = [report for _, report in results]
+    report = {
+        "type": "xlsx",
+        "backend": backend,
+        "rows_parsed": len(rows),
+        "rows_dropped": sum(r["rows_dropped"] for r in sheet_reports),
+        "unmapped_columns": sorted({col for r in sheet_reports if "skipped" not in r for col in r["unmapped_columns"]}),
+        "sheets": sheet_reports,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    if use_columnar:
+        report["mode"] = "columnar"
+    return rows, report
@@ -1,8 +1,13 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.deps import require_metrics_token
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.security import password_hasher
+from app.db.pool import pool_snapshot
+from app.db.session import async_engine, engine, read_router, replica_engine
+from app.services.boe import boe_cache
 
 app = FastAPI(title=settings.app_name, debug=settings.debug and settings.app_env != "prod")
 allow_origins = [origin.strip() for origin in settings.cors_allow_origins.split(",") if origin.strip()]
@@ -19,3 +24,18 @@ app.include_router(api_router)
 @app.get("/health")
 def health():
     return {"status": "ok", "env": settings.app_env}
+
+
+# Pool sizes, replica lag and queue depths are internal; only scrapers holding METRICS_TOKEN may read them.
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)], include_in_schema=False)
+def metrics():
+    return {
+        "password_hashing": password_hasher.snapshot(),
+        "db_pools": {
+            "api": pool_snapshot(engine),
+            "api_async": pool_snapshot(async_engine.sync_engine),
+            **({"replica": pool_snapshot(replica_engine)} if replica_engine is not None else {}),
+        },
+        "replica": read_router.snapshot(),
+        "boe_cache": boe_cache.snapshot(),
+    }
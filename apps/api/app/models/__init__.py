@@ -1,7 +1,9 @@
 from app.models.entities import (
     AuditLog,
+    BOERegateJob,
     BOERun,
     BOETestResult,
+    BOEThresholdProfile,
     CompListing,
     CompRollup,
     CompRun,
@@ -10,6 +12,7 @@ from app.models.entities import (
     CompSubjectVariance,
     Deal,
     DealGateEvent,
+    DealGateSummary,
     DealComment,
     DealOutcome,
     Document,
@@ -25,10 +28,13 @@ __all__ = [
     "WorkspaceMember",
     "Deal",
     "DealGateEvent",
+    "DealGateSummary",
     "DealComment",
     "DealOutcome",
     "BOERun",
     "BOETestResult",
+    "BOEThresholdProfile",
+    "BOERegateJob",
     "AuditLog",
     "CompSource",
     "CompRun",
@@ -3,22 +3,26 @@ from uuid import uuid4
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Date,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 from app.models.enums import (
+    BOERegateStatus,
     CompRunStatus,
     CompSourceType,
     DealStatus,
@@ -75,6 +79,11 @@ class WorkspaceMember(Base):
 
 class Deal(Base):
     __tablename__ = "deals"
+    __table_args__ = (
+        Index("ix_deals_workspace_created_id", "workspace_id", "created_at", "id"),
+        Index("ix_deals_workspace_status_created_id", "workspace_id", "gate_status", "created_at", "id"),
+        Index("ix_deals_workspace_name_prefix", "workspace_id", "name", postgresql_ops={"name": "varchar_pattern_ops"}),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     workspace_id: Mapped[str] = mapped_column(
@@ -104,6 +113,62 @@ class Deal(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
 
+class DealGateSummary(Base):
+    # Read model for portfolio/risk; written in the same transaction as BOE runs and overrides.
+    __tablename__ = "deal_gate_summary"
+    __table_args__ = (Index("ix_deal_gate_summary_workspace_status", "workspace_id", "effective_status"),)
+
+    deal_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("deals.id", ondelete="CASCADE"), primary_key=True
+    )
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
+    )
+    latest_run_id: Mapped[str | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("boe_runs.id", ondelete="SET NULL"), nullable=True
+    )
+    computed_status: Mapped[str] = mapped_column(String(24), nullable=False)
+    effective_status: Mapped[str] = mapped_column(String(24), nullable=False)
+    has_override: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    ic_score: Mapped[int] = mapped_column(Integer, nullable=False)
+    pass_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    hard_veto_ok: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    binding_constraint: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    boe_max_bid: Mapped[float | None] = mapped_column(Float, nullable=True)
+    test_results: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    audit_trail_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class WorkspaceGateCounter(Base):
+    # Per-workspace portfolio aggregates, incremented alongside every deal_gate_summary write.
+    __tablename__ = "workspace_gate_counters"
+
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True
+    )
+    metric: Mapped[str] = mapped_column(String(24), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(100), primary_key=True, default="")
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class BOEThresholdProfile(Base):
+    __tablename__ = "boe_threshold_profiles"
+    __table_args__ = (UniqueConstraint("workspace_id", "version", name="uq_boe_threshold_profiles_workspace_version"),)
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    base_edition: Mapped[WorkspaceEdition | None] = mapped_column(Enum(WorkspaceEdition), nullable=True)
+    overrides: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    quorum_required: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_by: Mapped[str] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
 class BOERun(Base):
     __tablename__ = "boe_runs"
 
@@ -119,6 +184,7 @@ class BOERun(Base):
     hard_veto_ok: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     pass_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     advance: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    threshold_profile_version: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_by: Mapped[str] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
@@ -146,6 +212,33 @@ class BOETestResult(Base):
     run: Mapped[BOERun] = relationship(back_populates="tests")
 
 
+class BOERegateJob(Base):
+    __tablename__ = "boe_regate_jobs"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # NULL scopes the job to every workspace (portfolio-wide backfill).
+    workspace_id: Mapped[str | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    status: Mapped[BOERegateStatus] = mapped_column(
+        Enum(BOERegateStatus), nullable=False, default=BOERegateStatus.QUEUED
+    )
+    reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False, default=500)
+    cursor_deal_id: Mapped[str | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    total_deals: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    transitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    elapsed_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    checkpointed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_by: Mapped[str] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
 class AuditLog(Base):
     __tablename__ = "audit_log"
 
@@ -164,6 +257,7 @@ class AuditLog(Base):
 
 class DealGateEvent(Base):
     __tablename__ = "deal_gate_events"
+    __table_args__ = (Index("ix_deal_gate_events_deal_created_id", "deal_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     deal_id: Mapped[str] = mapped_column(
@@ -195,6 +289,7 @@ class DealOutcome(Base):
 
 class DealComment(Base):
     __tablename__ = "deal_comments"
+    __table_args__ = (Index("ix_deal_comments_deal_created_id", "deal_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     deal_id: Mapped[str] = mapped_column(
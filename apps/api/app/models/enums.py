@@ -46,6 +46,13 @@ class CompRunStatus(str, Enum):
     FAILED = "failed"
 
 
+class BOERegateStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
 class UnitType(str, Enum):
     STUDIO = "studio"
     BR1 = "1BR"
@@ -10,6 +10,39 @@ class BOERunCreate(BaseModel):
     inputs: dict
 
 
+class BOEBulkRunItem(BaseModel):
+    deal_id: UUID
+    inputs: dict
+
+
+class BOEBulkRunCreate(BaseModel):
+    items: list[BOEBulkRunItem]
+
+
+class BOESensitivityAxisIn(BaseModel):
+    field: str
+    start: float
+    stop: float
+    steps: int
+
+
+class BOESensitivityRequest(BaseModel):
+    inputs: dict | None = None
+    axes: list[BOESensitivityAxisIn]
+
+
+class BOEMonteCarloRequest(BaseModel):
+    inputs: dict | None = None
+    distributions: dict[str, dict]
+    simulations: int = 100_000
+    seed: int | None = None
+
+
+class BOERegateCreate(BaseModel):
+    reason: str | None = None
+    chunk_size: int | None = None
+
+
 class BOEDecisionSummaryOut(BaseModel):
     status: str
     hard_veto_ok: bool
@@ -50,6 +83,7 @@ class BOERunOut(BaseModel):
     hard_veto_ok: bool
     pass_count: int
     advance: bool
+    threshold_profile_version: str | None = None
     decision_summary: BOEDecisionSummaryOut | None = None
     created_by: UUID
     created_at: datetime
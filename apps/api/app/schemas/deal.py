@@ -44,3 +44,10 @@ class DealOut(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class DealPageOut(BaseModel):
+    items: list[DealOut]
+    next_cursor: str | None
+    total_estimate: int | None
+    total_is_exact: bool
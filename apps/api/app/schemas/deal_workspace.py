@@ -36,6 +36,7 @@ class DealActivityEventOut(BaseModel):
     actor: DealActivityActorOut
     summary: str
     metadata: dict
+    cursor: str | None = None
 
 
 class DealCommentCreate(BaseModel):
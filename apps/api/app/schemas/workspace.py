@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.enums import WorkspaceEdition
 
@@ -13,6 +13,12 @@ class WorkspaceEditionUpdate(BaseModel):
     edition: WorkspaceEdition
 
 
+class WorkspaceBOEProfileUpdate(BaseModel):
+    base_edition: WorkspaceEdition | None = None
+    overrides: dict[str, dict[str, float | None]] = Field(default_factory=dict)
+    quorum_required: int | None = None
+
+
 class WorkspaceOut(BaseModel):
     id: UUID
     name: str
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+from app.models.entities import Deal, User, WorkspaceMember
+from app.models.enums import MemberRole
+
+# (user_id, workspace_id) -> (expires_at, role); only memberships that exist are cached.
+_memberships: dict[tuple[str, str], tuple[float, MemberRole]] = {}
+_memberships_lock = threading.Lock()
+# user_id -> (expires_at, column values); small, since it only has to cover the users active right now.
+_users: dict[str, tuple[float, dict[str, Any]]] = {}
+_users_lock = threading.Lock()
+_USER_CACHE_MAX = 4096
+_clock: Callable[[], float] = time.monotonic
+
+
+@dataclass(frozen=True)
+class Membership:
+    workspace_id: Any
+    user_id: Any
+    role: MemberRole
+
+
+@dataclass(frozen=True)
+class DealAccess:
+    deal: Deal
+    member: Membership | None
+
+
+def _cached_role(user_id, workspace_id) -> MemberRole | None:
+    key = (str(user_id), str(workspace_id))
+    with _memberships_lock:
+        entry = _memberships.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= _clock():
+            del _memberships[key]
+            return None
+        return entry[1]
+
+
+def _remember_role(user_id, workspace_id, role: MemberRole) -> None:
+    if settings.access_cache_ttl_seconds <= 0:
+        return
+    with _memberships_lock:
+        _memberships[(str(user_id), str(workspace_id))] = (_clock() + settings.access_cache_ttl_seconds, role)
+
+
+def invalidate_membership(user_id=None, workspace_id=None) -> None:
+    """Forget cached roles for a user, a workspace or both; call after any membership change."""
+    with _memberships_lock:
+        for key in list(_memberships):
+            if (user_id is None or key[0] == str(user_id)) and (workspace_id is None or key[1] == str(workspace_id)):
+                del _memberships[key]
+
+
+def _user_columns(user: User) -> dict[str, Any]:
+    return {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+
+
+def resolve_user(db: Session, user_id) -> User | None:
+    """The user row, served from a short TTL cache and attached to ``db`` without a query on a hit."""
+    key = str(user_id)
+    with _users_lock:
+        entry = _users.get(key)
+        if entry is not None and entry[0] <= _clock():
+            del _users[key]
+            entry = None
+    if entry is not None:
+        user = User(**entry[1])
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+    user = db.scalar(select(User).where(User.id == user_id))
+    if user is not None and settings.user_cache_ttl_seconds > 0:
+        with _users_lock:
+            _users[key] = (_clock() + settings.user_cache_ttl_seconds, _user_columns(user))
+            while len(_users) > _USER_CACHE_MAX:
+                del _users[next(iter(_users))]
+    return user
+
+
+def invalidate_user(user_id=None) -> None:
+    with _users_lock:
+        if user_id is None:
+            _users.clear()
+        else:
+            _users.pop(str(user_id), None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_changed_user(_mapper, _connection, target: User) -> None:
+    invalidate_user(target.id)
+
+
+def _request_memo(db: Session) -> dict:
+    # Session.info lives exactly as long as the request's session, so it doubles as a request-scoped memo.
+    return db.info.setdefault("access", {})
+
+
+def resolve_membership(db: Session, workspace_id, user_id) -> Membership | None:
+    memo = _request_memo(db)
+    key = ("member", str(workspace_id), str(user_id))
+    if key in memo:
+        return memo[key]
+    role = _cached_role(user_id, workspace_id)
+    if role is None:
+        row = db.scalar(
+            select(WorkspaceMember).where(
+                WorkspaceMember.workspace_id == workspace_id,
+                WorkspaceMember.user_id == user_id,
+            )
+        )
+        role = row.role if row else None
+        if role is not None:
+            _remember_role(user_id, workspace_id, role)
+    memo[key] = Membership(workspace_id=workspace_id, user_id=user_id, role=role) if role is not None else None
+    return memo[key]
+
+
+def resolve_deal_access(db: Session, deal_id, user_id) -> DealAccess | None:
+    """The deal and the caller's membership in its workspace from one joined query, memoized for the request.
+
+    Returns ``None`` when the deal does not exist; ``member`` is ``None`` when the caller is not a member.
+    """
+    memo = _request_memo(db)
+    key = ("deal", str(deal_id), str(user_id))
+    if key in memo:
+        return memo[key]
+    row = db.execute(
+        select(Deal, WorkspaceMember.role)
+        .outerjoin(
+            WorkspaceMember,
+            and_(WorkspaceMember.workspace_id == Deal.workspace_id, WorkspaceMember.user_id == user_id),
+        )
+        .where(Deal.id == deal_id)
+    ).first()
+    if row is None:
+        memo[key] = None
+        return None
+    deal, role = row
+    member = Membership(workspace_id=deal.workspace_id, user_id=user_id, role=role) if role is not None else None
+    if role is not None:
+        _remember_role(user_id, deal.workspace_id, role)
+    memo[("member", str(deal.workspace_id), str(user_id))] = member
+    memo[key] = DealAccess(deal=deal, member=member)
+    return memo[key]
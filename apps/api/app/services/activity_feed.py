@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import JSON, String, case, cast, func, literal, null, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.models.entities import DealComment, DealGateEvent, User
+from app.services.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+_UUID_PATTERN = "^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+
+def _gate_actor_ref():
+    return func.coalesce(
+        DealGateEvent.metadata_json["override_by"].as_string(),
+        DealGateEvent.metadata_json["actor_user_id"].as_string(),
+    )
+
+
+def _gate_actor_id():
+    # Actors live in metadata_json as strings; only well-formed ids are cast so users.id stays an index lookup.
+    raw = _gate_actor_ref()
+    return case((raw.regexp_match(_UUID_PATTERN), cast(raw, UUID(as_uuid=True))), else_=null())
+
+
+def activity_feed_query(deal_id, *, cursor: str | None, limit: int):
+    """Gate events and comments as one ``UNION ALL``, newest first, with actors joined in.
+
+    Each branch is bounded by the ``(deal_id, created_at, id)`` index and its own
+    ``LIMIT``, so any page costs the same however far back the cursor points.
+    """
+    gate = select(
+        literal("gate").label("kind"),
+        DealGateEvent.id.label("id"),
+        DealGateEvent.created_at.label("created_at"),
+        DealGateEvent.event_type.label("event_type"),
+        DealGateEvent.to_status.label("to_status"),
+        cast(null(), String).label("body"),
+        DealGateEvent.metadata_json.label("metadata_json"),
+        _gate_actor_id().label("actor_id"),
+        _gate_actor_ref().label("actor_ref"),
+    ).where(DealGateEvent.deal_id == deal_id)
+    comments = select(
+        literal("comment"),
+        DealComment.id,
+        DealComment.created_at,
+        literal("COMMENT_ADDED"),
+        cast(null(), String),
+        DealComment.body,
+        cast(null(), JSON),
+        DealComment.created_by,
+        cast(DealComment.created_by, String),
+    ).where(DealComment.deal_id == deal_id)
+    if cursor:
+        position = decode_keyset_cursor(cursor)
+        gate = gate.where(tuple_(DealGateEvent.created_at, DealGateEvent.id) < position)
+        comments = comments.where(tuple_(DealComment.created_at, DealComment.id) < position)
+    gate = gate.order_by(DealGateEvent.created_at.desc(), DealGateEvent.id.desc()).limit(limit)
+    comments = comments.order_by(DealComment.created_at.desc(), DealComment.id.desc()).limit(limit)
+    feed = union_all(gate, comments).subquery("feed")
+    return (
+        select(feed, User.email.label("actor_email"), User.full_name.label("actor_name"))
+        .outerjoin(User, User.id == feed.c.actor_id)
+        .order_by(feed.c.created_at.desc(), feed.c.id.desc())
+        .limit(limit)
+    )
+
+
+def _summary(row) -> tuple[str, str]:
+    if row.kind == "comment":
+        return "COMMENT_ADDED", row.body
+    if row.event_type == "BOE_RUN_CREATED":
+        return "BOE_RUN_CREATED", "BOE run created"
+    if row.event_type == "OVERRIDE_SET":
+        return "GATE_OVERRIDE_SET", f"Gate override set to {row.to_status}"
+    if row.event_type == "OVERRIDE_CLEARED":
+        return "GATE_OVERRIDE_CLEARED", "Gate override cleared"
+    return row.event_type, row.event_type.replace("_", " ").title()
+
+
+def activity_event(row) -> dict[str, Any]:
+    event_type, summary = _summary(row)
+    return {
+        "id": f"{row.kind}-{row.id}",
+        "type": event_type,
+        "created_at": row.created_at,
+        "actor": {"id": row.actor_ref, "email": row.actor_email, "name": row.actor_name},
+        "summary": summary,
+        "metadata": {"body": row.body} if row.kind == "comment" else row.metadata_json or {},
+        "cursor": encode_keyset_cursor(row.created_at, row.id),
+    }
+
+
+def load_activity_feed(db: Session, deal_id, *, cursor: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
+    return [activity_event(row) for row in db.execute(activity_feed_query(deal_id, cursor=cursor, limit=limit)).all()]
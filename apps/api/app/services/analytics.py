@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+from typing import Sequence
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session
+
+from app.models.entities import Deal, DealGateSummary, DealOutcome
+from app.services.deal_gate_summary import load_gate_summaries, summary_record
+from app.services.gate_counters import BINDING, DEALS, IC_SCORE_SUM, OVERRIDES, STATUS, load_workspace_counters
 from app.services.gate_summary import status_sort_key
 
+ADVANCE_STATUSES = ("ADVANCE", "APPROVED")
+IC_SCORE_BINS = (("0-39", 0, 39), ("40-59", 40, 59), ("60-79", 60, 79), ("80-100", 80, 100))
+
 
 def build_portfolio_summary_payload(summaries: list[dict]) -> dict:
     status_counts_map = {}
@@ -19,6 +30,23 @@ def build_portfolio_summary_payload(summaries: list[dict]) -> dict:
         if binding:
             binding_counts_map[binding] = binding_counts_map.get(binding, 0) + 1
 
+    return _portfolio_payload(
+        deal_count=len(summaries),
+        status_counts_map=status_counts_map,
+        binding_counts_map=binding_counts_map,
+        override_count=override_count,
+        ic_score_sum=sum(ic_scores),
+    )
+
+
+def _portfolio_payload(
+    *,
+    deal_count: int,
+    status_counts_map: dict[str, int],
+    binding_counts_map: dict[str, int],
+    override_count: int,
+    ic_score_sum: float,
+) -> dict:
     status_counts = [
         {"status": k, "count": status_counts_map[k]}
         for k in sorted(status_counts_map.keys(), key=status_sort_key)
@@ -27,9 +55,8 @@ def build_portfolio_summary_payload(summaries: list[dict]) -> dict:
         {"binding_constraint": k, "count": binding_counts_map[k]}
         for k in sorted(binding_counts_map.keys())
     ]
-    deal_count = len(summaries)
     override_frequency_pct = (override_count / deal_count * 100.0) if deal_count else 0.0
-    avg_ic_score = (sum(ic_scores) / len(ic_scores)) if ic_scores else None
+    avg_ic_score = (ic_score_sum / deal_count) if deal_count else None
     return {
         "portfolio_payload_version": "1.0",
         "deal_count": deal_count,
@@ -42,30 +69,20 @@ def build_portfolio_summary_payload(summaries: list[dict]) -> dict:
 
 
 def build_risk_metrics_payload(records: list[tuple[dict, object | None]]) -> dict:
-    def _rate(numerator: int, denominator: int) -> float | None:
-        if denominator == 0:
-            return None
-        return numerator / denominator
-
     adv_num = 0
     adv_den = 0
     ov_num = 0
     ov_den = 0
     nov_num = 0
     nov_den = 0
-    bins = [
-        {"label": "0-39", "min": 0, "max": 39, "count": 0, "irr_sum": 0.0},
-        {"label": "40-59", "min": 40, "max": 59, "count": 0, "irr_sum": 0.0},
-        {"label": "60-79", "min": 60, "max": 79, "count": 0, "irr_sum": 0.0},
-        {"label": "80-100", "min": 80, "max": 100, "count": 0, "irr_sum": 0.0},
-    ]
+    bins = [{"label": label, "min": lo, "max": hi, "count": 0, "irr_sum": 0.0} for label, lo, hi in IC_SCORE_BINS]
 
     for summary, outcome in records:
         if outcome is None:
             continue
         underperformed = getattr(outcome, "underperformed_flag", None)
         realized_irr = getattr(outcome, "realized_irr", None)
-        if summary["effective_status"] in {"ADVANCE", "APPROVED"} and underperformed is not None:
+        if summary["effective_status"] in ADVANCE_STATUSES and underperformed is not None:
             adv_den += 1
             if underperformed:
                 adv_num += 1
@@ -88,13 +105,36 @@ def build_risk_metrics_payload(records: list[tuple[dict, object | None]]) -> dic
                     b["irr_sum"] += float(realized_irr)
                     break
 
+    return _risk_payload(
+        adv=(adv_num, adv_den),
+        override=(ov_num, ov_den),
+        no_override=(nov_num, nov_den),
+        bins=[(b["label"], b["count"], b["irr_sum"]) for b in bins],
+    )
+
+
+def _risk_payload(
+    *,
+    adv: tuple[int, int],
+    override: tuple[int, int],
+    no_override: tuple[int, int],
+    bins: Sequence[tuple[str, int, float]],
+) -> dict:
+    def _rate(numerator: int, denominator: int) -> float | None:
+        if denominator == 0:
+            return None
+        return numerator / denominator
+
+    adv_num, adv_den = adv
+    ov_num, ov_den = override
+    nov_num, nov_den = no_override
     bin_rows = [
         {
-            "bin": b["label"],
-            "count": b["count"],
-            "avg_realized_irr": (b["irr_sum"] / b["count"]) if b["count"] else None,
+            "bin": label,
+            "count": count,
+            "avg_realized_irr": (irr_sum / count) if count else None,
         }
-        for b in bins
+        for label, count, irr_sum in bins
     ]
     return {
         "risk_payload_version": "1.0",
@@ -110,3 +150,153 @@ def build_risk_metrics_payload(records: list[tuple[dict, object | None]]) -> dic
             "no_override": {"numerator": nov_num, "denominator": nov_den, "rate": _rate(nov_num, nov_den)},
         },
     }
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _unsummarized_deals_exist(db: Session, workspace_ids: Sequence) -> bool:
+    return bool(
+        db.scalar(
+            select(
+                select(Deal.id)
+                .outerjoin(DealGateSummary, DealGateSummary.deal_id == Deal.id)
+                .where(Deal.workspace_id.in_(list(workspace_ids)), DealGateSummary.deal_id.is_(None))
+                .exists()
+            )
+        )
+    )
+
+
+def _python_records(db: Session, workspace_ids: Sequence) -> list[dict]:
+    return [summary_record(summary) for summary in load_gate_summaries(db, workspace_ids)]
+
+
+def query_portfolio_summary_payload(db: Session, workspace_ids: Sequence) -> dict:
+    """``build_portfolio_summary_payload`` computed with ``GROUP BY`` over ``deal_gate_summary``.
+
+    Deals still missing a summary row fall back to the in-memory path so no deal is dropped.
+    """
+    workspace_ids = list(workspace_ids)
+    if not workspace_ids:
+        return build_portfolio_summary_payload([])
+    status_rows = db.execute(
+        select(
+            DealGateSummary.effective_status,
+            func.count(Deal.id),
+            _count_if(DealGateSummary.has_override.is_(True)),
+            func.coalesce(func.sum(DealGateSummary.ic_score), 0),
+        )
+        .select_from(Deal)
+        .outerjoin(DealGateSummary, DealGateSummary.deal_id == Deal.id)
+        .where(Deal.workspace_id.in_(workspace_ids))
+        .group_by(DealGateSummary.effective_status)
+    ).all()
+    if any(status is None for status, *_ in status_rows):
+        return build_portfolio_summary_payload(_python_records(db, workspace_ids))
+
+    binding_rows = db.execute(
+        select(DealGateSummary.binding_constraint, func.count())
+        .where(
+            DealGateSummary.workspace_id.in_(workspace_ids),
+            DealGateSummary.binding_constraint.isnot(None),
+            DealGateSummary.binding_constraint != "",
+        )
+        .group_by(DealGateSummary.binding_constraint)
+    ).all()
+    return _portfolio_payload(
+        deal_count=sum(int(count) for _, count, _, _ in status_rows),
+        status_counts_map={status: int(count) for status, count, _, _ in status_rows},
+        binding_counts_map={binding: int(count) for binding, count in binding_rows},
+        override_count=sum(int(overrides) for _, _, overrides, _ in status_rows),
+        ic_score_sum=sum(float(ic_sum) for _, _, _, ic_sum in status_rows),
+    )
+
+
+def counters_portfolio_summary_payload(db: Session, workspace_ids: Sequence) -> dict:
+    """``build_portfolio_summary_payload`` read from the per-workspace counters, O(workspaces) rather than O(deals)."""
+    workspace_ids = list(workspace_ids)
+    if not workspace_ids:
+        return build_portfolio_summary_payload([])
+    totals: dict[str, dict[str, int]] = {}
+    for metric, bucket, value in load_workspace_counters(db, workspace_ids):
+        if value:
+            totals.setdefault(metric, {})[bucket] = int(value)
+    return _portfolio_payload(
+        deal_count=totals.get(DEALS, {}).get("", 0),
+        status_counts_map=totals.get(STATUS, {}),
+        binding_counts_map=totals.get(BINDING, {}),
+        override_count=totals.get(OVERRIDES, {}).get("", 0),
+        ic_score_sum=totals.get(IC_SCORE_SUM, {}).get("", 0),
+    )
+
+
+def query_risk_metrics_payload(db: Session, workspace_ids: Sequence) -> dict:
+    """``build_risk_metrics_payload`` computed as one ``CASE``-counter aggregate over each deal's latest outcome."""
+    workspace_ids = list(workspace_ids)
+    if not workspace_ids:
+        return build_risk_metrics_payload([])
+    if _unsummarized_deals_exist(db, workspace_ids):
+        return _python_risk_metrics(db, workspace_ids)
+
+    ranked = (
+        select(
+            DealOutcome.deal_id,
+            DealOutcome.realized_irr,
+            DealOutcome.underperformed_flag,
+            func.row_number()
+            .over(partition_by=DealOutcome.deal_id, order_by=DealOutcome.recorded_at.desc())
+            .label("rn"),
+        )
+        .join(Deal, Deal.id == DealOutcome.deal_id)
+        .where(Deal.workspace_id.in_(workspace_ids))
+        .subquery()
+    )
+    underperformed = ranked.c.underperformed_flag
+    irr = ranked.c.realized_irr
+    advanced = DealGateSummary.effective_status.in_(ADVANCE_STATUSES)
+    override = DealGateSummary.has_override.is_(True)
+    columns = [
+        _count_if(and_(advanced, underperformed.is_(True))),
+        _count_if(and_(advanced, underperformed.isnot(None))),
+        _count_if(and_(override, underperformed.is_(True))),
+        _count_if(and_(override, underperformed.isnot(None))),
+        _count_if(and_(~override, underperformed.is_(True))),
+        _count_if(and_(~override, underperformed.isnot(None))),
+    ]
+    for _, lo, hi in IC_SCORE_BINS:
+        in_bin = and_(irr.isnot(None), DealGateSummary.ic_score.between(lo, hi))
+        columns.append(_count_if(in_bin))
+        columns.append(func.coalesce(func.sum(case((in_bin, irr), else_=0.0)), 0.0))
+
+    row = db.execute(
+        select(*columns)
+        .select_from(DealGateSummary)
+        .join(ranked, and_(ranked.c.deal_id == DealGateSummary.deal_id, ranked.c.rn == 1))
+        .where(DealGateSummary.workspace_id.in_(workspace_ids))
+    ).one()
+    counters = [int(value) for value in row[:6]]
+    return _risk_payload(
+        adv=(counters[0], counters[1]),
+        override=(counters[2], counters[3]),
+        no_override=(counters[4], counters[5]),
+        bins=[
+            (label, int(row[6 + 2 * i]), float(row[7 + 2 * i]))
+            for i, (label, _, _) in enumerate(IC_SCORE_BINS)
+        ],
+    )
+
+
+def _python_risk_metrics(db: Session, workspace_ids: Sequence) -> dict:
+    outcomes_by_deal = {}
+    for outcome in db.scalars(
+        select(DealOutcome)
+        .join(Deal, Deal.id == DealOutcome.deal_id)
+        .where(Deal.workspace_id.in_(workspace_ids))
+        .order_by(DealOutcome.recorded_at.desc())
+    ).all():
+        outcomes_by_deal.setdefault(outcome.deal_id, outcome)
+    return build_risk_metrics_payload(
+        [(record, outcomes_by_deal.get(record["deal_id"])) for record in _python_records(db, workspace_ids)]
+    )
@@ -1,7 +1,20 @@
-from app.boe.engine import BOEInput, calculate_boe, serialize_output
+from app.boe.cache import BOECache, BOEResult
+from app.boe.engine import BOEInput, serialize_output
+from app.boe.profiles import ThresholdProfile
+from app.core.config import settings
+from app.workers.queue import get_redis
+
+boe_cache = BOECache(
+    maxsize=settings.boe_cache_size,
+    redis=get_redis() if settings.boe_cache_redis_enabled else None,
+    ttl_seconds=settings.boe_cache_ttl_seconds,
+)
+
+
+def calculate_boe(inputs: BOEInput, profile: ThresholdProfile | None = None) -> BOEResult:
+    return boe_cache.calculate(inputs, profile)
 
 
 def evaluate_boe(inputs: dict):
-    boe_input = BOEInput(**inputs)
-    output, tests, decision = calculate_boe(boe_input)
+    output, tests, decision = calculate_boe(BOEInput(**inputs))
     return serialize_output(output), tests, decision
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.boe.engine import BOE_INPUT_FIELDS, boe_input_columns, calculate_boe_batch, serialize_output
+from app.models.entities import BOERun, BOETestResult, Deal
+from app.models.enums import TestClass, TestResult
+from app.services.boe_profiles import resolve_threshold_profile
+from app.services.deal_gate_summary import gate_summary_row, record_gate_summaries
+from app.services.gating import (
+    apply_computed_gate_status,
+    log_boe_run_created,
+    map_decision_to_deal_status,
+    transition_deal_gate,
+)
+
+BULK_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class BulkRunRef:
+    id: UUID
+    deal_id: UUID
+    version: int
+    advance: bool
+
+
+def _error_line(deal_id, error: str) -> dict[str, Any]:
+    return {"type": "error", "deal_id": str(deal_id), "error": error}
+
+
+def score_bulk_chunk(
+    db: Session,
+    *,
+    workspace_id,
+    items: Sequence[tuple[UUID, dict]],
+    user_id,
+    reason: str = "Computed from bulk BOE run",
+) -> list[dict[str, Any]]:
+    deal_ids = list({deal_id for deal_id, _ in items})
+    deals = {
+        deal.id: deal
+        for deal in db.scalars(select(Deal).where(Deal.workspace_id == workspace_id, Deal.id.in_(deal_ids))).all()
+    }
+    versions: dict = {}
+    if deals:
+        versions = dict(
+            db.execute(
+                select(BOERun.deal_id, func.max(BOERun.version))
+                .where(BOERun.deal_id.in_(list(deals)))
+                .group_by(BOERun.deal_id)
+            ).all()
+        )
+
+    lines: list[dict[str, Any] | None] = []
+    accepted: list[tuple[int, Deal, dict]] = []
+    for deal_id, inputs in items:
+        deal = deals.get(deal_id)
+        unknown = sorted(set(inputs) - set(BOE_INPUT_FIELDS))
+        if deal is None:
+            lines.append(_error_line(deal_id, "Deal not found"))
+        elif unknown:
+            lines.append(_error_line(deal_id, f"Unknown BOE inputs: {', '.join(unknown)}"))
+        else:
+            accepted.append((len(lines), deal, inputs))
+            lines.append(None)
+
+    if not accepted:
+        return lines
+
+    profile = resolve_threshold_profile(db, workspace_id)
+    batch = calculate_boe_batch(
+        boe_input_columns(inputs for _, _, inputs in accepted), profile.rules, profile.quorum_required
+    )
+    run_rows: list[dict[str, Any]] = []
+    test_rows: list[dict[str, Any]] = []
+    scored = []
+    for (position, deal, inputs), (output, tests, decision) in zip(accepted, batch.rows()):
+        version = int(versions.get(deal.id) or 0) + 1
+        versions[deal.id] = version
+        ref = BulkRunRef(id=uuid4(), deal_id=deal.id, version=version, advance=decision.advance)
+        outputs = serialize_output(output)
+        run_rows.append(
+            {
+                "id": ref.id,
+                "deal_id": deal.id,
+                "version": version,
+                "inputs": inputs,
+                "outputs": outputs,
+                "decision": "ADVANCE" if decision.advance else "KILL",
+                "binding_constraint": output.binding_constraint,
+                "hard_veto_ok": decision.hard_veto_ok,
+                "pass_count": decision.pass_count,
+                "advance": decision.advance,
+                "threshold_profile_version": profile.version,
+                "created_by": user_id,
+            }
+        )
+        test_rows.extend(
+            {
+                "boe_run_id": ref.id,
+                "test_key": t.key,
+                "test_name": t.name,
+                "test_class": TestClass(t.test_class.value),
+                "threshold": t.threshold,
+                "actual": t.actual,
+                "threshold_display": t.threshold_display,
+                "actual_display": t.actual_display,
+                "result": TestResult(t.result.value),
+                "note": None,
+            }
+            for t in tests
+        )
+        scored.append((position, deal, ref, output, decision, outputs, tests))
+
+    db.execute(insert(BOERun), run_rows)
+    db.execute(insert(BOETestResult), test_rows)
+
+    summary_rows = []
+    for position, deal, ref, output, decision, outputs, tests in scored:
+        log_boe_run_created(db, ref, user_id)
+        transition_deal_gate(db, deal, ref, user_id)
+        gate_changed = apply_computed_gate_status(
+            db,
+            deal,
+            map_decision_to_deal_status(decision),
+            reason=reason,
+            metadata_json={
+                "run_id": str(ref.id),
+                "decision": decision.status.value,
+                "hard_veto_ok": decision.hard_veto_ok,
+                "pass_count": decision.pass_count,
+                "advance": decision.advance,
+            },
+        )
+        summary_rows.append(
+            gate_summary_row(
+                deal,
+                latest_run_id=ref.id,
+                binding_constraint=output.binding_constraint,
+                outputs=outputs,
+                tests=[(t.key, t.test_class.value, t.result.value) for t in tests],
+                audit_trail_count=1 + gate_changed,
+            )
+        )
+        lines[position] = {
+            "type": "result",
+            "deal_id": str(deal.id),
+            "run_id": str(ref.id),
+            "version": ref.version,
+            "status": decision.status.value,
+            "advance": decision.advance,
+            "hard_veto_ok": decision.hard_veto_ok,
+            "pass_count": decision.pass_count,
+            "binding_constraint": output.binding_constraint,
+            "boe_max_bid": output.boe_max_bid,
+            "gate_status": deal.gate_status.value,
+            "gate_changed": gate_changed,
+        }
+    record_gate_summaries(db, summary_rows)
+    return lines
+
+
+def stream_bulk_boe_runs(
+    db: Session,
+    *,
+    workspace_id,
+    items: Sequence[tuple[UUID, dict]],
+    user_id,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> Iterator[str]:
+    processed = 0
+    failed = 0
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start : start + chunk_size]
+        try:
+            lines = score_bulk_chunk(db, workspace_id=workspace_id, items=chunk, user_id=user_id)
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            lines = [_error_line(deal_id, f"Chunk failed: {exc}") for deal_id, _ in chunk]
+
+        for line in lines:
+            processed += 1
+            failed += line["type"] == "error"
+            yield json.dumps(line) + "\n"
+
+    yield json.dumps({"type": "summary", "processed": processed, "succeeded": processed - failed, "failed": failed}) + "\n"
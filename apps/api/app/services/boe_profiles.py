@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.boe.engine import compile_rules
+from app.boe.profiles import ThresholdProfile, edition_profile, merge_overrides, validate_overrides
+from app.models.entities import AuditLog, BOEThresholdProfile, Workspace
+from app.models.enums import WorkspaceEdition
+
+_profiles: dict[tuple[str, str, int | None], ThresholdProfile] = {}
+_profiles_lock = threading.Lock()
+
+
+def build_threshold_profile(edition: WorkspaceEdition, row: BOEThresholdProfile | None) -> ThresholdProfile:
+    base = edition_profile((row.base_edition if row and row.base_edition else edition).value)
+    if row is None:
+        return base
+    return ThresholdProfile(
+        version=f"{base.version}+workspace.v{row.version}",
+        overrides=merge_overrides(base.overrides, row.overrides or {}),
+        quorum=base.quorum if row.quorum_required is None else row.quorum_required,
+    )
+
+
+def threshold_profile_for(workspace_id, edition: WorkspaceEdition, row: BOEThresholdProfile | None) -> ThresholdProfile:
+    key = (str(workspace_id), edition.value, row.version if row else None)
+    with _profiles_lock:
+        profile = _profiles.get(key)
+    if profile is None:
+        profile = build_threshold_profile(edition, row)
+        compile_rules(profile.rules)
+        with _profiles_lock:
+            _profiles[key] = profile
+    return profile
+
+
+def invalidate_threshold_profiles(workspace_id) -> None:
+    workspace_key = str(workspace_id)
+    with _profiles_lock:
+        for key in [key for key in _profiles if key[0] == workspace_key]:
+            del _profiles[key]
+
+
+def latest_threshold_profile_row(db: Session, workspace_id) -> BOEThresholdProfile | None:
+    return db.scalar(
+        select(BOEThresholdProfile)
+        .where(BOEThresholdProfile.workspace_id == workspace_id)
+        .order_by(BOEThresholdProfile.version.desc())
+        .limit(1)
+    )
+
+
+def resolve_threshold_profile(db: Session, workspace_id) -> ThresholdProfile:
+    edition = db.scalar(select(Workspace.edition).where(Workspace.id == workspace_id)) or WorkspaceEdition.SYNDICATOR
+    return threshold_profile_for(workspace_id, edition, latest_threshold_profile_row(db, workspace_id))
+
+
+def save_threshold_profile(
+    db: Session,
+    workspace: Workspace,
+    user_id,
+    *,
+    overrides: dict[str, Any],
+    quorum_required: int | None,
+    base_edition: WorkspaceEdition | None,
+) -> BOEThresholdProfile:
+    cleaned = validate_overrides(overrides, quorum_required)
+    previous = latest_threshold_profile_row(db, workspace.id)
+    version = (previous.version if previous else 0) + 1
+    row = BOEThresholdProfile(
+        workspace_id=workspace.id,
+        version=version,
+        base_edition=base_edition,
+        overrides=cleaned,
+        quorum_required=quorum_required,
+        created_by=user_id,
+    )
+    db.add(row)
+    profile = build_threshold_profile(workspace.edition, row)
+    previous_version = build_threshold_profile(workspace.edition, previous).version
+    db.add(
+        AuditLog(
+            workspace_id=workspace.id,
+            user_id=user_id,
+            entity_type="workspace",
+            entity_id=workspace.id,
+            action="workspace.boe_profile_updated",
+            previous_state=previous_version,
+            new_state=profile.version,
+            created_by=user_id,
+            payload={
+                "version": version,
+                "base_edition": base_edition.value if base_edition else None,
+                "overrides": cleaned,
+                "quorum_required": quorum_required,
+            },
+        )
+    )
+    invalidate_threshold_profiles(workspace.id)
+    return row
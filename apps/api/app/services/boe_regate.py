@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.models.entities import BOERegateJob, BOERun, Deal
+from app.models.enums import BOERegateStatus
+from app.services.boe_bulk import score_bulk_chunk
+
+REGATE_CHUNK_SIZE = 500
+REGATE_REASON = "Re-gated after BOE rule change"
+
+
+def _latest_versions(workspace_id=None):
+    stmt = select(BOERun.deal_id, func.max(BOERun.version).label("version")).join(Deal, Deal.id == BOERun.deal_id)
+    if workspace_id is not None:
+        stmt = stmt.where(Deal.workspace_id == workspace_id)
+    return stmt
+
+
+def count_regate_deals(db: Session, workspace_id=None) -> int:
+    latest = _latest_versions(workspace_id).group_by(BOERun.deal_id).subquery()
+    return int(db.scalar(select(func.count()).select_from(latest)) or 0)
+
+
+def latest_inputs_page(db: Session, *, after_deal_id=None, limit: int, workspace_id=None) -> list[Any]:
+    """Next ``limit`` deals after ``after_deal_id`` (by id) with their latest BOE run inputs."""
+    latest = _latest_versions(workspace_id)
+    if after_deal_id is not None:
+        latest = latest.where(BOERun.deal_id > after_deal_id)
+    latest = latest.group_by(BOERun.deal_id).order_by(BOERun.deal_id).limit(limit).subquery()
+    return db.execute(
+        select(BOERun.deal_id, Deal.workspace_id, BOERun.inputs)
+        .join(latest, and_(BOERun.deal_id == latest.c.deal_id, BOERun.version == latest.c.version))
+        .join(Deal, Deal.id == BOERun.deal_id)
+        .order_by(BOERun.deal_id)
+    ).all()
+
+
+def regate_page(db: Session, rows: Sequence[Any], *, user_id, reason: str = REGATE_REASON) -> list[dict[str, Any]]:
+    # Threshold profiles are per workspace, so each workspace's slice of the page is scored as one batch.
+    lines: list[dict[str, Any]] = []
+    ordered = sorted(rows, key=lambda row: str(row.workspace_id))
+    for workspace_id, group in groupby(ordered, key=lambda row: row.workspace_id):
+        items = [(row.deal_id, row.inputs) for row in group]
+        lines.extend(score_bulk_chunk(db, workspace_id=workspace_id, items=items, user_id=user_id, reason=reason))
+    return lines
+
+
+def regate_progress(job: BOERegateJob) -> dict[str, Any]:
+    return {
+        "id": str(job.id),
+        "workspace_id": str(job.workspace_id) if job.workspace_id else None,
+        "status": job.status.value,
+        "reason": job.reason,
+        "total_deals": job.total_deals,
+        "processed": job.processed,
+        "failed": job.failed,
+        "transitions": job.transitions,
+        "percent_complete": round(100 * job.processed / job.total_deals, 2) if job.total_deals else None,
+        "elapsed_seconds": job.elapsed_seconds,
+        "deals_per_second": job.processed / job.elapsed_seconds if job.elapsed_seconds else None,
+        "cursor_deal_id": str(job.cursor_deal_id) if job.cursor_deal_id else None,
+        "error": job.error,
+        "started_at": job.started_at,
+        "checkpointed_at": job.checkpointed_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def regate_job_stalled(job: BOERegateJob, stale_after_seconds: float, now: datetime | None = None) -> bool:
+    """A RUNNING job whose worker has not checkpointed for ``stale_after_seconds``, e.g. after a crash."""
+    if job.status != BOERegateStatus.RUNNING:
+        return False
+    heartbeat = job.checkpointed_at or job.started_at
+    if heartbeat is None:
+        return True
+    if heartbeat.tzinfo is None:
+        heartbeat = heartbeat.replace(tzinfo=timezone.utc)
+    return ((now or datetime.now(timezone.utc)) - heartbeat).total_seconds() > stale_after_seconds
+
+
+def run_regate_job(
+    db: Session,
+    job: BOERegateJob,
+    *,
+    clock: Callable[[], float] = time.perf_counter,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> BOERegateJob:
+    """Re-score every deal's latest BOE inputs from the job's checkpoint onward.
+
+    Each page's runs, gate events and the advanced cursor commit together, so a
+    failed or interrupted job resumes from the last committed page without
+    re-gating deals twice.
+    """
+    job.status = BOERegateStatus.RUNNING
+    job.error = None
+    job.finished_at = None
+    if job.started_at is None:
+        job.started_at = datetime.now(timezone.utc)
+    if job.total_deals is None:
+        job.total_deals = count_regate_deals(db, job.workspace_id)
+    # checkpointed_at doubles as the worker heartbeat, so a resumed job is not immediately seen as stalled.
+    job.checkpointed_at = datetime.now(timezone.utc)
+    db.commit()
+
+    while True:
+        started = clock()
+        rows = latest_inputs_page(
+            db, after_deal_id=job.cursor_deal_id, limit=job.chunk_size, workspace_id=job.workspace_id
+        )
+        if not rows:
+            break
+        lines = regate_page(db, rows, user_id=job.created_by, reason=job.reason or REGATE_REASON)
+        job.cursor_deal_id = rows[-1].deal_id
+        job.processed += len(lines)
+        job.failed += sum(line["type"] == "error" for line in lines)
+        job.transitions += sum(bool(line.get("gate_changed")) for line in lines)
+        job.elapsed_seconds += clock() - started
+        job.checkpointed_at = datetime.now(timezone.utc)
+        db.commit()
+        if on_progress is not None:
+            on_progress(regate_progress(job))
+
+    job.status = BOERegateStatus.SUCCEEDED
+    job.finished_at = datetime.now(timezone.utc)
+    db.commit()
+    return job
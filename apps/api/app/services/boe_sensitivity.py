@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from app.boe.engine import (
+    BOE_INPUT_FIELDS,
+    BOE_RULES,
+    STATUS_CODES,
+    BOEInput,
+    boe_input_columns,
+    calculate_boe,
+    calculate_boe_batch,
+)
+from app.boe.profiles import ThresholdProfile
+
+MAX_SENSITIVITY_AXES = 2
+MAX_SENSITIVITY_STEPS = 200
+
+
+@dataclass(frozen=True)
+class SensitivityAxis:
+    field: str
+    start: float
+    stop: float
+    steps: int
+
+    def values(self) -> np.ndarray:
+        return np.linspace(self.start, self.stop, self.steps)
+
+
+def _validate_axes(base_inputs: Mapping[str, Any], axes: Sequence[SensitivityAxis]) -> None:
+    if not 1 <= len(axes) <= MAX_SENSITIVITY_AXES:
+        raise ValueError(f"Sensitivity requires 1 to {MAX_SENSITIVITY_AXES} axes")
+    if len({axis.field for axis in axes}) != len(axes):
+        raise ValueError("Sensitivity axes must target distinct inputs")
+    unknown = sorted((set(base_inputs) | {axis.field for axis in axes}) - set(BOE_INPUT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown BOE inputs: {', '.join(unknown)}")
+    for axis in axes:
+        if not 2 <= axis.steps <= MAX_SENSITIVITY_STEPS:
+            raise ValueError(f"Axis {axis.field} steps must be between 2 and {MAX_SENSITIVITY_STEPS}")
+
+
+def _nullable(values: np.ndarray) -> list:
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def build_sensitivity_grid(
+    base_inputs: Mapping[str, Any],
+    axes: Sequence[SensitivityAxis],
+    profile: ThresholdProfile | None = None,
+) -> dict[str, Any]:
+    _validate_axes(base_inputs, axes)
+    rules, quorum = (profile.rules, profile.quorum_required) if profile else (BOE_RULES, None)
+
+    # Each axis gets its own dimension so numpy broadcasting produces the full cartesian grid in one pass.
+    columns: dict[str, Any] = dict(base_inputs)
+    for dim, axis in enumerate(axes):
+        shape = [1] * len(axes)
+        shape[dim] = axis.steps
+        columns[axis.field] = axis.values().reshape(shape)
+    grid = calculate_boe_batch(columns, rules, quorum)
+
+    status_labels = np.array([s.value for s in STATUS_CODES], dtype=object)
+    base_output, _, base_decision = calculate_boe(BOEInput(**base_inputs), rules, quorum)
+
+    # Tornado bars: swing each axis to its endpoints while every other input stays at base.
+    swings = [{**base_inputs, axis.field: value} for axis in axes for value in (axis.start, axis.stop)]
+    tornado_batch = calculate_boe_batch(boe_input_columns(swings), rules, quorum)
+    low_high = tornado_batch.outputs["boe_max_bid"].reshape(len(axes), 2)
+    tornado = []
+    for axis, (low, high) in zip(axes, low_high):
+        spread = abs(high - low)
+        tornado.append(
+            {
+                "field": axis.field,
+                "low": axis.start,
+                "high": axis.stop,
+                "max_bid_low": None if np.isnan(low) else float(low),
+                "max_bid_high": None if np.isnan(high) else float(high),
+                "spread": None if np.isnan(spread) else float(spread),
+            }
+        )
+    tornado.sort(key=lambda bar: -1.0 if bar["spread"] is None else bar["spread"], reverse=True)
+
+    return {
+        "threshold_profile_version": profile.version if profile else None,
+        "axes": [{"field": axis.field, "values": axis.values().tolist()} for axis in axes],
+        "base": {"boe_max_bid": base_output.boe_max_bid, "status": base_decision.status.value},
+        "max_bid": _nullable(grid.outputs["boe_max_bid"]),
+        "binding_constraint": grid.binding_constraint.tolist(),
+        "gate_status": status_labels[grid.status].tolist(),
+        "tornado": tornado,
+    }
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping
+
+import numpy as np
+
+from app.boe.engine import (
+    BOE_INPUT_FIELDS,
+    PASSING_RESULTS,
+    RESULT_CODES,
+    STATUS_CODES,
+    TARGET_CAPEX_MULTIPLE,
+    TARGET_COC,
+    BOE_RULES,
+    GateStatus,
+    calculate_boe_batch,
+)
+from app.boe.profiles import ThresholdProfile
+
+SCAN_POINTS = 513
+BISECT_ITERATIONS = 64
+BRACKET_SCALE = 4.0
+SOLVER_CACHE_SIZE = 1024
+MERGE_TOLERANCE = 1e-9
+
+_PASSING_CODES = tuple(RESULT_CODES.index(result) for result in PASSING_RESULTS)
+_ADVANCE = STATUS_CODES.index(GateStatus.ADVANCE)
+_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def solver_input_hash(
+    inputs: Mapping[str, Any], field: str, low: float, high: float, profile: ThresholdProfile | None = None
+) -> str:
+    raw = json.dumps(
+        {
+            "inputs": dict(inputs),
+            "field": field,
+            "bracket": [low, high],
+            "profile": profile.fingerprint if profile else None,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _f(v: Any) -> float | None:
+    try:
+        return None if v is None else float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _evaluate(
+    inputs: Mapping[str, Any], field: str, values: np.ndarray, profile: ThresholdProfile | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-test passing flags (tests x values) and status codes at each value."""
+    if profile is None:
+        batch = calculate_boe_batch({**inputs, field: values})
+    else:
+        batch = calculate_boe_batch({**inputs, field: values}, profile.rules, profile.quorum_required)
+    passing = np.stack([np.isin(batch.results[rule.key], _PASSING_CODES) for rule in batch.rules])
+    return passing, batch.status
+
+
+def _asking_price_boundaries(inputs: Mapping[str, Any]) -> list[float] | None:
+    # With explicit market/exit caps every test is a monotone ratio in asking price, so the flip
+    # points follow directly from the engine formulas. Without them the caps themselves depend on
+    # the price and the root finder takes over.
+    market_cap = _f(inputs.get("market_cap_rate"))
+    if market_cap is None:
+        return None
+    exit_cap = _f(inputs.get("y1_exit_cap_rate"))
+    exit_cap = market_cap if exit_cap is None else exit_cap
+    noi = _f(inputs.get("y1_noi"))
+    if noi is None:
+        gross, opex = _f(inputs.get("gross_income")), _f(inputs.get("operating_expenses"))
+        if gross is None or opex is None:
+            return None
+        noi = gross - opex
+
+    soft = 1 + (_f(inputs.get("soft_cost_pct")) or 0.0)
+    capex = _f(inputs.get("capex_budget")) or 0.0
+    reserves = _f(inputs.get("reserves")) or 0.0
+    ltc = _f(inputs.get("ltc")) or 0.0
+    rate = _f(inputs.get("interest_rate")) or 0.0
+    seller_noi = _f(inputs.get("seller_noi_from_om"))
+    if soft == 0:
+        return None
+
+    def price_for_project_cost(total_cost: float) -> float:
+        return (total_cost - capex - reserves) / soft
+
+    boundaries = [price_for_project_cost(noi / (exit_cap + 0.01))] if exit_cap + 0.01 != 0 else []
+    if capex > 0 and exit_cap != 0:
+        boundaries.append(noi / exit_cap - TARGET_CAPEX_MULTIPLE * capex)
+    # Zero-rate (e.g. all-cash) deals still have a cash-on-cash flip; only the debt terms need a rate.
+    coeff = rate * ltc + TARGET_COC * (1 - ltc)
+    if coeff > 0:
+        boundaries.append(price_for_project_cost(noi / coeff))
+    if rate:
+        boundaries.append(price_for_project_cost(noi / rate))
+        if ltc:
+            boundaries.append(price_for_project_cost(noi / (1.15 * ltc * rate)))
+    if seller_noi and market_cap > 0:
+        boundaries.append(seller_noi / market_cap)
+    return boundaries
+
+
+def _merge_close(boundaries: list[tuple[int, float]]) -> list[tuple[int, float]]:
+    """Snap flips that differ only by float noise onto one value and drop per-test duplicates."""
+    merged: list[float] = []
+    for value in sorted(value for _, value in boundaries):
+        if not merged or abs(value - merged[-1]) > MERGE_TOLERANCE * max(abs(value), 1.0):
+            merged.append(value)
+    snapped = set()
+    for test, value in boundaries:
+        snapped.add((test, min(merged, key=lambda m: abs(m - value))))
+    return sorted(snapped, key=lambda item: (item[1], item[0]))
+
+
+def _scan_boundaries(
+    inputs: Mapping[str, Any], field: str, low: float, high: float, profile: ThresholdProfile | None
+) -> list[tuple[int, float]]:
+    xs = np.linspace(low, high, SCAN_POINTS)
+    passing, _ = _evaluate(inputs, field, xs, profile)
+    test_index, left = np.nonzero(passing[:, :-1] != passing[:, 1:])
+    if not test_index.size:
+        return []
+
+    # Bisect every bracketed sign change at once: one batch call per iteration.
+    a, b = xs[left], xs[left + 1]
+    left_state = passing[test_index, left]
+    columns = np.arange(test_index.size)
+    for _ in range(BISECT_ITERATIONS):
+        mid = (a + b) / 2
+        mid_passing, _ = _evaluate(inputs, field, mid, profile)
+        same = mid_passing[test_index, columns] == left_state
+        a = np.where(same, mid, a)
+        b = np.where(same, b, mid)
+    return list(zip(test_index.tolist(), ((a + b) / 2).tolist()))
+
+
+def _confirmed_boundaries(
+    inputs: Mapping[str, Any], field: str, candidates: list[float], low: float, high: float, profile: ThresholdProfile | None
+) -> list[tuple[int, float]]:
+    points = np.array(sorted({c for c in candidates if low < c < high}))
+    if not points.size:
+        return []
+    eps = np.maximum(np.abs(points), 1.0) * MERGE_TOLERANCE
+    below, _ = _evaluate(inputs, field, points - eps, profile)
+    above, _ = _evaluate(inputs, field, points + eps, profile)
+    test_index, point_index = np.nonzero(below != above)
+    return list(zip(test_index.tolist(), points[point_index].tolist()))
+
+
+def _nearest(values: list[float], current: float | None) -> float | None:
+    if not values:
+        return None
+    if current is None:
+        return values[0]
+    return min(values, key=lambda v: abs(v - current))
+
+
+def _solve(
+    inputs: Mapping[str, Any], field: str, low: float, high: float, profile: ThresholdProfile | None
+) -> dict[str, Any]:
+    # The closed forms encode the default thresholds; custom profiles go through the root finder.
+    closed_form = field == "asking_price" and (profile is None or not profile.overrides)
+    candidates = _asking_price_boundaries(inputs) if closed_form else None
+    if candidates is not None:
+        method = "closed_form"
+        boundaries = _confirmed_boundaries(inputs, field, candidates, low, high, profile)
+    else:
+        method = "root_finding"
+        boundaries = _scan_boundaries(inputs, field, low, high, profile)
+    boundaries = _merge_close(boundaries)
+
+    current = _f(inputs.get(field))
+    current_passing, current_status = (None, None)
+    if current is not None:
+        current_passing, current_status = _evaluate(inputs, field, np.array([current]), profile)
+
+    tests = {}
+    for index, rule in enumerate(profile.rules if profile else BOE_RULES):
+        flips = sorted(value for test, value in boundaries if test == index)
+        tests[rule.key] = {
+            "flips": flips,
+            "flip_value": _nearest(flips, current),
+            "passing_at_current": None if current_passing is None else bool(current_passing[index, 0]),
+        }
+
+    # Gate status only changes where some test flips, so one engine call over the segments between
+    # breakpoints recovers every status transition in the bracket.
+    breakpoints = sorted({value for _, value in boundaries})
+    edges = np.array([low, *breakpoints, high])
+    _, segment_status = _evaluate(inputs, field, (edges[:-1] + edges[1:]) / 2, profile)
+    transitions = []
+    gate_flips = []
+    for value, before, after in zip(breakpoints, segment_status[:-1], segment_status[1:]):
+        if before == after:
+            continue
+        transitions.append({"value": value, "from": STATUS_CODES[before].value, "to": STATUS_CODES[after].value})
+        if _ADVANCE in (before, after):
+            gate_flips.append(value)
+
+    return {
+        "field": field,
+        "bracket": [low, high],
+        "method": method,
+        "current_value": current,
+        "current_status": None if current_status is None else STATUS_CODES[int(current_status[0])].value,
+        "flip_value": _nearest(gate_flips, current),
+        "transitions": transitions,
+        "tests": tests,
+    }
+
+
+def solve_gate_flip(
+    inputs: Mapping[str, Any],
+    field: str = "asking_price",
+    low: float | None = None,
+    high: float | None = None,
+    profile: ThresholdProfile | None = None,
+) -> dict[str, Any]:
+    """Find the values of ``field`` inside ``[low, high]`` where each test and the gate status flip.
+
+    The bracket defaults to ``[0, 4 * current]``. Results are memoised per input hash.
+    """
+    if field not in BOE_INPUT_FIELDS:
+        raise ValueError(f"Unknown BOE input: {field}")
+    unknown = sorted(set(inputs) - set(BOE_INPUT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown BOE inputs: {', '.join(unknown)}")
+    current = _f(inputs.get(field))
+    if low is None or high is None:
+        if not current:
+            raise ValueError(f"A bracket is required when {field} is missing or zero")
+        low = min(0.0, current * BRACKET_SCALE) if low is None else low
+        high = max(0.0, current * BRACKET_SCALE) if high is None else high
+    if not low < high:
+        raise ValueError("Solver bracket must satisfy low < high")
+
+    key = solver_input_hash(inputs, field, low, high, profile)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+    result = {
+        "input_hash": key,
+        "threshold_profile_version": profile.version if profile else None,
+        **_solve(inputs, field, float(low), float(high), profile),
+    }
+    with _cache_lock:
+        _cache[key] = result
+        if len(_cache) > SOLVER_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return copy.deepcopy(result)
@@ -8,6 +8,7 @@ from app.services.comps.normalize import (
     unit_type_from_beds,
 )
 from app.services.comps.rollups import compute_rollups, compute_subject_variance, percentile
+from app.services.comps.streaming import CompRowStream
 
 __all__ = [
     "NormalizedCompRow",
@@ -22,4 +23,5 @@ __all__ = [
     "percentile",
     "compute_rollups",
     "compute_subject_variance",
+    "CompRowStream",
 ]
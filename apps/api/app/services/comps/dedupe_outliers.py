@@ -22,14 +22,31 @@ def dedupe_rows(rows: list[NormalizedCompRow]) -> list[NormalizedCompRow]:
     return list(by_key.values())
 
 
+def old_row_flags(row: NormalizedCompRow, max_age_days: int, today: date) -> dict:
+    if row.date_observed is None:
+        return {}
+    age_days = (today - row.date_observed).days
+    return {"old": True, "age_days": age_days} if age_days > max_age_days else {}
+
+
 def flag_old_rows(rows: list[NormalizedCompRow], max_age_days: int) -> None:
     now = date.today()
     for row in rows:
-        if row.date_observed is None:
-            continue
-        age_days = (now - row.date_observed).days
-        if age_days > max_age_days:
-            row.flags = {**row.flags, "old": True, "age_days": age_days}
+        flags = old_row_flags(row, max_age_days, now)
+        if flags:
+            row.flags = {**row.flags, **flags}
+
+
+def iqr_bounds(rent_values: list[float]) -> tuple[float, float] | None:
+    """Tukey fences ``(q1 - 1.5 IQR, q3 + 1.5 IQR)``; ``None`` below five values."""
+    if len(rent_values) < 5:
+        return None
+    q1 = percentile(rent_values, 0.25)
+    q3 = percentile(rent_values, 0.75)
+    if q1 is None or q3 is None:
+        return None
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
 
 
 def flag_outliers_iqr(rows: list[NormalizedCompRow]) -> None:
@@ -38,16 +55,10 @@ def flag_outliers_iqr(rows: list[NormalizedCompRow]) -> None:
         grouped.setdefault(row.unit_type, []).append(row)
 
     for unit_rows in grouped.values():
-        rent_values = [float(r.rent) for r in unit_rows if r.rent is not None]
-        if len(rent_values) < 5:
-            continue
-        q1 = percentile(rent_values, 0.25)
-        q3 = percentile(rent_values, 0.75)
-        if q1 is None or q3 is None:
+        bounds = iqr_bounds([float(r.rent) for r in unit_rows if r.rent is not None])
+        if bounds is None:
             continue
-        iqr = q3 - q1
-        lower = q1 - 1.5 * iqr
-        upper = q3 + 1.5 * iqr
+        lower, upper = bounds
         for row in unit_rows:
             if row.rent is None:
                 continue
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.bulk import BulkWriter
+from app.models.entities import CompListing, CompRollup, CompRun, CompSubject, CompSubjectVariance
+from app.models.enums import UnitType
+from app.services.comps.normalize import NormalizedCompRow
+from app.services.comps.rollups import compute_subject_variance
+
+
+def listing_writer(db: Session) -> BulkWriter:
+    return BulkWriter(db, CompListing, batch_size=settings.comp_insert_batch_size)
+
+
+def listing_values(run_id, row: NormalizedCompRow, row_id=None) -> dict:
+    return {
+        "id": row_id or uuid4(),
+        "comp_run_id": run_id,
+        "unit_type": row.unit_type,
+        "address": row.address,
+        "unit": row.unit,
+        "beds": row.beds,
+        "baths": row.baths,
+        "rent": row.rent,
+        "gross_rent": row.gross_rent,
+        "discount_premium": row.discount_premium,
+        "date_observed": row.date_observed,
+        "link": row.link,
+        "notes": row.notes,
+        "source_type": row.source_type,
+        "source_ref": row.source_ref,
+        "observed_at": row.observed_at,
+        "confidence_score": row.confidence_score,
+        "dedupe_key": row.dedupe_key,
+        "flags": row.flags,
+    }
+
+
+def write_aggregates(db: Session, run: CompRun, rollups: dict[UnitType, dict]) -> int:
+    """Bulk-write a run's rollups and its variance against the deal's subject rents; returns rows written."""
+    subjects = db.scalars(select(CompSubject).where(CompSubject.deal_id == run.deal_id)).all()
+    subject_map = {
+        s.unit_type: {"subject_rent": s.subject_rent, "subject_gross_rent": s.subject_gross_rent}
+        for s in subjects
+    }
+    variances = compute_subject_variance(rollups, subject_map)
+    written = BulkWriter(db, CompRollup).write(
+        {"comp_run_id": run.id, "unit_type": unit, **payload} for unit, payload in rollups.items()
+    )
+    written += BulkWriter(db, CompSubjectVariance).write(
+        {"comp_run_id": run.id, "unit_type": unit, **payload} for unit, payload in variances.items()
+    )
+    return written
@@ -20,6 +20,18 @@ def percentile(values: list[float], p: float) -> float | None:
     return ordered[low] * (1 - weight) + ordered[high] * weight
 
 
+def rollup_payload(rents: list[float], gross: list[float], disc: list[float], sample_size: int) -> dict:
+    return {
+        "avg_rent": sum(rents) / len(rents) if rents else None,
+        "avg_gross_rent": sum(gross) / len(gross) if gross else None,
+        "avg_discount_premium": sum(disc) / len(disc) if disc else None,
+        "median_rent": median(rents) if rents else None,
+        "p25_rent": percentile(rents, 0.25),
+        "p75_rent": percentile(rents, 0.75),
+        "sample_size": sample_size,
+    }
+
+
 def compute_rollups(rows: list[NormalizedCompRow]) -> dict[UnitType, dict]:
     grouped: dict[UnitType, list[NormalizedCompRow]] = {}
     for row in rows:
@@ -30,16 +42,7 @@ def compute_rollups(rows: list[NormalizedCompRow]) -> dict[UnitType, dict]:
         rents = [float(r.rent) for r in unit_rows if r.rent is not None]
         gross = [float(r.gross_rent) for r in unit_rows if r.gross_rent is not None]
         disc = [float(r.discount_premium) for r in unit_rows if r.discount_premium is not None]
-
-        result[unit] = {
-            "avg_rent": sum(rents) / len(rents) if rents else None,
-            "avg_gross_rent": sum(gross) / len(gross) if gross else None,
-            "avg_discount_premium": sum(disc) / len(disc) if disc else None,
-            "median_rent": median(rents) if rents else None,
-            "p25_rent": percentile(rents, 0.25),
-            "p75_rent": percentile(rents, 0.75),
-            "sample_size": len(unit_rows),
-        }
+        result[unit] = rollup_payload(rents, gross, disc, len(unit_rows))
     return result
 
 
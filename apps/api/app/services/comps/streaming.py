@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable
+from uuid import UUID, uuid4
+
+from app.models.enums import UnitType
+from app.services.comps.dedupe_outliers import iqr_bounds, old_row_flags
+from app.services.comps.normalize import NormalizedCompRow
+from app.services.comps.rollups import rollup_payload
+
+_UNIT_TYPES = list(UnitType)
+_NAN = float("nan")
+
+
+def _number(value) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _present(values: array, slots: Iterable[int]) -> list[float]:
+    return [v for v in (values[s] for s in slots) if not math.isnan(v)]
+
+
+@dataclass
+class StreamBatch:
+    inserts: list[tuple[UUID, NormalizedCompRow]] = field(default_factory=list)
+    deletes: list[UUID] = field(default_factory=list)
+    duplicates: list[UUID] = field(default_factory=list)
+
+
+class CompRowStream:
+    """Incremental ``dedupe_rows`` + ``flag_old_rows`` + rollup accumulators over a stream of rows.
+
+    Each surviving dedupe key owns one slot. Only the slot's id, confidence,
+    unit type and the three rent figures are kept (in flat arrays, ~60 bytes
+    per key plus the key digest); full rows live in ``pending`` until the
+    caller drains them. Rows that were already drained are corrected through
+    the batch's ``deletes`` (superseded by a more confident duplicate) and
+    ``duplicates`` (need the duplicate flag merged in).
+    """
+
+    def __init__(self, max_age_days: int, today: date | None = None):
+        self.max_age_days = max_age_days
+        self.today = today or date.today()
+        self.rows_seen = 0
+        self._slots: dict[bytes, int] = {}
+        self._ids = bytearray()
+        self._confidence = array("d")
+        self._unit = array("b")
+        self._rent = array("d")
+        self._gross = array("d")
+        self._discount = array("d")
+        self._pending: dict[int, tuple[UUID, NormalizedCompRow]] = {}
+        self._batch = StreamBatch()
+
+    def __len__(self) -> int:
+        return len(self._confidence)
+
+    @property
+    def backlog(self) -> int:
+        """Rows and corrections waiting for the next ``drain``."""
+        return len(self._pending) + len(self._batch.deletes) + len(self._batch.duplicates)
+
+    def _slot_id(self, slot: int) -> UUID:
+        return UUID(bytes=bytes(self._ids[slot * 16 : slot * 16 + 16]))
+
+    def _store(self, slot: int, row: NormalizedCompRow) -> None:
+        row_id = uuid4()
+        self._ids[slot * 16 : slot * 16 + 16] = row_id.bytes
+        self._confidence[slot] = row.confidence_score or 0.0
+        self._unit[slot] = _UNIT_TYPES.index(row.unit_type)
+        self._rent[slot] = _number(row.rent)
+        self._gross[slot] = _number(row.gross_rent)
+        self._discount[slot] = _number(row.discount_premium)
+        self._pending[slot] = (row_id, row)
+
+    def add(self, row: NormalizedCompRow) -> None:
+        self.rows_seen += 1
+        old = old_row_flags(row, self.max_age_days, self.today)
+        if old:
+            row.flags = {**row.flags, **old}
+
+        digest = hashlib.blake2b(row.dedupe_key.encode("utf-8"), digest_size=16).digest()
+        slot = self._slots.get(digest)
+        if slot is None:
+            slot = len(self._confidence)
+            self._slots[digest] = slot
+            self._ids.extend(bytes(16))
+            for values in (self._confidence, self._rent, self._gross, self._discount):
+                values.append(0.0)
+            self._unit.append(0)
+            self._store(slot, row)
+            return
+
+        if (row.confidence_score or 0.0) >= self._confidence[slot]:
+            row.flags = {**row.flags, "duplicate": True}
+            if self._pending.pop(slot, None) is None:
+                self._batch.deletes.append(self._slot_id(slot))
+            self._store(slot, row)
+        elif slot in self._pending:
+            existing = self._pending[slot][1]
+            existing.flags = {**existing.flags, "duplicate": True}
+        else:
+            self._batch.duplicates.append(self._slot_id(slot))
+
+    def drain(self) -> StreamBatch:
+        batch = self._batch
+        batch.inserts = list(self._pending.values())
+        self._pending = {}
+        self._batch = StreamBatch()
+        return batch
+
+    def _slots_by_unit(self) -> dict[UnitType, list[int]]:
+        grouped: dict[UnitType, list[int]] = {}
+        for slot, code in enumerate(self._unit):
+            grouped.setdefault(_UNIT_TYPES[code], []).append(slot)
+        return grouped
+
+    def rollups(self) -> dict[UnitType, dict]:
+        return {
+            unit: rollup_payload(
+                _present(self._rent, slots),
+                _present(self._gross, slots),
+                _present(self._discount, slots),
+                len(slots),
+            )
+            for unit, slots in self._slots_by_unit().items()
+        }
+
+    def outlier_bounds(self) -> dict[UnitType, tuple[float, float]]:
+        bounds = {}
+        for unit, slots in self._slots_by_unit().items():
+            unit_bounds = iqr_bounds(_present(self._rent, slots))
+            if unit_bounds is not None:
+                bounds[unit] = unit_bounds
+        return bounds
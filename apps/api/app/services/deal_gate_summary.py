@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.entities import BOERun, Deal, DealGateEvent, DealGateSummary
+from app.services.gate_counters import apply_counter_deltas, counter_deltas
+from app.services.gate_summary import compute_ic_score
+
+_COUNTED_COLUMNS = (
+    DealGateSummary.deal_id,
+    DealGateSummary.workspace_id,
+    DealGateSummary.effective_status,
+    DealGateSummary.has_override,
+    DealGateSummary.ic_score,
+    DealGateSummary.binding_constraint,
+)
+
+_UPSERT_COLUMNS = [
+    "workspace_id",
+    "latest_run_id",
+    "computed_status",
+    "effective_status",
+    "has_override",
+    "ic_score",
+    "pass_count",
+    "hard_veto_ok",
+    "binding_constraint",
+    "boe_max_bid",
+    "test_results",
+    "updated_at",
+]
+
+
+def gate_summary_row(
+    deal: Deal,
+    *,
+    latest_run_id=None,
+    binding_constraint: str | None = None,
+    outputs: dict | None = None,
+    tests: Iterable[tuple[str, str, str]] = (),
+    audit_trail_count: int = 0,
+) -> dict[str, Any]:
+    """Column values for ``deal``'s summary row; ``tests`` are ``(key, test_class, result)`` value triples.
+
+    Mirrors ``build_gate_summary`` so the read model and the per-deal payload agree.
+    """
+    tests = list(tests)
+    ic_score, _ = compute_ic_score((test_class, result) for _, test_class, result in tests)
+    return {
+        "deal_id": deal.id,
+        "workspace_id": deal.workspace_id,
+        "latest_run_id": latest_run_id,
+        "computed_status": deal.gate_status_computed.value if latest_run_id else "NO_RUN",
+        "effective_status": deal.gate_status.value,
+        "has_override": deal.gate_override_status is not None,
+        "ic_score": ic_score,
+        "pass_count": sum(1 for _, _, result in tests if result in {"PASS", "WARN"}),
+        "hard_veto_ok": all(result == "PASS" for _, test_class, result in tests if test_class == "hard"),
+        "binding_constraint": binding_constraint,
+        "boe_max_bid": outputs.get("boe_max_bid") if outputs else None,
+        "test_results": {key: result for key, _, result in tests},
+        "audit_trail_count": audit_trail_count,
+        "updated_at": datetime.now(timezone.utc),
+    }
+
+
+def record_gate_summaries(db: Session, rows: Sequence[dict[str, Any]], *, absolute: bool = False) -> None:
+    """Upsert summary rows in one statement and move the workspace counters by the difference.
+
+    ``audit_trail_count`` in ``rows`` is the number of gate events written alongside
+    the update and is added to the stored count, unless ``absolute`` replaces it.
+    """
+    if not rows:
+        return
+    # One multi-row INSERT .. ON CONFLICT may not touch a row twice, so repeat deals collapse to their last state.
+    merged: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        previous = merged.get(row["deal_id"])
+        if previous is not None and not absolute:
+            row = {**row, "audit_trail_count": previous["audit_trail_count"] + row["audit_trail_count"]}
+        merged[row["deal_id"]] = row
+    previous = db.execute(
+        select(*_COUNTED_COLUMNS).where(DealGateSummary.deal_id.in_(list(merged))).with_for_update()
+    ).all()
+    stmt = pg_insert(DealGateSummary)
+    values = {name: stmt.excluded[name] for name in _UPSERT_COLUMNS}
+    values["audit_trail_count"] = (
+        stmt.excluded.audit_trail_count
+        if absolute
+        else DealGateSummary.audit_trail_count + stmt.excluded.audit_trail_count
+    )
+    db.execute(stmt.on_conflict_do_update(index_elements=[DealGateSummary.deal_id], set_=values), list(merged.values()))
+    apply_counter_deltas(db, counter_deltas([row._mapping for row in previous], merged.values()))
+
+
+def record_gate_override(db: Session, deal: Deal, *, audit_events: int) -> None:
+    previous = db.execute(
+        select(*_COUNTED_COLUMNS).where(DealGateSummary.deal_id == deal.id).with_for_update()
+    ).first()
+    if previous is None:
+        return
+    current = {
+        **previous._mapping,
+        "effective_status": deal.gate_status.value,
+        "has_override": deal.gate_override_status is not None,
+    }
+    db.execute(
+        update(DealGateSummary)
+        .where(DealGateSummary.deal_id == deal.id)
+        .values(
+            effective_status=current["effective_status"],
+            has_override=current["has_override"],
+            audit_trail_count=DealGateSummary.audit_trail_count + audit_events,
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
+    apply_counter_deltas(db, counter_deltas([previous._mapping], [current]))
+
+
+def forget_gate_summary(db: Session, deal: Deal) -> None:
+    """Drop ``deal``'s row ahead of deleting the deal and take it out of the workspace counters."""
+    removed = db.execute(
+        delete(DealGateSummary).where(DealGateSummary.deal_id == deal.id).returning(*_COUNTED_COLUMNS)
+    ).all()
+    apply_counter_deltas(db, counter_deltas([row._mapping for row in removed], []))
+
+
+def rebuild_gate_summary(db: Session, deal: Deal) -> dict[str, Any]:
+    """Recompute one deal's row from its runs and events (backfill and repair path)."""
+    latest_run = db.scalar(
+        select(BOERun)
+        .options(selectinload(BOERun.tests))
+        .where(BOERun.deal_id == deal.id)
+        .order_by(BOERun.created_at.desc())
+    )
+    audit_trail_count = (
+        db.scalar(select(func.count()).select_from(DealGateEvent).where(DealGateEvent.deal_id == deal.id)) or 0
+    )
+    if latest_run is None:
+        return gate_summary_row(deal, audit_trail_count=int(audit_trail_count))
+    return gate_summary_row(
+        deal,
+        latest_run_id=latest_run.id,
+        binding_constraint=latest_run.binding_constraint,
+        outputs=latest_run.outputs,
+        tests=[(t.test_key, t.test_class.value, t.result.value) for t in latest_run.tests],
+        audit_trail_count=int(audit_trail_count),
+    )
+
+
+def load_gate_summaries(db: Session, workspace_ids: Sequence) -> list[DealGateSummary | dict[str, Any]]:
+    """Every deal's summary in the given workspaces with one indexed query.
+
+    Deals without a row (written before the read model existed and not yet
+    backfilled) are rebuilt in memory so the caller still sees every deal.
+    """
+    rows = db.execute(
+        select(Deal, DealGateSummary)
+        .outerjoin(DealGateSummary, DealGateSummary.deal_id == Deal.id)
+        .where(Deal.workspace_id.in_(list(workspace_ids)))
+        .order_by(Deal.created_at.desc())
+    ).all()
+    return [summary if summary is not None else rebuild_gate_summary(db, deal) for deal, summary in rows]
+
+
+def summary_record(summary: DealGateSummary | dict[str, Any]) -> dict[str, Any]:
+    """The subset of ``build_gate_summary`` fields the analytics payload builders read."""
+    get = summary.get if isinstance(summary, dict) else lambda name: getattr(summary, name)
+    return {
+        "deal_id": get("deal_id"),
+        "effective_status": get("effective_status"),
+        "has_override": get("has_override"),
+        "ic_score": get("ic_score"),
+        "audit_trail_count": get("audit_trail_count"),
+        "explainability": {"binding_constraint": get("binding_constraint"), "boe_max_bid": get("boe_max_bid")},
+    }
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.entities import Deal, WorkspaceGateCounter
+from app.models.enums import DealGateState, DealStatus
+from app.services.gate_counters import DEALS, STATUS
+from app.services.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+DEAL_PAGE_SIZE = 50
+DEAL_PAGE_MAX = 200
+COUNT_ESTIMATE_CAP = 10_000
+
+
+@dataclass(frozen=True)
+class DealFilters:
+    gate_status: DealStatus | None = None
+    current_gate_state: DealGateState | None = None
+    min_asking_price: Decimal | None = None
+    max_asking_price: Decimal | None = None
+    name_prefix: str | None = None
+
+
+def _filtered(stmt, workspace_id, filters: DealFilters):
+    stmt = stmt.where(Deal.workspace_id == workspace_id)
+    if filters.gate_status is not None:
+        stmt = stmt.where(Deal.gate_status == filters.gate_status)
+    if filters.current_gate_state is not None:
+        stmt = stmt.where(Deal.current_gate_state == filters.current_gate_state)
+    if filters.min_asking_price is not None:
+        stmt = stmt.where(Deal.asking_price >= filters.min_asking_price)
+    if filters.max_asking_price is not None:
+        stmt = stmt.where(Deal.asking_price <= filters.max_asking_price)
+    if filters.name_prefix:
+        stmt = stmt.where(Deal.name.startswith(filters.name_prefix, autoescape=True))
+    return stmt
+
+
+def estimate_deal_count(db: Session, workspace_id, filters: DealFilters) -> tuple[int, bool]:
+    """``(count, exact)`` without a full ``COUNT(*)``.
+
+    Unfiltered and status-only listings read the workspace gate counters; any other
+    filter counts at most ``COUNT_ESTIMATE_CAP`` matching index entries.
+    """
+    if filters == DealFilters() or filters == DealFilters(gate_status=filters.gate_status):
+        metric, bucket = (STATUS, filters.gate_status.value) if filters.gate_status else (DEALS, "")
+        value = db.scalar(
+            select(WorkspaceGateCounter.value).where(
+                WorkspaceGateCounter.workspace_id == workspace_id,
+                WorkspaceGateCounter.metric == metric,
+                WorkspaceGateCounter.bucket == bucket,
+            )
+        )
+        return int(value or 0), True
+    capped = _filtered(select(Deal.id), workspace_id, filters).limit(COUNT_ESTIMATE_CAP + 1).subquery()
+    count = int(db.scalar(select(func.count()).select_from(capped)) or 0)
+    return min(count, COUNT_ESTIMATE_CAP), count <= COUNT_ESTIMATE_CAP
+
+
+def list_deals_page(
+    db: Session,
+    workspace_id,
+    filters: DealFilters,
+    *,
+    cursor: str | None = None,
+    limit: int = DEAL_PAGE_SIZE,
+    include_total: bool = True,
+) -> dict[str, Any]:
+    """One page of the workspace's deals, newest first, keyset-paginated on ``(created_at, id)``."""
+    stmt = _filtered(select(Deal), workspace_id, filters)
+    if cursor:
+        stmt = stmt.where(tuple_(Deal.created_at, Deal.id) < decode_keyset_cursor(cursor))
+    rows = list(db.scalars(stmt.order_by(Deal.created_at.desc(), Deal.id.desc()).limit(limit + 1)).all())
+    items = rows[:limit]
+    total, exact = estimate_deal_count(db, workspace_id, filters) if include_total else (None, False)
+    return {
+        "items": items,
+        "next_cursor": encode_keyset_cursor(items[-1].created_at, items[-1].id) if len(rows) > limit else None,
+        "total_estimate": total,
+        "total_is_exact": exact,
+    }
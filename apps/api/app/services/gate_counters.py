@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import delete, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.entities import DealGateSummary, Workspace, WorkspaceGateCounter
+
+DEALS = "deals"
+STATUS = "status"
+OVERRIDES = "overrides"
+IC_SCORE_SUM = "ic_score_sum"
+BINDING = "binding"
+
+CounterKey = tuple[Any, str, str]
+
+
+def summary_contributions(summary: DealGateSummary | Mapping[str, Any]) -> Counter:
+    """What one summary row adds to its workspace's counters, keyed by ``(workspace_id, metric, bucket)``."""
+    get = summary.get if isinstance(summary, Mapping) else lambda name: getattr(summary, name)
+    workspace_id = get("workspace_id")
+    contributions = Counter({(workspace_id, DEALS, ""): 1, (workspace_id, STATUS, get("effective_status")): 1})
+    if get("has_override"):
+        contributions[(workspace_id, OVERRIDES, "")] += 1
+    contributions[(workspace_id, IC_SCORE_SUM, "")] += int(get("ic_score"))
+    if get("binding_constraint"):
+        contributions[(workspace_id, BINDING, get("binding_constraint"))] += 1
+    return contributions
+
+
+def counter_deltas(
+    before: Iterable[DealGateSummary | Mapping[str, Any]], after: Iterable[DealGateSummary | Mapping[str, Any]]
+) -> dict[CounterKey, int]:
+    deltas: Counter = Counter()
+    for summary in after:
+        deltas.update(summary_contributions(summary))
+    for summary in before:
+        deltas.subtract(summary_contributions(summary))
+    return {key: value for key, value in deltas.items() if value}
+
+
+def apply_counter_deltas(db: Session, deltas: dict[CounterKey, int]) -> None:
+    """Increment counters in one upsert; runs in the caller's transaction so counters commit with the gate change."""
+    if not deltas:
+        return
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"workspace_id": workspace_id, "metric": metric, "bucket": bucket, "value": value, "updated_at": now}
+        for (workspace_id, metric, bucket), value in sorted(deltas.items(), key=lambda item: tuple(map(str, item[0])))
+    ]
+    stmt = pg_insert(WorkspaceGateCounter)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[WorkspaceGateCounter.workspace_id, WorkspaceGateCounter.metric, WorkspaceGateCounter.bucket],
+            set_={"value": WorkspaceGateCounter.value + stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        ),
+        rows,
+    )
+
+
+def load_workspace_counters(db: Session, workspace_ids: Sequence) -> list[Any]:
+    return db.execute(
+        select(WorkspaceGateCounter.metric, WorkspaceGateCounter.bucket, func.sum(WorkspaceGateCounter.value))
+        .where(WorkspaceGateCounter.workspace_id.in_(list(workspace_ids)))
+        .group_by(WorkspaceGateCounter.metric, WorkspaceGateCounter.bucket)
+    ).all()
+
+
+def expected_counters(db: Session, workspace_id) -> dict[tuple[str, str], int]:
+    """The workspace's counters recomputed from ``deal_gate_summary`` with ``GROUP BY``."""
+    s = DealGateSummary
+    in_workspace = s.workspace_id == workspace_id
+    stmt = union_all(
+        select(literal(DEALS), literal(""), func.count()).where(in_workspace),
+        select(literal(STATUS), s.effective_status, func.count()).where(in_workspace).group_by(s.effective_status),
+        select(literal(OVERRIDES), literal(""), func.count()).where(in_workspace, s.has_override.is_(True)),
+        select(literal(IC_SCORE_SUM), literal(""), func.coalesce(func.sum(s.ic_score), 0)).where(in_workspace),
+        select(literal(BINDING), s.binding_constraint, func.count())
+        .where(in_workspace, s.binding_constraint.isnot(None), s.binding_constraint != "")
+        .group_by(s.binding_constraint),
+    )
+    return {(metric, bucket): int(value) for metric, bucket, value in db.execute(stmt).all() if value}
+
+
+def reconcile_workspace_counters(db: Session, workspace_id) -> list[dict[str, Any]]:
+    """Overwrite drifted counters with values recomputed from the summary rows.
+
+    The workspace's counter rows are locked first, so gate writers that already
+    incremented them finish before the recount and later ones add on top of it.
+    """
+    stored = {
+        (row.metric, row.bucket): int(row.value)
+        for row in db.scalars(
+            select(WorkspaceGateCounter).where(WorkspaceGateCounter.workspace_id == workspace_id).with_for_update()
+        ).all()
+    }
+    expected = expected_counters(db, workspace_id)
+    corrections = [
+        {
+            "workspace_id": str(workspace_id),
+            "metric": metric,
+            "bucket": bucket,
+            "stored": stored.get((metric, bucket), 0),
+            "expected": expected.get((metric, bucket), 0),
+        }
+        for metric, bucket in sorted(stored.keys() | expected.keys())
+        if stored.get((metric, bucket), 0) != expected.get((metric, bucket), 0)
+    ]
+    if not corrections:
+        return []
+    stale = [key for key in stored if key not in expected]
+    if stale:
+        db.execute(
+            delete(WorkspaceGateCounter).where(
+                WorkspaceGateCounter.workspace_id == workspace_id,
+                tuple_(WorkspaceGateCounter.metric, WorkspaceGateCounter.bucket).in_(stale),
+            )
+        )
+    if not expected:
+        return corrections
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(WorkspaceGateCounter)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[WorkspaceGateCounter.workspace_id, WorkspaceGateCounter.metric, WorkspaceGateCounter.bucket],
+            set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        ),
+        [
+            {"workspace_id": workspace_id, "metric": metric, "bucket": bucket, "value": value, "updated_at": now}
+            for (metric, bucket), value in sorted(expected.items())
+        ],
+    )
+    return corrections
+
+
+def reconcile_gate_counters(db: Session, workspace_ids: Sequence | None = None) -> dict[str, Any]:
+    """Check every workspace (or ``workspace_ids``), committing each repair separately."""
+    if workspace_ids is None:
+        workspace_ids = list(db.scalars(select(Workspace.id).order_by(Workspace.id)).all())
+    corrections: list[dict[str, Any]] = []
+    for workspace_id in workspace_ids:
+        corrections.extend(reconcile_workspace_counters(db, workspace_id))
+        db.commit()
+    return {
+        "workspaces_checked": len(workspace_ids),
+        "drifted_workspaces": len({c["workspace_id"] for c in corrections}),
+        "corrections": corrections,
+    }
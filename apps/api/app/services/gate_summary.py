@@ -37,9 +37,15 @@ def _test_keys_for(tests: list[BOETestResult], test_class: str | None = None, re
 
 
 def _compute_ic_score_from_tests(tests: list[BOETestResult]) -> tuple[int, dict]:
-    hard_fail_count = sum(1 for t in tests if t.test_class.value == "hard" and t.result.value == "FAIL")
-    soft_fail_count = sum(1 for t in tests if t.test_class.value == "soft" and t.result.value == "FAIL")
-    warn_count = sum(1 for t in tests if t.result.value == "WARN")
+    return compute_ic_score((t.test_class.value, t.result.value) for t in tests)
+
+
+def compute_ic_score(results: Iterable[tuple[str, str]]) -> tuple[int, dict]:
+    """Score from ``(test_class, result)`` value pairs."""
+    results = list(results)
+    hard_fail_count = sum(1 for test_class, result in results if test_class == "hard" and result == "FAIL")
+    soft_fail_count = sum(1 for test_class, result in results if test_class == "soft" and result == "FAIL")
+    warn_count = sum(1 for _, result in results if result == "WARN")
     hard_penalty = hard_fail_count * 25
     soft_penalty = soft_fail_count * 10
     warn_penalty = warn_count * 5
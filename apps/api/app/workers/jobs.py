@@ -2,17 +2,34 @@ from __future__ import annotations
 
 import hashlib
 import json
+import time
 from datetime import UTC, datetime
+from itertools import chain
+from typing import Iterable
 
-from sqlalchemy import delete, select
+from sqlalchemy import JSON, cast, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.connectors.registry import get_connectors
 from app.core.config import settings
-from app.db.session import SessionLocal
-from app.ingestors.files import parse_csv, parse_pdf, parse_xlsx
-from app.models.entities import CompListing, CompRollup, CompRun, CompSubject, CompSubjectVariance
-from app.models.enums import CompRunStatus
-from app.services.comps import compute_rollups, compute_subject_variance, dedupe_rows, flag_old_rows, flag_outliers_iqr
+from app.db.bulk import BulkWriter
+from app.db.session import WorkerSessionLocal
+from app.ingestors.files import iter_csv_chunks, iter_pdf_pages, parse_xlsx
+from app.models.entities import (
+    BOERegateJob,
+    CompListing,
+    CompRollup,
+    CompRun,
+    CompSubjectVariance,
+    Document,
+    DocumentSpan,
+)
+from app.models.enums import BOERegateStatus, CompRunStatus
+from app.services.boe_regate import run_regate_job
+from app.services.comps import CompRowStream
+from app.services.comps.persistence import listing_values, listing_writer, write_aggregates
+from app.services.comps.streaming import StreamBatch
+from app.services.gate_counters import reconcile_gate_counters
 from app.workers.queue import get_redis
 
 
@@ -22,80 +39,100 @@ def _cache_key(connector_id: str, filters: dict) -> str:
     return f"comp_cache:{digest}"
 
 
-def _persist_rows_and_aggregates(db, run: CompRun, rows, parse_report: dict | None = None):
-    rows = dedupe_rows(rows)
-    flag_outliers_iqr(rows)
-    flag_old_rows(rows, settings.comp_old_days_threshold)
+def _merged_flags(db, patch: dict):
+    # comp_listings.flags is plain JSON; merge server-side so already-flushed rows never round-trip.
+    payload = json.dumps(patch)
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(cast(CompListing.flags, JSONB).op("||")(cast(literal(payload), JSONB)), JSON)
+    return func.json_patch(CompListing.flags, payload)
+
+
+def _flush_listings(db, run: CompRun, batch: StreamBatch, writer: BulkWriter) -> None:
+    no_sync = {"synchronize_session": False}
+    if batch.deletes:
+        db.execute(delete(CompListing).where(CompListing.id.in_(batch.deletes)), execution_options=no_sync)
+    if batch.inserts:
+        writer.write(listing_values(run.id, row, row_id) for row_id, row in batch.inserts)
+    if batch.duplicates:
+        db.execute(
+            update(CompListing)
+            .where(CompListing.id.in_(batch.duplicates))
+            .values(flags=_merged_flags(db, {"duplicate": True})),
+            execution_options=no_sync,
+        )
+
 
+def _persist_rows_and_aggregates(db, run: CompRun, rows: Iterable, parse_report: dict | None = None):
+    """Dedupe, flag and store ``rows`` as they arrive, flushing every ``comp_ingest_flush_size`` rows.
+
+    ``rows`` may be a generator over a file far larger than memory; only the
+    dedupe index and per-listing rent figures are held until the run finishes.
+    """
     db.execute(delete(CompListing).where(CompListing.comp_run_id == run.id))
     db.execute(delete(CompRollup).where(CompRollup.comp_run_id == run.id))
     db.execute(delete(CompSubjectVariance).where(CompSubjectVariance.comp_run_id == run.id))
 
+    started = time.perf_counter()
+    writer = listing_writer(db)
+    stream = CompRowStream(settings.comp_old_days_threshold)
     for row in rows:
-        db.add(
-            CompListing(
-                comp_run_id=run.id,
-                unit_type=row.unit_type,
-                address=row.address,
-                unit=row.unit,
-                beds=row.beds,
-                baths=row.baths,
-                rent=row.rent,
-                gross_rent=row.gross_rent,
-                discount_premium=row.discount_premium,
-                date_observed=row.date_observed,
-                link=row.link,
-                notes=row.notes,
-                source_type=row.source_type,
-                source_ref=row.source_ref,
-                observed_at=row.observed_at,
-                confidence_score=row.confidence_score,
-                dedupe_key=row.dedupe_key,
-                flags=row.flags,
-            )
-        )
-
-    rollups = compute_rollups(rows)
-    for unit, payload in rollups.items():
-        db.add(
-            CompRollup(
-                comp_run_id=run.id,
-                unit_type=unit,
-                avg_rent=payload["avg_rent"],
-                avg_gross_rent=payload["avg_gross_rent"],
-                avg_discount_premium=payload["avg_discount_premium"],
-                median_rent=payload["median_rent"],
-                p25_rent=payload["p25_rent"],
-                p75_rent=payload["p75_rent"],
-                sample_size=payload["sample_size"],
+        stream.add(row)
+        if stream.backlog >= settings.comp_ingest_flush_size:
+            _flush_listings(db, run, stream.drain(), writer)
+    _flush_listings(db, run, stream.drain(), writer)
+
+    for unit, (lower, upper) in stream.outlier_bounds().items():
+        db.execute(
+            update(CompListing)
+            .where(
+                CompListing.comp_run_id == run.id,
+                CompListing.unit_type == unit,
+                or_(CompListing.rent < lower, CompListing.rent > upper),
             )
+            .values(flags=_merged_flags(db, {"outlier": True})),
+            execution_options={"synchronize_session": False},
         )
 
-    subjects = db.scalars(select(CompSubject).where(CompSubject.deal_id == run.deal_id)).all()
-    subject_map = {
-        s.unit_type: {"subject_rent": s.subject_rent, "subject_gross_rent": s.subject_gross_rent}
-        for s in subjects
+    aggregate_rows = write_aggregates(db, run, stream.rollups())
+
+    # Parsing is streamed into the same loop, so "seconds" covers parse + write while "write" is COPY/INSERT time alone.
+    elapsed = time.perf_counter() - started
+    parse_report = parse_report if parse_report is not None else {}
+    parse_report["persist"] = {
+        "listings": len(stream),
+        "aggregate_rows": aggregate_rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_second": round(stream.rows_seen / elapsed) if elapsed else None,
+        "write": writer.report(),
     }
-    variances = compute_subject_variance(rollups, subject_map)
-    for unit, payload in variances.items():
-        db.add(
-            CompSubjectVariance(
-                comp_run_id=run.id,
-                unit_type=unit,
-                variance_net=payload["variance_net"],
-                variance_gross=payload["variance_gross"],
-                basis=payload["basis"],
-                computed_at=payload["computed_at"],
-            )
-        )
-
     run.parse_report = parse_report
     run.status = CompRunStatus.SUCCEEDED
     run.finished_at = datetime.now(UTC)
 
 
+def _comp_document(db, run: CompRun, file_path: str) -> Document:
+    document = db.scalar(select(Document).where(Document.deal_id == run.deal_id, Document.file_key == file_path))
+    if document is None:
+        document = Document(deal_id=run.deal_id, file_key=file_path, doc_type="comp_pdf", uploaded_by=run.created_by)
+        db.add(document)
+        db.flush()
+    else:
+        db.execute(delete(DocumentSpan).where(DocumentSpan.document_id == document.id))
+    return document
+
+
+def _pdf_rows(db, run: CompRun, file_path: str, report: dict):
+    """Record each page's cell spans as the page arrives and hand its rows straight to persistence."""
+    document = _comp_document(db, run, file_path)
+    report["document_id"] = str(document.id)
+    spans = BulkWriter(db, DocumentSpan, batch_size=settings.comp_insert_batch_size)
+    for page in iter_pdf_pages(file_path, settings.comp_pdf_workers, report):
+        spans.write({"document_id": document.id, **span} for span in page.spans)
+        yield from page.rows
+
+
 def process_private_file_run(comp_run_id: str, file_path: str, file_type: str):
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
         run = db.scalar(select(CompRun).where(CompRun.id == comp_run_id))
         if not run:
@@ -105,11 +142,20 @@ def process_private_file_run(comp_run_id: str, file_path: str, file_type: str):
 
         normalized_type = file_type.lower().strip()
         if normalized_type == "csv":
-            rows, report = parse_csv(file_path)
+            report = {}
+            rows = chain.from_iterable(
+                iter_csv_chunks(file_path, settings.comp_ingest_chunk_size, report, settings.comp_ingest_columnar)
+            )
         elif normalized_type == "xlsx":
-            rows, report = parse_xlsx(file_path)
+            rows, report = parse_xlsx(
+                file_path,
+                settings.comp_ingest_columnar,
+                backend=settings.comp_xlsx_backend,
+                workers=settings.comp_xlsx_workers,
+            )
         elif normalized_type == "pdf":
-            rows, report = parse_pdf(file_path)
+            report = {}
+            rows = _pdf_rows(db, run, file_path, report)
         else:
             rows, report = [], {"error": f"Unsupported file type: {file_type}"}
 
@@ -128,7 +174,7 @@ def process_private_file_run(comp_run_id: str, file_path: str, file_type: str):
 
 
 def process_public_connector_run(comp_run_id: str, connector_ids: list[str], filters: dict):
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     redis = get_redis()
     try:
         run = db.scalar(select(CompRun).where(CompRun.id == comp_run_id))
@@ -173,3 +219,31 @@ def process_public_connector_run(comp_run_id: str, connector_ids: list[str], fil
         raise
     finally:
         db.close()
+
+
+def process_boe_regate_job(job_id: str):
+    db = WorkerSessionLocal()
+    try:
+        job = db.scalar(select(BOERegateJob).where(BOERegateJob.id == job_id))
+        if not job:
+            return
+        run_regate_job(db, job)
+    except Exception as exc:  # pragma: no cover
+        db.rollback()
+        job = db.scalar(select(BOERegateJob).where(BOERegateJob.id == job_id))
+        if job:
+            job.status = BOERegateStatus.FAILED
+            job.error = str(exc)
+            job.finished_at = datetime.now(UTC)
+            db.commit()
+        raise
+    finally:
+        db.close()
+
+
+def process_gate_counter_reconciliation(workspace_ids: list[str] | None = None):
+    db = WorkerSessionLocal()
+    try:
+        return reconcile_gate_counters(db, workspace_ids)
+    finally:
+        db.close()
@@ -10,3 +10,7 @@ def get_redis() -> Redis:
 
 def get_comp_queue() -> Queue:
     return Queue("comp_ingest", connection=get_redis())
+
+
+def get_boe_queue() -> Queue:
+    return Queue("boe_regate", connection=get_redis(), default_timeout=settings.boe_regate_job_timeout_seconds)
@@ -6,7 +6,7 @@ from app.workers.queue import get_redis
 def run_worker():
     redis = get_redis()
     with Connection(redis):
-        worker = Worker(["comp_ingest"])
+        worker = Worker(["comp_ingest", "boe_regate"])
         worker.work()
 
 
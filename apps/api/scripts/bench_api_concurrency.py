@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Closed-loop load test of the read-heavy endpoints against a running API. "
+            "Run it once per build (sync handlers vs async handlers) and compare requests/sec."
+        )
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True, help="Bearer token for a user who can see the ids below")
+    parser.add_argument("--workspace-id", required=True)
+    parser.add_argument("--deal-id", required=True)
+    parser.add_argument("--comp-run-id", help="Include the comp listings endpoint for this run")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds per endpoint")
+    return parser.parse_args()
+
+
+def endpoints(args: argparse.Namespace) -> dict[str, str]:
+    paths = {
+        "list_deals": f"/v1/deals/workspace/{args.workspace_id}",
+        "gate_summary": f"/v1/deals/{args.deal_id}/gate_summary",
+        "portfolio_summary": "/v1/portfolio/summary",
+    }
+    if args.comp_run_id:
+        paths["comp_listings"] = f"/v1/deals/{args.deal_id}/comps/runs/{args.comp_run_id}/listings"
+    return paths
+
+
+async def hammer(client: httpx.AsyncClient, path: str, concurrency: int, duration: float) -> dict[str, float]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+        "errors": errors,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {args.token}"},
+        limits=limits,
+        timeout=30.0,
+    ) as client:
+        return {
+            name: await hammer(client, path, args.concurrency, args.duration)
+            for name, path in endpoints(args).items()
+        }
+
+
+def main() -> None:
+    args = parse_args()
+    print(json.dumps({"concurrency": args.concurrency, "endpoints": asyncio.run(run(args))}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from types import SimpleNamespace
+
+from app.core import tokens
+from app.core.config import settings
+from app.core.security import create_access_token
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time the per-request authentication path: token verification and the current-user lookup."
+    )
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument(
+        "--with-db",
+        action="store_true",
+        help="Also time get_current_user against DATABASE_URL, using the first user row",
+    )
+    return parser.parse_args()
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def bench_tokens(iterations: int) -> dict[str, float]:
+    token = create_access_token("00000000-0000-0000-0000-000000000001")
+    results = {}
+    configured = settings.jwt_verifier
+    for verifier in ("jose", "hmac"):
+        settings.jwt_verifier = verifier
+
+        def uncached():
+            tokens.token_cache.clear()
+            tokens.decode_access_token(token)
+
+        results[f"{verifier}_uncached_us"] = _per_call_us(uncached, iterations)
+    settings.jwt_verifier = configured
+    tokens.token_cache.clear()
+    tokens.decode_access_token(token)
+    results["cached_us"] = _per_call_us(lambda: tokens.decode_access_token(token), iterations)
+    return results
+
+
+def bench_current_user(iterations: int) -> dict[str, float]:
+    from sqlalchemy import select
+
+    from app.api.deps import get_current_user
+    from app.db.session import SessionLocal
+    from app.models.entities import User
+    from app.services.access import invalidate_user
+
+    db = SessionLocal()
+    try:
+        user_id = db.scalar(select(User.id).limit(1))
+        if user_id is None:
+            raise SystemExit("No users in the database; register one first.")
+        creds = SimpleNamespace(credentials=create_access_token(str(user_id)))
+
+        def cold():
+            tokens.token_cache.clear()
+            invalidate_user(user_id)
+            get_current_user(creds, db)
+            db.expunge_all()
+
+        def warm():
+            get_current_user(creds, db)
+            db.expunge_all()
+
+        return {"current_user_cold_us": _per_call_us(cold, iterations), "current_user_warm_us": _per_call_us(warm, iterations)}
+    finally:
+        db.close()
+
+
+def main() -> None:
+    args = parse_args()
+    report = bench_tokens(args.iterations)
+    if args.with_db:
+        report.update(bench_current_user(max(1, args.iterations // 20)))
+    print(json.dumps({key: round(value, 2) for key, value in report.items()}))
+
+
+if __name__ == "__main__":
+    main()
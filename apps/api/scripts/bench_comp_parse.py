@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app.ingestors.files import parse_csv
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare row-by-row and columnar CSV comp parsing on a synthetic broker export.")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def write_export(path: str, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Address", "Unit", "Beds", "Baths", "Rent", "Gross Rent", "Date Rented", "Link", "Notes"])
+        for i in range(rows):
+            rent = rng.randrange(1800, 6500, 25)
+            writer.writerow(
+                [
+                    f"{rng.randrange(1, 400)} {rng.choice(['Main St', 'Oak Ave', 'Elm St', 'Pine Rd'])}",
+                    f"{rng.randrange(1, 12)}{rng.choice('ABCD')}",
+                    rng.choice([0, 1, 1, 2, 2, 3, 4]),
+                    rng.choice([1, 1, 1.5, 2]),
+                    rent,
+                    rent + rng.randrange(0, 400, 25),
+                    (start + timedelta(days=rng.randrange(0, 540))).isoformat(),
+                    "",
+                    "" if i % 5 else "broker sheet",
+                ]
+            )
+
+
+def _timed(path: str, use_columnar: bool) -> tuple[float, int]:
+    started = time.perf_counter()
+    rows, _report = parse_csv(path, use_columnar=use_columnar)
+    return time.perf_counter() - started, len(rows)
+
+
+def main() -> None:
+    args = parse_args()
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_export(path, args.rows, args.seed)
+        results = {"rows": args.rows}
+        for mode, use_columnar in (("row", False), ("columnar", True)):
+            seconds, parsed = _timed(path, use_columnar)
+            results[f"{mode}_seconds"] = round(seconds, 3)
+            results[f"{mode}_rows_per_second"] = round(parsed / seconds)
+        results["speedup"] = round(results["row_seconds"] / results["columnar_seconds"], 2)
+        print(json.dumps(results, indent=2))
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from app.db.session import WorkerSessionLocal
+from app.services.gate_counters import reconcile_gate_counters
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recount workspace gate counters from deal_gate_summary and repair any drift (run from cron)."
+    )
+    parser.add_argument("--workspace-id", action="append", help="Limit the check to these workspaces (repeatable)")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when drift was found and repaired")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    db = WorkerSessionLocal()
+    try:
+        report = reconcile_gate_counters(db, args.workspace_id)
+    finally:
+        db.close()
+    print(json.dumps(report, default=str))
+    if args.check and report["corrections"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import WorkerSessionLocal
+from app.models.entities import BOERegateJob
+from app.models.enums import BOERegateStatus
+from app.services.boe_regate import REGATE_REASON, regate_progress, run_regate_job
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-gate every deal's latest BOE run under the current rules.")
+    parser.add_argument("--user-id", help="User recorded as the author of the new BOE runs")
+    parser.add_argument("--workspace-id", help="Limit the backfill to one workspace (default: all workspaces)")
+    parser.add_argument("--resume", metavar="JOB_ID", help="Continue a failed or interrupted job from its checkpoint")
+    parser.add_argument("--chunk-size", type=int, default=settings.boe_regate_chunk_size)
+    parser.add_argument("--reason", default=REGATE_REASON)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    db = WorkerSessionLocal()
+    try:
+        if args.resume:
+            job = db.scalar(select(BOERegateJob).where(BOERegateJob.id == args.resume))
+            if not job:
+                raise SystemExit(f"Re-gate job not found: {args.resume}")
+        else:
+            if not args.user_id:
+                raise SystemExit("--user-id is required when starting a new re-gate job")
+            job = BOERegateJob(
+                workspace_id=args.workspace_id,
+                status=BOERegateStatus.QUEUED,
+                reason=args.reason,
+                chunk_size=args.chunk_size,
+                processed=0,
+                failed=0,
+                transitions=0,
+                elapsed_seconds=0.0,
+                created_by=args.user_id,
+            )
+            db.add(job)
+            db.commit()
+        print(f"Re-gate job {job.id}")
+        try:
+            run_regate_job(db, job, on_progress=lambda progress: print(json.dumps(progress, default=str)))
+        except Exception as exc:
+            db.rollback()
+            job.status = BOERegateStatus.FAILED
+            job.error = str(exc)
+            db.commit()
+            raise SystemExit(f"Re-gate job {job.id} failed; resume with --resume {job.id}: {exc}") from exc
+        print(json.dumps(regate_progress(job), default=str))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
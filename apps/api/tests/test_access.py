@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import get_deal_with_access, require_workspace_member
+from app.models.enums import MemberRole
+from app.services import access
+
+
+class FakeDB:
+    def __init__(self, rows=(), members=()):
+        self.rows = list(rows)
+        self.members = list(members)
+        self.statements = []
+        self.info = {}
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        row = self.rows.pop(0)
+        return SimpleNamespace(first=lambda: row)
+
+    def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.members.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    access.invalidate_membership()
+    yield
+    access.invalidate_membership()
+
+
+def test_deal_and_membership_come_from_one_joined_query():
+    deal = SimpleNamespace(id=uuid4(), workspace_id=uuid4())
+    user_id = uuid4()
+    db = FakeDB(rows=[(deal, MemberRole.MEMBER)])
+
+    assert get_deal_with_access(str(deal.id), db, user_id) is deal
+    assert get_deal_with_access(str(deal.id), db, user_id) is deal
+    assert require_workspace_member(db, deal.workspace_id, user_id).role == MemberRole.MEMBER
+
+    (stmt,) = db.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FROM deals LEFT OUTER JOIN workspace_members" in sql
+
+
+def test_missing_deal_is_404_and_non_member_is_403():
+    with pytest.raises(HTTPException) as exc:
+        get_deal_with_access(str(uuid4()), FakeDB(rows=[None]), uuid4())
+    assert exc.value.status_code == 404
+
+    deal = SimpleNamespace(id=uuid4(), workspace_id=uuid4())
+    with pytest.raises(HTTPException) as exc:
+        get_deal_with_access(str(deal.id), FakeDB(rows=[(deal, None)]), uuid4())
+    assert exc.value.status_code == 403
+
+
+def test_membership_cache_spans_requests_until_ttl_or_invalidation(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(access, "_clock", lambda: now[0])
+    monkeypatch.setattr(access.settings, "access_cache_ttl_seconds", 30)
+    workspace_id, user_id = uuid4(), uuid4()
+    member = SimpleNamespace(role=MemberRole.OWNER)
+
+    first = FakeDB(members=[member])
+    assert require_workspace_member(first, workspace_id, user_id).role == MemberRole.OWNER
+    second = FakeDB()
+    assert require_workspace_member(second, workspace_id, user_id).role == MemberRole.OWNER
+    assert second.statements == []
+
+    now[0] += 31
+    expired = FakeDB(members=[None])
+    with pytest.raises(HTTPException) as exc:
+        require_workspace_member(expired, workspace_id, user_id)
+    assert exc.value.status_code == 403
+
+    require_workspace_member(FakeDB(members=[member]), workspace_id, user_id)
+    access.invalidate_membership(user_id=user_id)
+    revoked = FakeDB(members=[None])
+    with pytest.raises(HTTPException):
+        require_workspace_member(revoked, workspace_id, user_id)
+    assert len(revoked.statements) == 1
+
+
+def test_denials_are_not_cached_across_requests():
+    workspace_id, user_id = uuid4(), uuid4()
+    with pytest.raises(HTTPException):
+        require_workspace_member(FakeDB(members=[None]), workspace_id, user_id)
+
+    granted = FakeDB(members=[SimpleNamespace(role=MemberRole.VIEWER)])
+    assert require_workspace_member(granted, workspace_id, user_id).role == MemberRole.VIEWER
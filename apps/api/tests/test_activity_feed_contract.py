@@ -1,15 +1,25 @@
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from uuid import uuid4
 
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
 from app.api import deals
+from app.services.activity_feed import activity_feed_query
 from app.services.gating import log_boe_run_created
+from app.services.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 
 class FakeDB:
-    def __init__(self, scalar_responses=None, scalar_list_responses=None):
+    def __init__(self, scalar_responses=None, scalar_list_responses=None, execute_responses=None):
         self.scalar_responses = list(scalar_responses or [])
         self.scalar_list_responses = list(scalar_list_responses or [])
+        self.execute_responses = list(execute_responses or [])
+        self.executed = []
         self.added = []
+        self.info = {}
 
     def scalar(self, _stmt):
         return self.scalar_responses.pop(0) if self.scalar_responses else None
@@ -18,6 +28,11 @@ class FakeDB:
         values = self.scalar_list_responses.pop(0) if self.scalar_list_responses else []
         return SimpleNamespace(all=lambda: values)
 
+    def execute(self, stmt):
+        self.executed.append(stmt)
+        rows = self.execute_responses.pop(0)
+        return SimpleNamespace(all=lambda: rows, first=lambda: rows[0] if rows else None)
+
     def add(self, obj):
         self.added.append(obj)
 
@@ -33,26 +48,68 @@ def test_log_boe_run_created_writes_activity_event():
     assert gate_event.metadata_json["run_id"] == str(run.id)
 
 
+def _feed_row(kind, **values):
+    row = dict(
+        kind=kind,
+        id=uuid4(),
+        created_at=datetime(2026, 10, 1, tzinfo=timezone.utc),
+        event_type="COMMENT_ADDED",
+        to_status=None,
+        body=None,
+        metadata_json=None,
+        actor_id=None,
+        actor_ref=None,
+        actor_email=None,
+        actor_name=None,
+    )
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
 def test_activity_feed_returns_normalized_shape():
     deal_obj = SimpleNamespace(id=uuid4(), workspace_id=uuid4())
-    gate_event = SimpleNamespace(
-        id=uuid4(),
+    override_by = str(uuid4())
+    gate_event = _feed_row(
+        "gate",
         event_type="OVERRIDE_SET",
-        created_at=None,
-        metadata_json={"override_by": "u-1"},
-        from_status="NEEDS_WORK",
         to_status="ADVANCE",
+        metadata_json={"override_by": override_by},
+        actor_ref=override_by,
+        actor_email="owner@example.com",
+        actor_name="Owner User",
     )
-    comment = SimpleNamespace(id=uuid4(), created_by="u-2", created_at=None, body="Need revised debt quote.")
-    user1 = SimpleNamespace(id="u-1", email="owner@example.com", full_name="Owner User")
-    user2 = SimpleNamespace(id="u-2", email="member@example.com", full_name="Member User")
-    db = FakeDB(
-        scalar_responses=[deal_obj, SimpleNamespace(role="OWNER"), SimpleNamespace(role="OWNER")],
-        scalar_list_responses=[[gate_event], [comment], [user1, user2]],
+    comment = _feed_row(
+        "comment",
+        body="Need revised debt quote.",
+        actor_ref="u-2",
+        actor_email="member@example.com",
+        actor_name="Member User",
     )
+    db = FakeDB(execute_responses=[[(deal_obj, "OWNER")], [gate_event, comment]])
     events = deals.get_deal_activity(str(deal_obj.id), 50, db, SimpleNamespace(id=uuid4()))
     assert len(events) == 2
-    assert {"id", "type", "created_at", "actor", "summary", "metadata"} <= set(events[0].keys())
-    event_types = {e["type"] for e in events}
-    assert "GATE_OVERRIDE_SET" in event_types
-    assert "COMMENT_ADDED" in event_types
+    assert {"id", "type", "created_at", "actor", "summary", "metadata", "cursor"} <= set(events[0].keys())
+    assert events[0]["type"] == "GATE_OVERRIDE_SET" and events[0]["summary"] == "Gate override set to ADVANCE"
+    assert events[0]["actor"] == {"id": override_by, "email": "owner@example.com", "name": "Owner User"}
+    assert events[1]["type"] == "COMMENT_ADDED" and events[1]["metadata"] == {"body": "Need revised debt quote."}
+    assert decode_keyset_cursor(events[1]["cursor"]) == (comment.created_at, comment.id)
+    # One joined access query serves both the deal and membership checks, then one feed query.
+    assert len(db.executed) == 2
+
+
+def test_activity_feed_is_one_union_query_paged_by_keyset():
+    cursor = encode_keyset_cursor(datetime(2026, 10, 1, tzinfo=timezone.utc), uuid4())
+    sql = str(activity_feed_query(uuid4(), cursor=cursor, limit=25).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("UNION ALL") == 1 and "LEFT OUTER JOIN users ON users.id = feed.actor_id" in sql
+    assert "(deal_gate_events.created_at, deal_gate_events.id) < (" in sql
+    assert "(deal_comments.created_at, deal_comments.id) < (" in sql
+    assert "ORDER BY feed.created_at DESC, feed.id DESC" in sql
+
+
+def test_activity_feed_rejects_bad_cursor():
+    deal_obj = SimpleNamespace(id=uuid4(), workspace_id=uuid4())
+    db = FakeDB(execute_responses=[[(deal_obj, "OWNER")]])
+    with pytest.raises(HTTPException) as exc:
+        deals.get_deal_activity(str(deal_obj.id), 50, db, SimpleNamespace(id=uuid4()), cursor="garbage")
+    assert exc.value.status_code == 422
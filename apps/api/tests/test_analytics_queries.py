@@ -0,0 +1,119 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.api import portfolio, risk
+from app.services import analytics
+from app.services.analytics import (
+    build_portfolio_summary_payload,
+    build_risk_metrics_payload,
+    query_portfolio_summary_payload,
+    query_risk_metrics_payload,
+)
+
+
+class FakeDB:
+    def __init__(self, results=(), scalars=(), scalar_responses=()):
+        self.results = list(results)
+        self.scalar_lists = list(scalars)
+        self.scalar_responses = list(scalar_responses)
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        rows = self.results.pop(0)
+        return SimpleNamespace(all=lambda: list(rows), one=lambda: rows[0])
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        values = self.scalar_lists.pop(0)
+        return SimpleNamespace(all=lambda: list(values))
+
+    def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.scalar_responses.pop(0)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _summary(status, has_override, ic_score, binding=None):
+    return {
+        "deal_id": uuid4(),
+        "effective_status": status,
+        "has_override": has_override,
+        "ic_score": ic_score,
+        "explainability": {"binding_constraint": binding},
+    }
+
+
+def test_portfolio_pushdown_matches_python_payload():
+    summaries = [
+        _summary("ADVANCE", False, 90, "YOC"),
+        _summary("BLOCKED", True, 55, "CoC"),
+        _summary("ADVANCE", False, 80, "YOC"),
+        _summary("NEEDS_WORK", True, 40),
+    ]
+    # (status, count, override_count, ic_score_sum) and (binding_constraint, count) as Postgres groups them.
+    db = FakeDB(
+        results=[
+            [("ADVANCE", 2, 0, 170), ("BLOCKED", 1, 1, 55), ("NEEDS_WORK", 1, 1, 40)],
+            [("CoC", 1), ("YOC", 2)],
+        ]
+    )
+
+    payload = query_portfolio_summary_payload(db, [uuid4()])
+
+    assert payload == build_portfolio_summary_payload(summaries)
+    status_sql, binding_sql = map(_sql, db.statements)
+    assert "GROUP BY deal_gate_summary.effective_status" in status_sql and "CASE WHEN" in status_sql
+    assert "GROUP BY deal_gate_summary.binding_constraint" in binding_sql
+
+
+def test_portfolio_falls_back_when_summary_rows_are_missing(monkeypatch):
+    fallback = [_summary("ADVANCE", False, 90, "YOC")]
+    monkeypatch.setattr(analytics, "_python_records", lambda _db, _ids: fallback)
+    db = FakeDB(results=[[("ADVANCE", 3, 0, 270), (None, 1, 0, 0)]])
+
+    payload = query_portfolio_summary_payload(db, [uuid4()])
+
+    assert payload == build_portfolio_summary_payload(fallback)
+    assert len(db.statements) == 1
+
+
+def test_risk_pushdown_matches_python_payload():
+    records = [
+        (_summary("ADVANCE", False, 85), SimpleNamespace(underperformed_flag=True, realized_irr=0.08)),
+        (_summary("APPROVED", True, 60), SimpleNamespace(underperformed_flag=False, realized_irr=0.14)),
+        (_summary("BLOCKED", False, 35), SimpleNamespace(underperformed_flag=True, realized_irr=0.02)),
+        (_summary("BLOCKED", False, 50), SimpleNamespace(underperformed_flag=None, realized_irr=None)),
+    ]
+    # adv num/den, override num/den, no-override num/den, then (count, irr_sum) per IC-score bin.
+    aggregate = (1, 2, 0, 1, 2, 2, 1, 0.02, 0, 0.0, 1, 0.14, 1, 0.08)
+    db = FakeDB(results=[[aggregate]], scalar_responses=[False])
+
+    payload = query_risk_metrics_payload(db, [uuid4()])
+
+    assert payload == build_risk_metrics_payload(records)
+    aggregate_sql = _sql(db.statements[1])
+    assert "row_number() OVER (PARTITION BY deal_outcomes.deal_id ORDER BY deal_outcomes.recorded_at DESC)" in aggregate_sql
+    assert aggregate_sql.count("CASE WHEN") == 14 and "GROUP BY" not in aggregate_sql
+
+
+def test_empty_memberships_skip_queries():
+    db = FakeDB(scalars=[[]])
+    assert asyncio.run(portfolio.get_portfolio_summary(db, SimpleNamespace(id=uuid4()))) == build_portfolio_summary_payload([])
+    db = FakeDB(scalars=[[]])
+    assert risk.get_risk_metrics(db, SimpleNamespace(id=uuid4())) == build_risk_metrics_payload([])
+    assert len(db.statements) == 1
+
+    db = FakeDB(results=[[("ADVANCE", 1, 0, 90)], []], scalars=[[uuid4()]])
+    payload = query_portfolio_summary_payload(db, [uuid4()])
+    assert payload["deal_count"] == 1 and payload["avg_ic_score"] == 90
+    assert len(db.statements) == 2
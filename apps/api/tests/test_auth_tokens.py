@@ -0,0 +1,109 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.api.deps import get_current_user, get_current_user_async
+from app.core import tokens
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.tokens import InvalidTokenError, VerifiedTokenCache, decode_access_token
+from app.models.entities import User
+from app.services import access
+
+
+class FakeDB:
+    def __init__(self, user=None):
+        self.user = user
+        self.lookups = 0
+        self.info = {}
+
+    def scalar(self, _stmt):
+        self.lookups += 1
+        return self.user
+
+    def merge(self, obj, load=True):
+        assert load is False
+        return obj
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch):
+    monkeypatch.setattr(tokens, "token_cache", VerifiedTokenCache(100))
+    access.invalidate_user()
+    yield
+    access.invalidate_user()
+
+
+@pytest.mark.parametrize("verifier", ["jose", "hmac"])
+def test_both_verifiers_accept_our_tokens_and_reject_tampering(monkeypatch, verifier):
+    monkeypatch.setattr(settings, "jwt_verifier", verifier)
+    token = create_access_token("user-1")
+    assert decode_access_token(token) == "user-1"
+
+    header, payload, signature = token.split(".")
+    forged = jwt.encode({"sub": "user-2", "exp": int(time.time()) + 60}, "other-secret", algorithm="HS256")
+    for bad in (f"{header}.{forged.split('.')[1]}.{signature}", forged, "not-a-token"):
+        with pytest.raises(InvalidTokenError):
+            decode_access_token(bad)
+
+    expired = jwt.encode({"sub": "user-1", "exp": int(time.time()) - 5}, settings.jwt_secret_key, algorithm="HS256")
+    with pytest.raises(InvalidTokenError):
+        decode_access_token(expired)
+
+
+def test_verified_tokens_are_served_from_cache_until_exp(monkeypatch):
+    token = create_access_token("user-1")
+    decode_access_token(token)
+    monkeypatch.setitem(tokens._VERIFIERS, settings.jwt_verifier, lambda _token: pytest.fail("verified twice"))
+    assert decode_access_token(token) == "user-1"
+
+    now = [1000.0]
+    cache = VerifiedTokenCache(2, clock=lambda: now[0])
+    cache.put("a", "user-a", exp=1010)
+    assert cache.get("a") == "user-a"
+    now[0] = 1010
+    assert cache.get("a") is None and len(cache) == 0
+    for key in ("a", "b", "c"):
+        cache.put(key, key, exp=2000)
+    assert cache.get("a") is None and cache.get("c") == "c"
+
+
+def test_current_user_row_is_cached_and_forgotten_on_update():
+    user = User(id=uuid4(), email="owner@example.com", hashed_password="x", full_name="Owner")
+    creds = SimpleNamespace(credentials=create_access_token(str(user.id)))
+    db = FakeDB(user)
+
+    assert get_current_user(creds, db) is user
+    cached = get_current_user(creds, db)
+    assert cached.id == user.id and cached.email == "owner@example.com" and db.lookups == 1
+
+    access._forget_changed_user(None, None, user)
+    get_current_user(creds, db)
+    assert db.lookups == 2
+
+
+def test_current_user_rejects_bad_tokens_and_unknown_users():
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(SimpleNamespace(credentials="garbage"), FakeDB())
+    assert exc.value.status_code == 401 and exc.value.detail == "Invalid token"
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(SimpleNamespace(credentials=create_access_token(str(uuid4()))), FakeDB())
+    assert exc.value.detail == "User not found"
+
+
+def test_async_dependency_shares_the_cached_lookup():
+    user = User(id=uuid4(), email="owner@example.com", hashed_password="x", full_name="Owner")
+    creds = SimpleNamespace(credentials=create_access_token(str(user.id)))
+    db = FakeDB(user)
+
+    assert asyncio.run(get_current_user_async(creds, db)) is user
+    assert get_current_user(creds, db).id == user.id and db.lookups == 1
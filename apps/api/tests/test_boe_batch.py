@@ -0,0 +1,106 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.boe.engine import (
+    BOE_INPUT_FIELDS,
+    BOEInput,
+    GateStatus,
+    RESULT_CODES,
+    STATUS_CODES,
+    TestResult,
+    boe_input_columns,
+    calculate_boe,
+    calculate_boe_batch,
+)
+from app.boe.parity import compare_cases_batch, load_fixture
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "boe"
+BASELINE_FIXTURE = Path(__file__).parent / "fixtures" / "boe_batch_baseline.json"
+
+BASE_INPUTS = dict(
+    asking_price=10_000_000,
+    deposit_pct=0.05,
+    interest_rate=0.06,
+    ltc=0.7,
+    capex_budget=1_000_000,
+    soft_cost_pct=0.0,
+    reserves=0.0,
+    seller_noi_from_om=600_000,
+    gross_income=1_000_000,
+    operating_expenses=300_000,
+    y1_noi=700_000,
+    y1_exit_cap_rate=0.05,
+)
+
+
+def _fixture_cases() -> list[dict]:
+    return [load_fixture(p) for p in sorted(FIXTURES_DIR.glob("*.json")) if "expected" in load_fixture(p)]
+
+
+def test_batch_fixture_parity():
+    assert compare_cases_batch(_fixture_cases()) == []
+
+
+def _json_values(value):
+    return json.loads(json.dumps(value, default=lambda enum: enum.value))
+
+
+def test_batch_rows_match_frozen_scalar_outputs_including_na_cases():
+    # Captured from the pre-vectorization scalar engine; calculate_boe now wraps the batch path.
+    cases = json.loads(BASELINE_FIXTURE.read_text(encoding="utf-8"))
+    batch = calculate_boe_batch(boe_input_columns(case["inputs"] for case in cases))
+
+    assert batch.size == len(cases)
+    for case, (output, tests, decision) in zip(cases, batch.rows()):
+        assert _json_values(asdict(output)) == case["output"], case["name"]
+        assert _json_values([asdict(t) for t in tests]) == case["tests"], case["name"]
+        assert _json_values(asdict(decision)) == case["decision"], case["name"]
+        assert _json_values(asdict(calculate_boe(BOEInput(**case["inputs"]))[2])) == case["decision"]
+
+
+def test_batch_columns_expose_codes_and_decision_fields():
+    noi = np.array([700_000.0, 416_000.0, np.nan])
+    batch = calculate_boe_batch({**{k: v for k, v in BASE_INPUTS.items() if k != "y1_noi"}, "y1_noi": noi})
+
+    assert batch.shape == (3,)
+    # A missing y1_noi falls back to gross_income - operating_expenses, as in the scalar engine.
+    assert [STATUS_CODES[c] for c in batch.status] == [GateStatus.ADVANCE, GateStatus.BLOCKED, GateStatus.ADVANCE]
+    assert batch.advance.tolist() == [True, False, True]
+    assert RESULT_CODES[batch.results["yield_on_cost"][1]] == TestResult.FAIL
+    assert set(batch.outputs) >= {"boe_max_bid", "y1_dscr", "max_price_at_coc_threshold"}
+
+    for index, value in enumerate((700_000, 416_000, None)):
+        output, _, decision = calculate_boe(BOEInput(**{**BASE_INPUTS, "y1_noi": value}))
+        assert batch.pass_count[index] == decision.pass_count
+        assert batch.hard_veto_ok[index] == decision.hard_veto_ok
+        assert batch.binding_constraint[index] == output.binding_constraint
+
+
+def test_batch_accepts_structured_arrays_and_broadcasts_scalars():
+    dtype = [(name, "f8") for name in ("y1_noi", "interest_rate")]
+    structured = np.array([(700_000.0, 0.06), (650_000.0, 0.07)], dtype=dtype)
+    batch = calculate_boe_batch(structured)
+    assert batch.size == 2
+
+    grid = calculate_boe_batch(
+        {
+            **BASE_INPUTS,
+            "interest_rate": np.linspace(0.04, 0.08, 5)[:, np.newaxis],
+            "ltc": np.linspace(0.5, 0.8, 4)[np.newaxis, :],
+        }
+    )
+    assert grid.shape == (5, 4)
+    expected, _, _ = calculate_boe(BOEInput(**{**BASE_INPUTS, "interest_rate": 0.06, "ltc": 0.6}))
+    assert grid.outputs["boe_max_bid"][2, 1] == expected.boe_max_bid
+
+
+def test_batch_rejects_unknown_columns_and_mismatched_lengths():
+    with pytest.raises(ValueError):
+        calculate_boe_batch({"asking_prize": [1.0]})
+    with pytest.raises(ValueError):
+        calculate_boe_batch({"asking_price": [1.0, 2.0], "y1_noi": [1.0, 2.0, 3.0]})
+    assert set(BOE_INPUT_FIELDS) == set(BOEInput.__dataclass_fields__)
@@ -0,0 +1,120 @@
+import json
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import boe
+from app.models.enums import DealStatus, MemberRole
+from app.schemas.boe import BOEBulkRunCreate
+from app.services.boe_bulk import stream_bulk_boe_runs
+
+ADVANCE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+KILL_INPUTS = {**ADVANCE_INPUTS, "y1_noi": 416_000, "seller_noi_from_om": 500_000}
+
+
+class FakeDB:
+    def __init__(self, deals, versions=None):
+        self.deals = deals
+        self.versions = versions or {}
+        self.executed = []
+        self.added = []
+        self.commits = 0
+
+    def scalar(self, _stmt):
+        return None
+
+    def scalars(self, _stmt):
+        return SimpleNamespace(all=lambda: list(self.deals))
+
+    def execute(self, stmt, params=None):
+        if params is None:
+            rows = [] if "deal_gate_summary" in str(stmt) else list(self.versions.items())
+            return SimpleNamespace(all=lambda: rows)
+        self.executed.append((stmt.table.name, params))
+        return None
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        return None
+
+
+def _deal():
+    return SimpleNamespace(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        current_gate_state=None,
+        latest_boe_run_id=None,
+        gate_status=DealStatus.NEEDS_WORK,
+        gate_status_computed=DealStatus.NEEDS_WORK,
+        gate_override_status=None,
+        gate_updated_at=None,
+    )
+
+
+def test_bulk_stream_batches_inserts_and_applies_gate_status():
+    advance_deal, kill_deal = _deal(), _deal()
+    db = FakeDB([advance_deal, kill_deal], versions={kill_deal.id: 3})
+    items = [(advance_deal.id, ADVANCE_INPUTS), (kill_deal.id, KILL_INPUTS), (uuid4(), ADVANCE_INPUTS)]
+
+    lines = [json.loads(line) for line in stream_bulk_boe_runs(db, workspace_id=uuid4(), items=items, user_id=uuid4())]
+
+    assert [line["type"] for line in lines] == ["result", "result", "error", "summary"]
+    assert lines[0]["status"] == "ADVANCE" and lines[0]["version"] == 1
+    assert lines[1]["status"] == "BLOCKED" and lines[1]["version"] == 4
+    assert lines[-1] == {"type": "summary", "processed": 3, "succeeded": 2, "failed": 1}
+
+    tables = [name for name, _ in db.executed]
+    assert tables == ["boe_runs", "boe_test_results", "deal_gate_summary", "workspace_gate_counters"]
+    assert len(db.executed[0][1]) == 2
+    assert {row["threshold_profile_version"] for row in db.executed[0][1]} == {"SYNDICATOR.v1"}
+    assert len(db.executed[1][1]) == 14
+    assert advance_deal.gate_status == DealStatus.ADVANCE
+    assert kill_deal.gate_status == DealStatus.BLOCKED
+    assert str(advance_deal.latest_boe_run_id) == lines[0]["run_id"]
+    summaries = {row["deal_id"]: row for row in db.executed[2][1]}
+    assert summaries[advance_deal.id]["effective_status"] == "ADVANCE"
+    assert summaries[kill_deal.id]["binding_constraint"] == lines[1]["binding_constraint"]
+    assert summaries[kill_deal.id]["audit_trail_count"] == 2
+    assert db.commits == 1
+
+
+def test_bulk_stream_numbers_repeat_deals_sequentially_and_commits_per_chunk():
+    deal = _deal()
+    items = [(deal.id, ADVANCE_INPUTS), (deal.id, KILL_INPUTS), (deal.id, {"bogus": 1})]
+
+    db = FakeDB([deal])
+    lines = [json.loads(line) for line in stream_bulk_boe_runs(db, workspace_id=uuid4(), items=items, user_id=uuid4())]
+    assert [line.get("version") for line in lines[:2]] == [1, 2]
+    (summary,) = next(params for name, params in db.executed if name == "deal_gate_summary")
+    assert summary["latest_run_id"] == UUID(lines[1]["run_id"]) and summary["audit_trail_count"] == 4
+    assert lines[2]["type"] == "error" and "bogus" in lines[2]["error"]
+    assert deal.gate_status == DealStatus.BLOCKED
+
+    db = FakeDB([deal])
+    list(stream_bulk_boe_runs(db, workspace_id=uuid4(), items=items, user_id=uuid4(), chunk_size=1))
+    assert db.commits == 3
+
+
+def test_bulk_endpoint_rejects_viewers():
+    db = SimpleNamespace(scalar=lambda _stmt: SimpleNamespace(role=MemberRole.VIEWER), info={})
+    payload = BOEBulkRunCreate(items=[{"deal_id": uuid4(), "inputs": ADVANCE_INPUTS}])
+    with pytest.raises(HTTPException) as exc:
+        boe.create_bulk_boe_runs(uuid4(), payload, db, SimpleNamespace(id=uuid4()))
+    assert exc.value.status_code == 403
@@ -0,0 +1,116 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from app import main
+from app.boe import engine
+from app.boe.cache import BOECache, boe_cache_key, canonical_inputs
+from app.boe.engine import BOEInput, calculate_boe
+from app.boe.parity import compare_case, load_fixture
+from app.services.boe import calculate_boe as cached_calculate_boe
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "boe"
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, _ttl, value):
+        self.store[key] = value
+
+
+class BrokenRedis:
+    def get(self, _key):
+        raise ConnectionError("redis down")
+
+    def setex(self, _key, _ttl, _value):
+        raise ConnectionError("redis down")
+
+
+def _as_dicts(result):
+    output, tests, decision = result
+    return asdict(output), [asdict(t) for t in tests], asdict(decision)
+
+
+def test_canonical_inputs_fold_equivalent_payloads():
+    noisy = {**{k: str(v) for k, v in reversed(BASE_INPUTS.items())}, "ltc": 0.1 + 0.6, "reserves": "n/a"}
+    assert canonical_inputs(noisy) == canonical_inputs(BOEInput(**BASE_INPUTS))
+    assert boe_cache_key(canonical_inputs(noisy)) == boe_cache_key(canonical_inputs(BASE_INPUTS))
+
+
+def test_lru_hits_misses_and_eviction():
+    cache = BOECache(maxsize=2)
+    first = cache.calculate(BASE_INPUTS)
+    again = cache.calculate(BOEInput(**BASE_INPUTS))
+
+    assert _as_dicts(again) == _as_dicts(first) == _as_dicts(calculate_boe(BOEInput(**BASE_INPUTS)))
+    again[2].failed_hard_tests.append("mutated")
+    assert cache.calculate(BASE_INPUTS)[2].failed_hard_tests == []
+
+    cache.calculate({**BASE_INPUTS, "y1_noi": 650_000})
+    cache.calculate({**BASE_INPUTS, "y1_noi": 600_000})
+    assert len(cache) == 2
+    cache.calculate(BASE_INPUTS)
+    snapshot = cache.snapshot()
+    assert (snapshot["hits"], snapshot["misses"]) == (2, 4)
+
+
+def test_engine_thresholds_are_part_of_the_key(monkeypatch):
+    cache = BOECache()
+    before = cache.calculate(BASE_INPUTS)
+    monkeypatch.setattr(engine, "QUORUM_REQUIRED", 8)
+    after = cache.calculate(BASE_INPUTS)
+
+    assert cache.stats.misses == 2
+    assert before[2].advance and not after[2].advance
+
+
+def test_redis_tier_is_shared_and_failures_fall_back_to_engine():
+    redis = FakeRedis()
+    BOECache(redis=redis, ttl_seconds=60).calculate(BASE_INPUTS)
+    warm = BOECache(redis=redis, ttl_seconds=60)
+    result = warm.calculate(BASE_INPUTS)
+
+    assert warm.stats.redis_hits == 1 and warm.stats.misses == 0
+    assert len(redis.store) == 1 and json.loads(next(iter(redis.store.values())))["decision"]["status"] == "ADVANCE"
+    assert _as_dicts(result) == _as_dicts(calculate_boe(BOEInput(**BASE_INPUTS)))
+
+    broken = BOECache(redis=BrokenRedis(), ttl_seconds=60)
+    assert broken.calculate(BASE_INPUTS)[2].advance
+    assert broken.stats.redis_errors == 2
+
+
+def test_fixture_parity_through_cache():
+    cache = BOECache()
+    for path in sorted(FIXTURES_DIR.glob("*.json")):
+        case = load_fixture(path)
+        if "expected" in case:
+            assert compare_case(case, cache=cache) == []
+            assert compare_case(case, cache=cache) == []
+    assert cache.stats.hits == cache.stats.misses
+
+
+def test_metrics_endpoint_exports_boe_cache_counters():
+    before = main.metrics()["boe_cache"]
+    cached_calculate_boe(BOEInput(**{**BASE_INPUTS, "asking_price": 9_876_543}))
+    cached_calculate_boe(BOEInput(**{**BASE_INPUTS, "asking_price": 9_876_543}))
+    after = main.metrics()["boe_cache"]
+
+    assert after["misses"] == before["misses"] + 1 and after["hits"] == before["hits"] + 1
+    assert after["maxsize"] == main.settings.boe_cache_size
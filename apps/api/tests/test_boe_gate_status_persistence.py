@@ -5,6 +5,7 @@ import pytest
 
 from app.api import boe
 from app.boe.engine import BOEDecision, BOEOutput, BOETestOutcome, GateStatus, TestClass, TestResult
+from app.boe.profiles import edition_profile
 from app.models.enums import DealStatus
 from app.schemas.boe import BOERunCreate
 
@@ -13,11 +14,17 @@ class FakeDB:
     def __init__(self, scalar_responses):
         self._scalar_responses = list(scalar_responses)
         self.added = []
+        self.executed = []
         self.committed = False
 
     def scalar(self, _stmt):
         return self._scalar_responses.pop(0)
 
+    def execute(self, stmt, params=None):
+        if params is None:
+            return SimpleNamespace(all=lambda: [])
+        self.executed.append((stmt.table.name, params))
+
     def add(self, obj):
         self.added.append(obj)
 
@@ -65,6 +72,7 @@ def test_create_boe_run_persists_computed_gate_status(monkeypatch, decision_stat
     db = FakeDB([0, fake_run_for_response])
 
     monkeypatch.setattr(boe, "get_deal_with_access", lambda *_args, **_kwargs: deal)
+    monkeypatch.setattr(boe, "resolve_threshold_profile", lambda *_args, **_kwargs: edition_profile("SYNDICATOR"))
     monkeypatch.setattr(boe, "log_boe_run_created", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(boe, "transition_deal_gate", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(boe, "serialize_output", lambda _output: {})
@@ -140,3 +148,8 @@ def test_create_boe_run_persists_computed_gate_status(monkeypatch, decision_stat
     assert deal.gate_status == expected_status
     assert deal.gate_status_computed == expected_status
     assert db.committed is True
+    (table, rows), (counter_table, _) = db.executed
+    assert (table, counter_table) == ("deal_gate_summary", "workspace_gate_counters")
+    assert rows[0]["effective_status"] == expected_status.value
+    assert rows[0]["test_results"] == {"yield_on_cost": "PASS"}
+    assert rows[0]["audit_trail_count"] == 2
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from app.boe import montecarlo
+from app.boe.engine import BOE_RULES, BOEInput, calculate_boe
+from app.boe.montecarlo import parse_distribution, simulate_boe
+from app.boe.profiles import ThresholdProfile
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_exit_cap_rate": 0.05,
+}
+DISTRIBUTIONS = {
+    "y1_noi": parse_distribution({"dist": "normal", "mean": 650_000, "sd": 80_000}),
+    "interest_rate": parse_distribution({"dist": "triangular", "low": 0.05, "mode": 0.06, "high": 0.08}),
+    "capex_budget": parse_distribution({"dist": "lognormal", "median": 1_000_000, "sigma": 0.2}),
+}
+
+
+def test_simulation_is_reproducible_across_chunking_workers():
+    serial = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 5_000, seed=42, chunk_size=1_000)
+    pooled = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 5_000, seed=42, chunk_size=1_000, workers=2)
+    other = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 5_000, seed=43, chunk_size=1_000)
+
+    assert np.array_equal(serial.max_bid, pooled.max_bid, equal_nan=True)
+    assert serial.summary() == pooled.summary()
+    assert not np.array_equal(serial.max_bid, other.max_bid, equal_nan=True)
+
+
+def test_summary_probabilities_are_consistent():
+    summary = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 4_000, seed=1).summary()
+
+    assert summary["simulations"] == 4_000 and summary["seed"] == 1
+    assert sum(summary["status_probability"].values()) == pytest.approx(1.0)
+    for test in summary["tests"].values():
+        assert sum(test["results"].values()) == pytest.approx(1.0)
+        assert test["pass_rate"] == pytest.approx(test["results"]["PASS"] + test["results"]["WARN"])
+    percentiles = list(summary["boe_max_bid"]["percentiles"].values())
+    assert percentiles == sorted(percentiles)
+
+
+def test_summary_labels_follow_the_profile_rules(monkeypatch):
+    default = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 2_000, seed=7).summary()
+    # Same tests in a different order: per-test rates must follow the keys, not BOE_RULES positions.
+    monkeypatch.setattr(montecarlo, "with_thresholds", lambda _overrides: tuple(reversed(BOE_RULES)))
+    profile = ThresholdProfile(version="reordered", overrides={"dscr": {}})
+    reordered = simulate_boe(BASE_INPUTS, DISTRIBUTIONS, 2_000, seed=7, profile=profile)
+
+    assert reordered.test_keys == tuple(rule.key for rule in reversed(BOE_RULES))
+    assert reordered.summary()["tests"] == default["tests"]
+
+
+def test_degenerate_distribution_matches_scalar_engine():
+    fixed = {"y1_noi": parse_distribution({"dist": "uniform", "low": 700_000, "high": 700_000})}
+    summary = simulate_boe(BASE_INPUTS, fixed, 10, seed=0).summary()
+    output, _, decision = calculate_boe(BOEInput(**BASE_INPUTS, y1_noi=700_000))
+
+    assert summary["boe_max_bid"]["mean"] == pytest.approx(output.boe_max_bid)
+    assert summary["status_probability"][decision.status.value] == 1.0
+
+
+def test_clipping_and_validation():
+    clipped = parse_distribution({"dist": "normal", "mean": 0.06, "sd": 0.05, "min": 0.0, "max": 0.1})
+    values = clipped.sample(np.random.default_rng(0), 1_000)
+    assert values.min() >= 0.0 and values.max() <= 0.1
+
+    with pytest.raises(ValueError):
+        parse_distribution({"dist": "beta"})
+    with pytest.raises(ValueError):
+        parse_distribution({"dist": "triangular", "low": 1, "mode": 0, "high": 2})
+    with pytest.raises(ValueError):
+        simulate_boe(BASE_INPUTS, {"noi": clipped}, 10)
+    with pytest.raises(ValueError):
+        simulate_boe(BASE_INPUTS, {}, 10)
@@ -0,0 +1,177 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import workspaces
+from app.boe.cache import BOECache
+from app.boe import engine
+from app.boe.engine import BOE_RULES, BOEInput, calculate_boe
+from app.boe.profiles import edition_profile, validate_overrides
+from app.models.enums import MemberRole, WorkspaceEdition
+from app.schemas.workspace import WorkspaceBOEProfileUpdate
+from app.services.boe_profiles import build_threshold_profile, resolve_threshold_profile, threshold_profile_for
+from app.services.boe_solver import solve_gate_flip
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+
+
+class FakeDB:
+    def __init__(self, scalar_responses=None):
+        self.scalar_responses = list(scalar_responses or [])
+        self.added = []
+        self.info = {}
+        self.committed = False
+
+    def scalar(self, _stmt):
+        return self.scalar_responses.pop(0) if self.scalar_responses else None
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.committed = True
+
+
+def _row(version=1, overrides=None, quorum_required=None, base_edition=None):
+    return SimpleNamespace(
+        version=version, overrides=overrides or {}, quorum_required=quorum_required, base_edition=base_edition
+    )
+
+
+STRICT_OVERRIDES = {"cash_on_cash": {"threshold": 0.06}, "dscr": {"threshold": 1.35, "warn_threshold": 1.25}}
+
+
+def _strict_fund():
+    return build_threshold_profile(WorkspaceEdition.FUND, _row(overrides=STRICT_OVERRIDES, quorum_required=5))
+
+
+def test_editions_start_from_engine_thresholds():
+    for edition in ("SYNDICATOR", "FUND"):
+        profile = edition_profile(edition)
+        assert profile.rules == BOE_RULES and profile.quorum_required == engine.QUORUM_REQUIRED
+    assert edition_profile("FUND").fingerprint == edition_profile("SYNDICATOR").fingerprint
+
+
+def test_workspace_overrides_tighten_grading():
+    inputs = {**BASE_INPUTS, "y1_noi": 620_000}
+    syndicator = edition_profile("SYNDICATOR")
+    fund = _strict_fund()
+    _, synd_tests, synd_decision = calculate_boe(BOEInput(**inputs), syndicator.rules, syndicator.quorum_required)
+    _, fund_tests, fund_decision = calculate_boe(BOEInput(**inputs), fund.rules, fund.quorum_required)
+
+    assert (synd_decision.pass_count, fund_decision.pass_count) == (5, 4)
+    assert {t.key: t.result.value for t in fund_tests}["dscr"] == "WARN"
+    assert {t.key: t.result.value for t in synd_tests}["dscr"] == "PASS"
+    assert next(t for t in fund_tests if t.key == "dscr").threshold_display == "PASS>=1.35 | WARN>=1.25 | FAIL<1.25"
+    assert syndicator.fingerprint != fund.fingerprint
+
+
+def test_workspace_row_layers_on_edition_and_labels_version():
+    profile = build_threshold_profile(
+        WorkspaceEdition.FUND, _row(version=3, overrides={"dscr": {"warn_threshold": 1.2}}, quorum_required=4)
+    )
+
+    assert profile.version == "FUND.v1+workspace.v3"
+    assert profile.overrides["dscr"] == {"warn_threshold": 1.2}
+    assert profile.quorum_required == 4
+    assert build_threshold_profile(WorkspaceEdition.FUND, None) == edition_profile("FUND")
+    assert build_threshold_profile(WorkspaceEdition.FUND, _row(base_edition=WorkspaceEdition.SYNDICATOR)).version == (
+        "SYNDICATOR.v1+workspace.v1"
+    )
+
+
+@pytest.mark.parametrize(
+    "overrides, quorum",
+    [
+        ({"dscrr": {"threshold": 1.0}}, None),
+        ({"dscr": {"comparator": "<="}}, None),
+        ({"yield_on_cost": {"threshold": 0.06}}, None),
+        ({"dscr": {"threshold": None}}, None),
+        ({"dscr": {"threshold": "high"}}, None),
+        ({}, 0),
+        ({}, 8),
+    ],
+)
+def test_invalid_overrides_are_rejected(overrides, quorum):
+    with pytest.raises(ValueError):
+        validate_overrides(overrides, quorum)
+
+
+def test_resolved_profiles_are_memoized_per_row_version():
+    workspace_id = uuid4()
+    row = _row(version=1, overrides={"expense_ratio": {"threshold": 0.3}})
+    first = resolve_threshold_profile(FakeDB([WorkspaceEdition.SYNDICATOR, row]), workspace_id)
+    again = resolve_threshold_profile(FakeDB([WorkspaceEdition.SYNDICATOR, row]), workspace_id)
+    newer = threshold_profile_for(workspace_id, WorkspaceEdition.SYNDICATOR, _row(version=2))
+
+    assert first is again
+    assert newer is not first and newer.version == "SYNDICATOR.v1+workspace.v2"
+    assert resolve_threshold_profile(FakeDB(), uuid4()).version == "SYNDICATOR.v1"
+
+
+def test_cache_and_solver_keys_include_profile():
+    cache = BOECache()
+    inputs = {**BASE_INPUTS, "y1_noi": 620_000}
+    default = cache.calculate(inputs, edition_profile("SYNDICATOR"))
+    fund = cache.calculate(inputs, _strict_fund())
+
+    assert cache.stats.misses == 2
+    assert default[2].pass_count != fund[2].pass_count
+
+    priced = {**BASE_INPUTS, "market_cap_rate": 0.06}
+    synd_solve = solve_gate_flip(priced, profile=edition_profile("SYNDICATOR"))
+    fund_solve = solve_gate_flip(priced, profile=_strict_fund())
+    assert synd_solve["input_hash"] != fund_solve["input_hash"]
+    assert synd_solve["method"] == "closed_form" and fund_solve["method"] == "root_finding"
+    assert fund_solve["threshold_profile_version"] == "FUND.v1+workspace.v1"
+
+
+def test_only_owners_can_update_boe_profile():
+    ws = SimpleNamespace(id=uuid4(), edition=WorkspaceEdition.SYNDICATOR)
+    db = FakeDB([ws, SimpleNamespace(role=MemberRole.MEMBER)])
+    payload = WorkspaceBOEProfileUpdate(overrides={"dscr": {"threshold": 1.4}})
+
+    with pytest.raises(HTTPException) as exc:
+        workspaces.update_workspace_boe_profile(str(ws.id), payload, db, SimpleNamespace(id=uuid4()))
+    assert exc.value.status_code == 403
+
+
+def test_owner_update_versions_profile_and_audits():
+    ws = SimpleNamespace(id=uuid4(), edition=WorkspaceEdition.SYNDICATOR)
+    db = FakeDB([ws, SimpleNamespace(role=MemberRole.OWNER), _row(version=2)])
+    user = SimpleNamespace(id=uuid4())
+    payload = WorkspaceBOEProfileUpdate(overrides={"dscr": {"threshold": 1.4}}, quorum_required=6)
+
+    out = workspaces.update_workspace_boe_profile(str(ws.id), payload, db, user)
+
+    row, audit = db.added
+    assert row.version == 3 and row.quorum_required == 6
+    assert out["version"] == "SYNDICATOR.v1+workspace.v3"
+    assert out["source"] == "workspace" and out["quorum_required"] == 6
+    assert next(t for t in out["tests"] if t["key"] == "dscr")["threshold"] == 1.4
+    assert audit.action == "workspace.boe_profile_updated"
+    assert (audit.previous_state, audit.new_state) == ("SYNDICATOR.v1+workspace.v2", "SYNDICATOR.v1+workspace.v3")
+    assert db.committed is True
+
+
+def test_invalid_profile_update_is_unprocessable():
+    ws = SimpleNamespace(id=uuid4(), edition=WorkspaceEdition.SYNDICATOR)
+    db = FakeDB([ws, SimpleNamespace(role=MemberRole.OWNER)])
+    payload = WorkspaceBOEProfileUpdate(overrides={"yield_on_cost": {"threshold": 0.06}})
+
+    with pytest.raises(HTTPException) as exc:
+        workspaces.update_workspace_boe_profile(str(ws.id), payload, db, SimpleNamespace(id=uuid4()))
+    assert exc.value.status_code == 422
+    assert db.committed is False
@@ -0,0 +1,216 @@
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import boe
+from app.models.enums import BOERegateStatus, DealStatus, MemberRole
+from app.schemas.boe import BOERegateCreate
+from app.services import boe_regate
+
+ADVANCE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+KILL_INPUTS = {**ADVANCE_INPUTS, "y1_noi": 416_000, "seller_noi_from_om": 500_000}
+
+
+class FakeDB:
+    def __init__(self, deals, scalar_responses=None):
+        self.deals = {deal.id: deal for deal in deals}
+        self.scalar_responses = list(scalar_responses or [])
+        self.executed = []
+        self.added = []
+        self.info = {}
+        self.commits = 0
+
+    def scalar(self, _stmt):
+        return self.scalar_responses.pop(0) if self.scalar_responses else None
+
+    def scalars(self, stmt):
+        ids = next(value for value in stmt.compile().params.values() if isinstance(value, list))
+        return SimpleNamespace(all=lambda: [self.deals[i] for i in ids if i in self.deals])
+
+    def execute(self, stmt, params=None):
+        if params is None:
+            return SimpleNamespace(all=lambda: [])
+        self.executed.append((stmt.table.name, params))
+        return None
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        return None
+
+    def refresh(self, _obj):
+        return None
+
+
+def _deal(workspace_id, gate_status=DealStatus.NEEDS_WORK):
+    return SimpleNamespace(
+        id=uuid4(),
+        workspace_id=workspace_id,
+        current_gate_state=None,
+        latest_boe_run_id=None,
+        gate_status=gate_status,
+        gate_status_computed=gate_status,
+        gate_override_status=None,
+        gate_updated_at=None,
+    )
+
+
+def _job(**overrides):
+    values = dict(
+        id=uuid4(),
+        workspace_id=None,
+        status=BOERegateStatus.QUEUED,
+        reason=None,
+        chunk_size=2,
+        cursor_deal_id=None,
+        total_deals=None,
+        processed=0,
+        failed=0,
+        transitions=0,
+        elapsed_seconds=0.0,
+        error=None,
+        started_at=None,
+        checkpointed_at=None,
+        finished_at=None,
+        created_by=uuid4(),
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _paginate(monkeypatch, rows, fail_after=None):
+    calls = []
+
+    def fake_page(_db, *, after_deal_id=None, limit, workspace_id=None):
+        calls.append(after_deal_id)
+        if fail_after is not None and len(calls) > fail_after:
+            raise RuntimeError("connection lost")
+        remaining = [row for row in rows if after_deal_id is None or str(row.deal_id) > str(after_deal_id)]
+        return remaining[:limit]
+
+    monkeypatch.setattr(boe_regate, "latest_inputs_page", fake_page)
+    monkeypatch.setattr(boe_regate, "count_regate_deals", lambda _db, _workspace_id=None: len(rows))
+    return calls
+
+
+def _rows(deals, inputs):
+    pairs = sorted(zip(deals, inputs), key=lambda pair: str(pair[0].id))
+    return [SimpleNamespace(deal_id=d.id, workspace_id=d.workspace_id, inputs=i) for d, i in pairs]
+
+
+def test_regate_walks_pages_by_keyset_and_reports_progress(monkeypatch):
+    ws_a, ws_b = uuid4(), uuid4()
+    deals = [_deal(ws_a), _deal(ws_b), _deal(ws_a, DealStatus.ADVANCE), _deal(ws_b, DealStatus.BLOCKED), _deal(ws_a)]
+    inputs = [ADVANCE_INPUTS, KILL_INPUTS, ADVANCE_INPUTS, KILL_INPUTS, {**ADVANCE_INPUTS, "bogus": 1}]
+    rows = _rows(deals, inputs)
+    calls = _paginate(monkeypatch, rows)
+    db = FakeDB(deals)
+    ticks = count(0.0, 0.5)
+    progress = []
+
+    job = boe_regate.run_regate_job(db, _job(), clock=lambda: next(ticks), on_progress=progress.append)
+
+    assert calls == [None, rows[1].deal_id, rows[3].deal_id, rows[4].deal_id]
+    assert job.status == BOERegateStatus.SUCCEEDED
+    assert (job.processed, job.failed, job.transitions, job.total_deals) == (5, 1, 2, 5)
+    assert job.cursor_deal_id == rows[-1].deal_id
+    assert [p["processed"] for p in progress] == [2, 4, 5]
+    assert progress[-1]["percent_complete"] == 100.0
+    assert progress[-1]["deals_per_second"] == pytest.approx(5 / 1.5)
+    # One commit to mark the job running, one checkpoint per page, one to finish.
+    assert db.commits == 5
+    events = [e for e in db.added if getattr(e, "event_type", None) == "COMPUTED_TRANSITION"]
+    assert len(events) == 2 and {e.reason for e in events} == {boe_regate.REGATE_REASON}
+
+
+def test_regate_resumes_from_last_checkpoint(monkeypatch):
+    workspace_id = uuid4()
+    deals = [_deal(workspace_id) for _ in range(5)]
+    rows = _rows(deals, [ADVANCE_INPUTS] * 5)
+    _paginate(monkeypatch, rows, fail_after=2)
+    db = FakeDB(deals)
+    job = _job()
+
+    with pytest.raises(RuntimeError):
+        boe_regate.run_regate_job(db, job)
+    assert job.status == BOERegateStatus.RUNNING
+    assert (job.processed, job.cursor_deal_id) == (4, rows[3].deal_id)
+
+    calls = _paginate(monkeypatch, rows)
+    boe_regate.run_regate_job(db, job)
+
+    assert calls[0] == rows[3].deal_id
+    assert job.status == BOERegateStatus.SUCCEEDED and job.processed == 5
+    scored = [row["deal_id"] for name, params in db.executed if name == "boe_runs" for row in params]
+    assert sorted(map(str, scored)) == sorted(str(d.id) for d in deals)
+
+
+def test_only_owners_can_start_regate_jobs():
+    db = FakeDB([], [SimpleNamespace(role=MemberRole.MEMBER)])
+    with pytest.raises(HTTPException) as exc:
+        boe.create_boe_regate_job(uuid4(), BOERegateCreate(), db, SimpleNamespace(id=uuid4()))
+    assert exc.value.status_code == 403
+
+
+def test_start_regate_job_enqueues_worker(monkeypatch):
+    enqueued = []
+    monkeypatch.setattr(boe, "get_boe_queue", lambda: SimpleNamespace(enqueue=lambda *args: enqueued.append(args)))
+    db = FakeDB([], [SimpleNamespace(role=MemberRole.OWNER)])
+    workspace_id = uuid4()
+
+    out = boe.create_boe_regate_job(workspace_id, BOERegateCreate(reason="DSCR floor raised"), db, SimpleNamespace(id=uuid4()))
+
+    job = db.added[0]
+    assert out["status"] == "QUEUED" and out["reason"] == "DSCR floor raised"
+    assert job.workspace_id == workspace_id and job.chunk_size == boe.settings.boe_regate_chunk_size
+    assert enqueued == [(boe.process_boe_regate_job, str(job.id))]
+
+
+def test_failed_and_stalled_regate_jobs_resume(monkeypatch):
+    enqueued = []
+    monkeypatch.setattr(boe, "get_boe_queue", lambda: SimpleNamespace(enqueue=lambda *args: enqueued.append(args)))
+    owner = SimpleNamespace(role=MemberRole.OWNER)
+    now = datetime.now(timezone.utc)
+    running = _job(status=BOERegateStatus.RUNNING, started_at=now - timedelta(hours=2), checkpointed_at=now)
+    with pytest.raises(HTTPException) as exc:
+        boe.resume_boe_regate_job(uuid4(), running.id, FakeDB([], [owner, running]), SimpleNamespace(id=uuid4()))
+    assert exc.value.status_code == 409
+
+    failed = _job(status=BOERegateStatus.FAILED, processed=4, error="connection lost")
+    out = boe.resume_boe_regate_job(uuid4(), failed.id, FakeDB([], [owner, failed]), SimpleNamespace(id=uuid4()))
+    assert out["status"] == "QUEUED" and out["processed"] == 4
+
+    stale = now - timedelta(seconds=boe.settings.boe_regate_stale_after_seconds + 1)
+    crashed = _job(status=BOERegateStatus.RUNNING, processed=6, checkpointed_at=stale)
+    out = boe.resume_boe_regate_job(uuid4(), crashed.id, FakeDB([], [owner, crashed]), SimpleNamespace(id=uuid4()))
+    assert out["status"] == "QUEUED" and out["processed"] == 6
+    assert enqueued == [(boe.process_boe_regate_job, str(failed.id)), (boe.process_boe_regate_job, str(crashed.id))]
+
+
+def test_stalled_means_running_without_a_recent_checkpoint():
+    now = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    checkpoint = now - timedelta(seconds=120)
+
+    assert boe_regate.regate_job_stalled(_job(status=BOERegateStatus.RUNNING, checkpointed_at=checkpoint), 60, now)
+    assert not boe_regate.regate_job_stalled(_job(status=BOERegateStatus.RUNNING, checkpointed_at=checkpoint), 300, now)
+    naive_start = datetime(2024, 1, 1, 11)
+    assert boe_regate.regate_job_stalled(_job(status=BOERegateStatus.RUNNING, started_at=naive_start), 300, now)
+    assert not boe_regate.regate_job_stalled(_job(status=BOERegateStatus.QUEUED), 0, now)
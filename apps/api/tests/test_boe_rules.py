@@ -0,0 +1,89 @@
+from dataclasses import replace
+
+import pytest
+
+from app.boe.engine import (
+    BOE_RULES,
+    RESULT_CODES,
+    BOEInput,
+    BOERule,
+    TestClass,
+    TestResult,
+    _fmt_num,
+    boe_input_columns,
+    calculate_boe,
+    calculate_boe_batch,
+    compile_rules,
+    with_thresholds,
+)
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+
+
+def _results(batch, index=0):
+    return {key: RESULT_CODES[int(codes.flat[index])] for key, codes in batch.results.items()}
+
+
+def test_default_table_reproduces_scalar_display_strings():
+    _, tests, _ = calculate_boe(BOEInput(**BASE_INPUTS))
+    displays = {t.key: t.threshold_display for t in tests}
+
+    assert [t.key for t in tests] == [rule.key for rule in BOE_RULES]
+    assert displays["yield_on_cost"] == ">= Exit Cap + 1.00% (5.00% + 1.00%)"
+    assert displays["capex_value_multiple"] == ">= 2.00x"
+    assert displays["cash_on_cash"] == ">= 4.50%"
+    assert displays["dscr"] == "PASS>=1.25 | WARN>=1.15 | FAIL<1.15"
+    assert displays["expense_ratio"] == ">= 28.00%"
+
+
+def test_threshold_overrides_change_results_and_displays():
+    strict = with_thresholds({"dscr": {"threshold": 2.0, "warn_threshold": 1.5}, "expense_ratio": {"threshold": 0.5}})
+    default = calculate_boe_batch(boe_input_columns([BASE_INPUTS]))
+    custom = calculate_boe_batch(boe_input_columns([BASE_INPUTS]), rules=strict)
+
+    assert _results(default)["dscr"] == TestResult.PASS
+    assert _results(custom)["dscr"] == TestResult.WARN
+    assert _results(custom)["expense_ratio"] == TestResult.FAIL
+    _, tests, decision = custom.row(0)
+    assert next(t for t in tests if t.key == "dscr").threshold_display == "PASS>=2.00 | WARN>=1.50 | FAIL<1.50"
+    assert decision.pass_count == calculate_boe(BOEInput(**BASE_INPUTS))[2].pass_count - 1
+    assert compile_rules(strict) is compile_rules(strict)
+
+
+def test_custom_rules_support_at_most_comparator_and_any_metric():
+    rules = BOE_RULES + (
+        BOERule(
+            "max_ltc",
+            "LTC Ceiling",
+            TestClass.SOFT,
+            "ltc",
+            _fmt_num,
+            lambda _r, t, _out: f"<= {_fmt_num(t)}",
+            threshold=0.65,
+            comparator="<=",
+        ),
+    )
+    batch = calculate_boe_batch(boe_input_columns([BASE_INPUTS, {**BASE_INPUTS, "ltc": 0.6}]), rules=rules)
+
+    assert batch.total_tests == 8
+    assert [_results(batch, i)["max_ltc"] for i in range(2)] == [TestResult.FAIL, TestResult.PASS]
+    assert batch.row(1)[1][-1].threshold_display == "<= 0.65"
+
+
+def test_invalid_rule_tables_are_rejected():
+    with pytest.raises(ValueError):
+        with_thresholds({"dscrr": {"threshold": 1.0}})
+    with pytest.raises(ValueError):
+        compile_rules((replace(BOE_RULES[0], comparator=">"),))
+    with pytest.raises(ValueError):
+        compile_rules((replace(BOE_RULES[1], threshold=None),))
@@ -0,0 +1,71 @@
+import pytest
+
+from app.boe.engine import BOEInput, calculate_boe
+from app.services.boe_sensitivity import SensitivityAxis, build_sensitivity_grid
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+}
+
+
+def test_two_axis_grid_matches_scalar_engine_cell_by_cell():
+    axes = [
+        SensitivityAxis(field="interest_rate", start=0.04, stop=0.09, steps=6),
+        SensitivityAxis(field="y1_exit_cap_rate", start=0.04, stop=0.07, steps=4),
+    ]
+    payload = build_sensitivity_grid(BASE_INPUTS, axes)
+
+    assert [len(a["values"]) for a in payload["axes"]] == [6, 4]
+    assert len(payload["max_bid"]) == 6 and len(payload["max_bid"][0]) == 4
+    for i, rate in enumerate(payload["axes"][0]["values"]):
+        for j, cap in enumerate(payload["axes"][1]["values"]):
+            output, _, decision = calculate_boe(BOEInput(**{**BASE_INPUTS, "interest_rate": rate, "y1_exit_cap_rate": cap}))
+            assert payload["max_bid"][i][j] == output.boe_max_bid
+            assert payload["binding_constraint"][i][j] == output.binding_constraint
+            assert payload["gate_status"][i][j] == decision.status.value
+
+
+def test_single_axis_grid_and_tornado_ordering():
+    axes = [
+        SensitivityAxis(field="ltc", start=0.5, stop=0.8, steps=4),
+        SensitivityAxis(field="y1_noi", start=500_000, stop=900_000, steps=5),
+    ]
+    payload = build_sensitivity_grid(BASE_INPUTS, axes)
+    spreads = [bar["spread"] for bar in payload["tornado"]]
+    assert spreads == sorted(spreads, reverse=True)
+    assert payload["tornado"][0]["field"] == "y1_noi"
+
+    single = build_sensitivity_grid(BASE_INPUTS, axes[:1])
+    assert len(single["max_bid"]) == 4
+    assert single["base"]["status"] == calculate_boe(BOEInput(**BASE_INPUTS))[2].status.value
+
+
+def test_missing_values_surface_as_none():
+    payload = build_sensitivity_grid(
+        {**BASE_INPUTS, "y1_noi": None, "gross_income": None},
+        [SensitivityAxis(field="interest_rate", start=0.05, stop=0.06, steps=2)],
+    )
+    assert payload["max_bid"] == [None, None]
+    assert payload["binding_constraint"] == [None, None]
+
+
+@pytest.mark.parametrize(
+    "axes",
+    [
+        [],
+        [SensitivityAxis(field="ltc", start=0.5, stop=0.8, steps=4)] * 2,
+        [SensitivityAxis(field="ltv", start=0.5, stop=0.8, steps=4)],
+        [SensitivityAxis(field="ltc", start=0.5, stop=0.8, steps=1)],
+    ],
+)
+def test_invalid_axes_are_rejected(axes):
+    with pytest.raises(ValueError):
+        build_sensitivity_grid(BASE_INPUTS, axes)
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from app.boe.engine import BOEInput, calculate_boe
+from app.services import boe_solver
+from app.services.boe_solver import solve_gate_flip
+
+BASE_INPUTS = {
+    "asking_price": 10_000_000,
+    "interest_rate": 0.06,
+    "ltc": 0.7,
+    "capex_budget": 1_000_000,
+    "seller_noi_from_om": 600_000,
+    "gross_income": 1_000_000,
+    "operating_expenses": 300_000,
+    "y1_noi": 700_000,
+    "y1_exit_cap_rate": 0.05,
+    "market_cap_rate": 0.06,
+}
+
+
+def _status_at(field, value):
+    return calculate_boe(BOEInput(**{**BASE_INPUTS, field: value}))[2].status.value
+
+
+def test_closed_form_asking_price_flip_matches_engine():
+    result = solve_gate_flip(BASE_INPUTS)
+
+    assert result["method"] == "closed_form"
+    assert result["current_status"] == "ADVANCE"
+    flip = result["flip_value"]
+    assert flip == pytest.approx(10_666_666.67, rel=1e-9)
+    assert _status_at("asking_price", flip * (1 - 1e-6)) == "ADVANCE"
+    assert _status_at("asking_price", flip * (1 + 1e-6)) == "BLOCKED"
+    assert result["transitions"] == [{"value": flip, "from": "ADVANCE", "to": "BLOCKED"}]
+    assert result["tests"]["yield_on_cost"]["flips"] == [flip]
+    assert result["tests"]["capex_value_multiple"]["flips"] == [pytest.approx(12_000_000)]
+    assert result["tests"]["expense_ratio"]["flips"] == []
+
+
+def test_root_finder_agrees_with_closed_form(monkeypatch):
+    boe_solver._cache.clear()
+    closed = solve_gate_flip(BASE_INPUTS)
+    boe_solver._cache.clear()
+    monkeypatch.setattr(boe_solver, "_asking_price_boundaries", lambda _inputs: None)
+    scanned = solve_gate_flip(BASE_INPUTS)
+
+    assert scanned["method"] == "root_finding"
+    assert scanned["flip_value"] == pytest.approx(closed["flip_value"], rel=1e-9)
+    for key, test in closed["tests"].items():
+        assert scanned["tests"][key]["flips"] == pytest.approx(test["flips"], rel=1e-9)
+
+
+def _random_priced_inputs(rng, rate, ltc):
+    return {
+        "asking_price": float(rng.uniform(5e6, 20e6)),
+        "interest_rate": rate,
+        "ltc": ltc,
+        "capex_budget": float(rng.choice([0.0, rng.uniform(2e5, 3e6)])),
+        "soft_cost_pct": float(rng.uniform(0, 0.05)),
+        "reserves": float(rng.uniform(0, 2e5)),
+        "seller_noi_from_om": float(rng.uniform(3e5, 1e6)),
+        "gross_income": float(rng.uniform(8e5, 2e6)),
+        "operating_expenses": float(rng.uniform(2e5, 8e5)),
+        "y1_noi": float(rng.uniform(3e5, 1.2e6)),
+        "y1_exit_cap_rate": float(rng.uniform(0.04, 0.08)),
+        "market_cap_rate": float(rng.uniform(0.04, 0.08)),
+    }
+
+
+@pytest.mark.parametrize("rate_kind", ["zero", "positive"])
+@pytest.mark.parametrize("ltc_kind", ["zero", "levered"])
+def test_closed_form_matches_root_finding_on_random_inputs(monkeypatch, rate_kind, ltc_kind):
+    rng = np.random.default_rng(20240105)
+    cases = []
+    for _ in range(10):
+        rate = 0.0 if rate_kind == "zero" else float(rng.uniform(0.02, 0.09))
+        ltc = 0.0 if ltc_kind == "zero" else float(rng.uniform(0.4, 0.8))
+        cases.append(_random_priced_inputs(rng, rate, ltc))
+
+    boe_solver._cache.clear()
+    closed = [solve_gate_flip(inputs) for inputs in cases]
+    boe_solver._cache.clear()
+    monkeypatch.setattr(boe_solver, "_asking_price_boundaries", lambda _inputs: None)
+    scanned = [solve_gate_flip(inputs) for inputs in cases]
+
+    for inputs, c, r in zip(cases, closed, scanned):
+        assert c["method"] == "closed_form" and r["method"] == "root_finding"
+        for key, test in r["tests"].items():
+            assert c["tests"][key]["flips"] == pytest.approx(test["flips"], rel=1e-9), (key, inputs)
+
+
+def test_other_inputs_use_root_finding():
+    result = solve_gate_flip(BASE_INPUTS, field="y1_noi", low=0, high=2_000_000)
+
+    assert result["method"] == "root_finding"
+    flip = result["flip_value"]
+    assert _status_at("y1_noi", flip * (1 + 1e-6)) == "ADVANCE"
+    assert _status_at("y1_noi", flip * (1 - 1e-6)) != "ADVANCE"
+
+
+def test_results_are_cached_by_input_hash(monkeypatch):
+    boe_solver._cache.clear()
+    first = solve_gate_flip(BASE_INPUTS, field="interest_rate")
+    monkeypatch.setattr(boe_solver, "_solve", lambda *_args: pytest.fail("expected a cache hit"))
+    second = solve_gate_flip(dict(reversed(list(BASE_INPUTS.items()))), field="interest_rate")
+
+    assert second == first
+    second["tests"].clear()
+    assert solve_gate_flip(BASE_INPUTS, field="interest_rate")["tests"]
+
+
+def test_invalid_requests_are_rejected():
+    with pytest.raises(ValueError):
+        solve_gate_flip(BASE_INPUTS, field="ltv")
+    with pytest.raises(ValueError):
+        solve_gate_flip({**BASE_INPUTS, "reserves": None}, field="reserves")
+    with pytest.raises(ValueError):
+        solve_gate_flip(BASE_INPUTS, low=5, high=1)
@@ -0,0 +1,119 @@
+import json
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.api import comps
+from app.db.base import Base
+from app.db.bulk import BulkWriter
+from app.models.entities import CompListing, CompRollup, CompRun, CompSubject, CompSubjectVariance
+from app.models.enums import CompRunStatus, ListingSourceType, UnitType
+from app.schemas.comps import CompRunManualCreate
+
+
+class FakeCopy:
+    def __init__(self):
+        self.sql, self.rows = None, []
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakePsycopg:
+    def __init__(self):
+        self.copy_ = FakeCopy()
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    @contextmanager
+    def copy(self, sql):
+        self.copy_.sql = sql
+        yield self.copy_
+
+
+def _listing(run_id, **overrides):
+    return {
+        "comp_run_id": run_id,
+        "unit_type": UnitType.BR1,
+        "address": "10 Main St",
+        "rent": 3000.0,
+        "date_observed": date(2024, 1, 5),
+        "source_type": ListingSourceType.PRIVATE_FILE,
+        "dedupe_key": "10 main st||1.00|1.00|2024-01-05",
+        "flags": {"old": True},
+        **overrides,
+    }
+
+
+def _sqlite_session():
+    engine = create_engine("sqlite://")
+    tables = [CompRun, CompListing, CompRollup, CompSubject, CompSubjectVariance]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in tables])
+    return Session(engine)
+
+
+def test_postgres_rows_are_streamed_with_copy():
+    raw = FakePsycopg()
+    flushed = []
+    bind = SimpleNamespace(dialect=postgresql.psycopg.dialect())
+    connection = SimpleNamespace(connection=SimpleNamespace(dbapi_connection=raw))
+    db = SimpleNamespace(get_bind=lambda: bind, connection=lambda: connection, flush=lambda: flushed.append(True))
+    run_id = uuid4()
+
+    writer = BulkWriter(db, CompListing)
+    assert writer.write([_listing(run_id), _listing(run_id, rent=None, flags={})]) == 2
+
+    assert writer.method == "copy" and flushed
+    assert raw.copy_.sql.startswith("COPY comp_listings (id, comp_run_id, unit_type, address,")
+    columns = [column.name for column in CompListing.__table__.columns]
+    first = dict(zip(columns, raw.copy_.rows[0]))
+    assert isinstance(first["id"], UUID) and first["comp_run_id"] == run_id
+    assert first["unit_type"] == "BR1" and first["source_type"] == "PRIVATE_FILE"
+    assert json.loads(first["flags"]) == {"old": True} and first["observed_at"] is not None
+    assert dict(zip(columns, raw.copy_.rows[1]))["rent"] is None
+    assert writer.report()["rows"] == 2
+
+
+def test_other_dialects_insert_in_batches():
+    with _sqlite_session() as db:
+        run = CompRun(workspace_id=uuid4(), deal_id=uuid4(), created_by=uuid4(), status=CompRunStatus.RUNNING)
+        db.add(run)
+        db.flush()
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        writer = BulkWriter(db, CompListing, batch_size=2)
+        writer.write(_listing(run.id, unit=str(i)) for i in range(5))
+
+        listings = db.scalars(select(CompListing).order_by(CompListing.unit)).all()
+        assert [listing.unit for listing in listings] == ["0", "1", "2", "3", "4"]
+        assert listings[0].flags == {"old": True} and listings[0].unit_type == UnitType.BR1
+        assert sum(sql.startswith("INSERT INTO comp_listings") for sql in statements) == 3
+        assert writer.report()["method"] == "insert"
+
+
+def test_manual_run_bulk_writes_listings_and_aggregates(monkeypatch):
+    with _sqlite_session() as db:
+        deal = SimpleNamespace(id=uuid4(), workspace_id=uuid4())
+        monkeypatch.setattr(comps, "_assert_deal_access", lambda *_args: deal)
+        db.add(CompSubject(deal_id=deal.id, unit_type=UnitType.BR1, subject_rent=3300.0, updated_by=uuid4()))
+        listings = [
+            {"address": f"{n} Main St", "unit": "1", "beds": 1, "baths": 1, "rent": 3000.0 + n, "gross_rent": 3100.0}
+            for n in range(3)
+        ]
+        payload = CompRunManualCreate(filters={}, listings=listings)
+
+        run = comps.create_manual_comp_run(deal.id, payload, db, SimpleNamespace(id=uuid4()))
+
+        assert run.status == CompRunStatus.SUCCEEDED and run.parse_report["write"]["rows"] == 3
+        rollup = db.scalar(select(CompRollup))
+        assert (rollup.unit_type, rollup.sample_size, rollup.avg_rent) == (UnitType.BR1, 3, 3001.0)
+        variance = db.scalar(select(CompSubjectVariance))
+        assert round(variance.variance_net, 4) == round((3300 - 3001) / 3001, 4)
@@ -0,0 +1,85 @@
+import dataclasses
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook
+
+from app.ingestors.files import parse_csv, parse_xlsx
+
+pytest.importorskip("pyarrow")
+
+CSV = """address,Address,unit,Beds,baths,rent,Gross Rent,date_observed,link,Notes
+10 Main St,,2A,1,1,3000,3200,2024-01-05,https://x,first
+,  20  OAK   Ave ,,0,,,2500,2024-02-30T10:00,,
+,30 Elm St, 3b ,2.5,1.5, 2800 ,abc,2024-03-01 09:15:00,,
+,,1,1,1,2000,2100,2024-01-01,,
+40 Pine St,ignored,,4,2,4000,0,,,note
+50 Birch St,,,n/a,1_0,1e3,3500,garbage,,
+"""
+
+
+def _comparable(rows):
+    return [{**dataclasses.asdict(row), "observed_at": None} for row in rows]
+
+
+def test_columnar_csv_matches_row_parser(tmp_path):
+    path = tmp_path / "comps.csv"
+    path.write_text(CSV)
+
+    rows, report = parse_csv(str(path))
+    columnar_rows, columnar_report = parse_csv(str(path), use_columnar=True)
+
+    assert _comparable(columnar_rows) == _comparable(rows)
+    assert columnar_report.pop("mode") == "columnar" and columnar_report == report
+    assert report["rows_parsed"] == 5 and report["rows_dropped"] == 1
+
+
+@pytest.mark.parametrize(
+    "ragged", ["60 Cedar St,,1,2,1", "70 Ash St,,1,2,1,2900,3000,2024-04-01,,x,extra"]
+)
+def test_ragged_csv_falls_back_to_row_parser(tmp_path, ragged):
+    path = tmp_path / "comps.csv"
+    path.write_text(CSV + ragged + "\n80 Spruce St,,,1,1,2600,,,,\n")
+
+    rows, report = parse_csv(str(path))
+    columnar_rows, columnar_report = parse_csv(str(path), use_columnar=True)
+
+    assert _comparable(columnar_rows) == _comparable(rows)
+    assert "Expected 10 columns" in columnar_report.pop("columnar_fallback")
+    assert columnar_report.pop("mode") == "columnar" and columnar_report == report
+    assert report["rows_parsed"] == 7 and report["rows_dropped"] == 1
+
+
+def test_ragged_row_after_first_block_resumes_where_columnar_stopped(tmp_path):
+    path = tmp_path / "comps.csv"
+    # Well past pyarrow's 1 MB block size, so some batches are yielded before the ragged row.
+    line = "{n} Main St,,{beds},1,1,{rent},,2024-01-05,,padding padding padding\n"
+    body = "".join(line.format(n=n, beds=n % 7, rent=2000 + n) for n in range(30_000))
+    path.write_text(CSV + body + "99 Last St,,1\n")
+
+    rows, report = parse_csv(str(path))
+    columnar_rows, columnar_report = parse_csv(str(path), use_columnar=True)
+
+    assert _comparable(columnar_rows) == _comparable(rows)
+    assert columnar_report.pop("columnar_fallback") and columnar_report.pop("mode") == "columnar"
+    assert columnar_report == report and report["rows_parsed"] == 30_006
+
+
+def test_columnar_xlsx_matches_row_parser(tmp_path):
+    path = tmp_path / "comps.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Address", "Unit", "Beds", "Baths", "Rent", "Gross Rent", "Date Rented", "Notes"])
+    ws.append(["10 Main St", "2A", 1, 1, 3000, 3200.5, datetime(2024, 1, 5), "ok"])
+    ws.append(["20 Oak Ave", 7, 3, None, "2,900", 3100, "2024-01-05", None])
+    ws.append([None, "1", 1, 1, 2000, 2100, None, None])
+    ws.append([0, "1", 1, 1, 2000, 2100, None, None])
+    wb.save(path)
+
+    rows, report = parse_xlsx(str(path), backend="openpyxl")
+    columnar_rows, columnar_report = parse_xlsx(str(path), use_columnar=True, backend="openpyxl")
+
+    assert _comparable(columnar_rows) == _comparable(rows)
+    assert columnar_report["mode"] == "columnar"
+    assert (columnar_report["rows_parsed"], columnar_report["rows_dropped"]) == (2, 2)
+    assert (report["rows_parsed"], report["rows_dropped"]) == (2, 2)
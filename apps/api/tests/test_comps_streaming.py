@@ -0,0 +1,124 @@
+import copy
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.ingestors.files import iter_csv_chunks, parse_csv
+from app.models.entities import CompListing, CompRollup, CompRun, CompSubject, CompSubjectVariance
+from app.models.enums import CompRunStatus, ListingSourceType
+from app.services.comps import (
+    CompRowStream,
+    build_normalized_row,
+    compute_rollups,
+    dedupe_rows,
+    flag_old_rows,
+    flag_outliers_iqr,
+)
+from app.workers import jobs
+
+
+def _rows():
+    today = date.today()
+    rows = []
+    for i in range(60):
+        k = i % 23
+        rows.append(
+            build_normalized_row(
+                address=f"{k} Main St",
+                unit=str(k % 3),
+                beds=float(k % 4),
+                baths=1,
+                rent=None if i % 11 == 0 else 2000.0 + (i % 7) * 150 + (9000 if i == 17 else 0),
+                gross_rent=2500.0 + i,
+                date_observed=today - timedelta(days=k * 20),
+                link=None,
+                notes=None,
+                source_type=ListingSourceType.PRIVATE_FILE,
+                source_ref="export.csv",
+                confidence_score=[0.5, 0.9, 0.7][i % 3],
+            )
+        )
+    return rows
+
+
+def _batch_pipeline(rows):
+    rows = dedupe_rows(copy.deepcopy(rows))
+    flag_outliers_iqr(rows)
+    flag_old_rows(rows, 180)
+    return rows
+
+
+def test_csv_chunks_stream_rows_and_count_drops(tmp_path):
+    path = tmp_path / "comps.csv"
+    lines = ["Address,Unit,Beds,Rent,Date Rented"]
+    lines += [f"{i} Main St,{i},1,{2000 + i},2024-01-0{1 + i % 9}" for i in range(7)]
+    lines.append(",9,1,2500,2024-01-01")
+    path.write_text("\n".join(lines) + "\n")
+
+    report = {}
+    chunks = list(iter_csv_chunks(str(path), 3, report))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert report == {"type": "csv", "rows_parsed": 7, "rows_dropped": 1, "unmapped_columns": []}
+    rows, parsed = parse_csv(str(path))
+    assert len(rows) == 7 and parsed == report
+
+
+def test_stream_matches_list_pipeline_across_drains():
+    rows = _rows()
+    expected = _batch_pipeline(rows)
+    stream = CompRowStream(180)
+    stored, flagged = {}, set()
+
+    def flush():
+        batch = stream.drain()
+        for row_id in batch.deletes:
+            del stored[row_id]
+        flagged.update(batch.duplicates)
+        stored.update(batch.inserts)
+
+    for i, row in enumerate(copy.deepcopy(rows)):
+        stream.add(row)
+        if i % 13 == 0:
+            flush()
+    flush()
+
+    bounds = stream.outlier_bounds()
+    for row_id, row in stored.items():
+        if row_id in flagged:
+            row.flags = {**row.flags, "duplicate": True}
+        lower, upper = bounds.get(row.unit_type, (float("-inf"), float("inf")))
+        if row.rent is not None and not lower <= row.rent <= upper:
+            row.flags = {**row.flags, "outlier": True}
+
+    key = lambda r: r.dedupe_key  # noqa: E731
+    assert [(r.dedupe_key, r.rent, r.flags) for r in sorted(stored.values(), key=key)] == [
+        (r.dedupe_key, r.rent, r.flags) for r in sorted(expected, key=key)
+    ]
+    assert len(stream) == len(expected) and stream.rows_seen == len(rows)
+    assert stream.rollups() == compute_rollups(expected)
+
+
+def test_persist_streams_listings_and_aggregates(monkeypatch):
+    engine = create_engine("sqlite://")
+    tables = [CompRun, CompListing, CompRollup, CompSubject, CompSubjectVariance]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in tables])
+    monkeypatch.setattr(jobs.settings, "comp_ingest_flush_size", 7)
+    rows = _rows()
+    expected = {r.dedupe_key: r.flags for r in _batch_pipeline(rows)}
+
+    with Session(engine) as db:
+        run = CompRun(workspace_id=uuid4(), deal_id=uuid4(), created_by=uuid4(), status=CompRunStatus.RUNNING)
+        db.add(run)
+        db.flush()
+        report = {"type": "csv"}
+        jobs._persist_rows_and_aggregates(db, run, iter(copy.deepcopy(rows)), parse_report=report)
+        db.commit()
+
+        listings = db.scalars(select(CompListing)).all()
+        assert {listing.dedupe_key: listing.flags for listing in listings} == expected
+        assert sum(r.sample_size for r in db.scalars(select(CompRollup))) == len(expected)
+        assert run.status == CompRunStatus.SUCCEEDED and run.parse_report == report
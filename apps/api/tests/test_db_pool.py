@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+
+from app import main
+from app.db.pool import InstrumentedQueuePool, pool_snapshot
+from app.db.session import engine_options
+
+
+def test_exhausted_pool_counts_waits_and_timeouts():
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    held = engine.connect()
+
+    snapshot = pool_snapshot(engine)
+    assert (snapshot["size"], snapshot["in_use"], snapshot["overflow"]) == (1, 1, 0)
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    held.close()
+
+    snapshot = pool_snapshot(engine)
+    assert snapshot["in_use"] == 0 and snapshot["idle"] == 1
+    assert snapshot["checkouts"] == 2 and snapshot["timeouts"] == 1
+    assert snapshot["checkout_wait_seconds_max"] >= 0.05
+
+
+def test_overflow_connections_are_reported():
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=2)
+    connections = [engine.connect() for _ in range(2)]
+
+    assert pool_snapshot(engine)["overflow"] == 1
+    for connection in connections:
+        connection.close()
+
+
+def test_statement_timeout_is_passed_per_driver():
+    psycopg = engine_options("postgresql+psycopg://u:p@db/x", pool_size=5, max_overflow=1, statement_timeout_ms=1500)
+    assert psycopg["connect_args"] == {"options": "-c statement_timeout=1500"}
+    assert (psycopg["pool_size"], psycopg["max_overflow"]) == (5, 1)
+
+    asyncpg = engine_options("postgresql+asyncpg://u:p@db/x", pool_size=5, max_overflow=1, statement_timeout_ms=1500)
+    assert asyncpg["connect_args"] == {"server_settings": {"statement_timeout": "1500"}}
+
+    assert "connect_args" not in engine_options("postgresql+psycopg://u:p@db/x", pool_size=5, max_overflow=1, statement_timeout_ms=0)
+
+
+def test_metrics_endpoint_reports_api_pools():
+    pools = main.metrics()["db_pools"]
+    assert set(pools) == {"api", "api_async"}
+    assert pools["api"]["checkouts"] == 0 and "in_use" in pools["api_async"]
+
+
+def test_metrics_endpoint_requires_the_metrics_token(monkeypatch):
+    client = TestClient(main.app)
+    monkeypatch.setattr(main.settings, "metrics_token", "")
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(main.settings, "metrics_token", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200 and "db_pools" in response.json()
+    assert client.get("/health").status_code == 200
@@ -83,3 +83,46 @@ def test_workspace_member_viewer_role_migration_exists():
     migration = (MIGRATIONS_DIR / "0010_workspace_member_viewer_role.py").read_text(encoding="utf-8")
     assert "memberrole" in migration
     assert "VIEWER" in migration
+
+
+def test_boe_threshold_profiles_migration_exists():
+    migration = (MIGRATIONS_DIR / "0011_boe_threshold_profiles.py").read_text(encoding="utf-8")
+    assert "boe_threshold_profiles" in migration
+    assert "base_edition" in migration
+    assert "quorum_required" in migration
+    assert 'op.add_column("boe_runs", sa.Column("threshold_profile_version"' in migration
+
+
+def test_boe_regate_jobs_migration_exists():
+    migration = (MIGRATIONS_DIR / "0012_boe_regate_jobs.py").read_text(encoding="utf-8")
+    assert "boe_regate_jobs" in migration
+    assert "cursor_deal_id" in migration
+    assert 'down_revision = "0011_boe_threshold_profiles"' in migration
+
+
+def test_deal_gate_summary_migration_backfills_existing_deals():
+    migration = (MIGRATIONS_DIR / "0013_deal_gate_summary.py").read_text(encoding="utf-8")
+    assert '"deal_gate_summary"' in migration
+    assert "ix_deal_gate_summary_workspace_status" in migration
+    assert "INSERT INTO deal_gate_summary" in migration
+
+
+def test_workspace_gate_counters_migration_backfills_from_summary():
+    migration = (MIGRATIONS_DIR / "0014_workspace_gate_counters.py").read_text(encoding="utf-8")
+    assert '"workspace_gate_counters"' in migration
+    assert 'sa.PrimaryKeyConstraint("workspace_id", "metric", "bucket")' in migration
+    assert "INSERT INTO workspace_gate_counters" in migration
+    assert 'down_revision = "0013_deal_gate_summary"' in migration
+
+
+def test_deal_list_keyset_indexes_migration_exists():
+    migration = (MIGRATIONS_DIR / "0015_deal_list_indexes.py").read_text(encoding="utf-8")
+    assert '["workspace_id", "created_at", "id"]' in migration
+    assert '["workspace_id", "gate_status", "created_at", "id"]' in migration
+    assert "varchar_pattern_ops" in migration
+
+
+def test_activity_feed_keyset_indexes_migration_exists():
+    migration = (MIGRATIONS_DIR / "0016_activity_feed_indexes.py").read_text(encoding="utf-8")
+    assert '"deal_gate_events", ["deal_id", "created_at", "id"]' in migration
+    assert '"deal_comments", ["deal_id", "created_at", "id"]' in migration
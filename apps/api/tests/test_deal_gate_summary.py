@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.enums import DealStatus, TestClass, TestResult
+from app.services.deal_gate_summary import gate_summary_row, load_gate_summaries, record_gate_summaries
+from app.services.gate_summary import build_gate_summary
+
+
+class FakeDB:
+    def __init__(self, rows=(), scalars=(), scalar_responses=()):
+        self.rows = list(rows)
+        self.scalar_lists = list(scalars)
+        self.scalar_responses = list(scalar_responses)
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        return SimpleNamespace(all=lambda: list(self.rows))
+
+    def scalars(self, stmt):
+        self.statements.append((stmt, None))
+        values = self.scalar_lists.pop(0)
+        return SimpleNamespace(all=lambda: list(values))
+
+    def scalar(self, stmt):
+        self.statements.append((stmt, None))
+        return self.scalar_responses.pop(0)
+
+
+def _deal(**overrides):
+    values = dict(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        name="Deal",
+        gate_status=DealStatus.ADVANCE,
+        gate_status_computed=DealStatus.ADVANCE,
+        gate_override_status=None,
+        gate_override_reason=None,
+        gate_override_by=None,
+        gate_override_at=None,
+        gate_updated_at=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _test(key, test_class, result):
+    return SimpleNamespace(
+        test_key=key,
+        test_name=key,
+        test_class=test_class,
+        result=result,
+        threshold=None,
+        actual=None,
+        threshold_display="",
+        actual_display="",
+    )
+
+
+def test_row_matches_full_gate_summary():
+    deal = _deal(gate_status=DealStatus.APPROVED, gate_override_status=DealStatus.APPROVED)
+    tests = [
+        _test("yield_on_cost", TestClass.HARD, TestResult.FAIL),
+        _test("dscr", TestClass.SOFT, TestResult.WARN),
+        _test("expense_ratio", TestClass.SOFT, TestResult.FAIL),
+        _test("market_cap_rate", TestClass.SOFT, TestResult.NA),
+    ]
+    run = SimpleNamespace(id=uuid4(), binding_constraint="YOC", outputs={"boe_max_bid": 9_500_000.0}, created_at=None)
+    full = build_gate_summary(deal=deal, latest_run=run, tests=tests, audit_trail_count=3)
+
+    row = gate_summary_row(
+        deal,
+        latest_run_id=run.id,
+        binding_constraint=run.binding_constraint,
+        outputs=run.outputs,
+        tests=[(t.test_key, t.test_class.value, t.result.value) for t in tests],
+        audit_trail_count=3,
+    )
+
+    assert row["ic_score"] == full["ic_score"] == 60
+    assert row["effective_status"] == full["effective_status"]
+    assert row["computed_status"] == full["computed_status"]
+    assert row["has_override"] is full["has_override"] is True
+    assert row["pass_count"] == full["computed_pass_count"]
+    assert row["hard_veto_ok"] is full["computed_hard_veto_ok"]
+    assert row["boe_max_bid"] == full["explainability"]["boe_max_bid"]
+    assert row["test_results"]["market_cap_rate"] == "N/A"
+
+    no_run = build_gate_summary(deal=deal, latest_run=None, tests=[], audit_trail_count=0)
+    assert gate_summary_row(deal)["ic_score"] == no_run["ic_score"]
+    assert gate_summary_row(deal)["computed_status"] == no_run["computed_status"] == "NO_RUN"
+
+
+def test_repeat_deals_collapse_into_one_upsert_row():
+    deal = _deal()
+    db = FakeDB()
+    first = gate_summary_row(deal, latest_run_id=uuid4(), audit_trail_count=2)
+    second = gate_summary_row(deal, latest_run_id=uuid4(), audit_trail_count=1)
+
+    record_gate_summaries(db, [first, second])
+
+    (_, _), (stmt, params), (counter_stmt, counters) = db.statements
+    assert "ON CONFLICT (deal_id) DO UPDATE" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert params == [{**second, "audit_trail_count": 3}]
+    assert counter_stmt.table.name == "workspace_gate_counters"
+    assert {(row["metric"], row["bucket"]): row["value"] for row in counters}[("deals", "")] == 1
+
+
+def test_missing_rows_are_rebuilt_from_runs():
+    deal = _deal(gate_status=DealStatus.BLOCKED, gate_status_computed=DealStatus.BLOCKED)
+    run = SimpleNamespace(
+        id=uuid4(),
+        binding_constraint="YOC",
+        outputs={},
+        tests=[_test("yield_on_cost", TestClass.HARD, TestResult.FAIL)],
+    )
+    db = FakeDB(rows=[(deal, None)], scalar_responses=[run, 5])
+
+    (summary,) = load_gate_summaries(db, [deal.workspace_id])
+
+    assert summary["effective_status"] == "BLOCKED"
+    assert summary["ic_score"] == 75 and summary["audit_trail_count"] == 5
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api import deals
+from app.models.enums import DealGateState, DealStatus
+from app.services import deal_listing
+from app.services.deal_listing import DealFilters, list_deals_page
+from app.services.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+
+class FakeDB:
+    def __init__(self, rows=(), scalar_responses=()):
+        self.rows = list(rows)
+        self.scalar_responses = list(scalar_responses)
+        self.statements = []
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: list(self.rows))
+
+    def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.scalar_responses.pop(0)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _deals(n):
+    now = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    return [SimpleNamespace(id=uuid4(), created_at=now - timedelta(minutes=i)) for i in range(n)]
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    (deal,) = _deals(1)
+    assert decode_keyset_cursor(encode_keyset_cursor(deal.created_at, deal.id)) == (deal.created_at, deal.id)
+    with pytest.raises(ValueError):
+        decode_keyset_cursor("not-a-cursor")
+
+
+def test_first_page_uses_keyset_order_and_counter_total():
+    workspace_id = uuid4()
+    rows = _deals(4)
+    db = FakeDB(rows=rows, scalar_responses=[120])
+
+    page = list_deals_page(db, workspace_id, DealFilters(), limit=3)
+
+    assert page["items"] == rows[:3]
+    assert decode_keyset_cursor(page["next_cursor"]) == (rows[2].created_at, rows[2].id)
+    assert (page["total_estimate"], page["total_is_exact"]) == (120, True)
+    list_sql, total_sql = map(_sql, db.statements)
+    assert "ORDER BY deals.created_at DESC, deals.id DESC" in list_sql and "LIMIT 4" in list_sql
+    assert "FROM workspace_gate_counters" in total_sql and "metric = 'deals'" in total_sql
+
+
+def test_next_page_filters_after_cursor_and_skips_total():
+    workspace_id = uuid4()
+    rows = _deals(2)
+    db = FakeDB(rows=rows)
+    filters = DealFilters(
+        gate_status=DealStatus.ADVANCE,
+        current_gate_state=DealGateState.ADVANCE,
+        min_asking_price=Decimal("1000000"),
+        max_asking_price=Decimal("5000000"),
+        name_prefix="50%",
+    )
+
+    cursor = encode_keyset_cursor(rows[0].created_at, rows[0].id)
+    page = list_deals_page(db, workspace_id, filters, cursor=cursor, limit=2, include_total=False)
+
+    assert page["next_cursor"] is None and page["total_estimate"] is None
+    (list_stmt,) = db.statements
+    sql = _sql(list_stmt)
+    assert "(deals.created_at, deals.id) < (" in sql
+    assert "deals.gate_status = 'ADVANCE'" in sql and "deals.current_gate_state = 'ADVANCE'" in sql
+    assert "deals.asking_price >= 1000000" in sql and "deals.asking_price <= 5000000" in sql
+    assert "deals.name LIKE '50/%%' || '%%' ESCAPE '/'" in sql
+
+
+def test_status_only_filter_reads_status_counter_and_others_cap_the_count(monkeypatch):
+    db = FakeDB(scalar_responses=[7])
+    assert deal_listing.estimate_deal_count(db, uuid4(), DealFilters(gate_status=DealStatus.BLOCKED)) == (7, True)
+    assert "bucket = 'BLOCKED'" in _sql(db.statements[0])
+
+    monkeypatch.setattr(deal_listing, "COUNT_ESTIMATE_CAP", 100)
+    db = FakeDB(scalar_responses=[101])
+    assert deal_listing.estimate_deal_count(db, uuid4(), DealFilters(name_prefix="Queens")) == (100, False)
+    assert "LIMIT 101" in _sql(db.statements[0])
+
+
+def test_list_endpoint_validates_price_range_and_cursor(monkeypatch):
+    monkeypatch.setattr(deals, "_assert_workspace_access", lambda *_args, **_kwargs: None)
+    user = SimpleNamespace(id=uuid4())
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(
+            deals.list_deals(str(uuid4()), min_asking_price=Decimal(5), max_asking_price=Decimal(1), db=FakeDB(), user=user)
+        )
+    assert exc.value.status_code == 422
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(deals.list_deals(str(uuid4()), cursor="garbage", db=FakeDB(), user=user))
+    assert exc.value.status_code == 422
+
+
+def test_list_endpoint_clamps_page_size(monkeypatch):
+    monkeypatch.setattr(deals, "_assert_workspace_access", lambda *_args, **_kwargs: None)
+    db = FakeDB(rows=[], scalar_responses=[0])
+
+    page = asyncio.run(deals.list_deals(str(uuid4()), limit=10_000, db=db, user=SimpleNamespace(id=uuid4())))
+
+    assert page["items"] == [] and page["total_estimate"] == 0
+    assert f"LIMIT {deal_listing.DEAL_PAGE_MAX + 1}" in _sql(db.statements[0])
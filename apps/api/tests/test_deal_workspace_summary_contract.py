@@ -8,6 +8,7 @@ from app.models.enums import MemberRole, WorkspaceEdition
 class FakeDB:
     def __init__(self, scalar_responses):
         self.scalar_responses = list(scalar_responses)
+        self.info = {}
 
     def scalar(self, _stmt):
         return self.scalar_responses.pop(0)
@@ -8,12 +8,30 @@ from app.schemas.deal_workspace import DealOverrideActionRequest
 
 
 class FakeDB:
-    def __init__(self):
+    def __init__(self, summary_rows=()):
+        self.summary_rows = list(summary_rows)
         self.deleted = None
         self.committed = False
+        self.added = []
+        self.executed = []
 
-    def add(self, _obj):
-        return None
+    def add(self, obj):
+        self.added.append(obj)
+
+    def flush(self):
+        # Stand in for the column defaults the ORM fills on flush.
+        for obj in self.added:
+            obj.id = obj.id or uuid4()
+            obj.gate_status = obj.gate_status or DealStatus.NEEDS_WORK
+            obj.gate_status_computed = obj.gate_status_computed or DealStatus.NEEDS_WORK
+
+    def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        rows = list(self.summary_rows)
+        return SimpleNamespace(all=lambda: rows, first=lambda: rows[0] if rows else None)
+
+    def writes(self):
+        return [(stmt.table.name, params) for stmt, params in self.executed if getattr(stmt, "table", None) is not None]
 
     def commit(self):
         self.committed = True
@@ -44,6 +62,14 @@ def test_create_deal_assigns_fields(monkeypatch):
     assert result.asking_price == payload.asking_price
     assert result.created_by == user_id
     assert fake_db.committed is True
+    (_, (summary,)), (_, counters) = fake_db.writes()
+    assert summary["deal_id"] == result.id
+    assert {(row["metric"], row["bucket"]): row["value"] for row in counters} == {
+        ("deals", ""): 1,
+        ("status", "NEEDS_WORK"): 1,
+        ("ic_score_sum", ""): 100,
+    }
+    assert (summary["computed_status"], summary["effective_status"]) == ("NO_RUN", "NEEDS_WORK")
 
 
 def test_update_deal_patches_fields(monkeypatch):
@@ -66,8 +92,21 @@ def test_update_deal_patches_fields(monkeypatch):
     assert fake_db.committed is True
 
 
+def _summary_row(**values):
+    row = dict(
+        deal_id=uuid4(),
+        workspace_id=uuid4(),
+        effective_status="NEEDS_WORK",
+        has_override=False,
+        ic_score=90,
+        binding_constraint="DSCR",
+    )
+    row.update(values)
+    return SimpleNamespace(_mapping=row)
+
+
 def test_delete_deal_deletes_entity(monkeypatch):
-    fake_db = FakeDB()
+    fake_db = FakeDB([_summary_row(effective_status="ADVANCE")])
     deal_obj = SimpleNamespace(id=uuid4())
 
     monkeypatch.setattr(deals, "_get_deal_with_access", lambda *_args, **_kwargs: deal_obj)
@@ -76,6 +115,13 @@ def test_delete_deal_deletes_entity(monkeypatch):
 
     assert fake_db.deleted == deal_obj
     assert fake_db.committed is True
+    (_, counters), = [write for write in fake_db.writes() if write[0] == "workspace_gate_counters"]
+    assert {(row["metric"], row["bucket"]): row["value"] for row in counters} == {
+        ("deals", ""): -1,
+        ("status", "ADVANCE"): -1,
+        ("ic_score_sum", ""): -90,
+        ("binding", "DSCR"): -1,
+    }
 
 
 def test_override_gate_requires_reason(monkeypatch):
@@ -95,14 +141,17 @@ def test_override_gate_requires_reason(monkeypatch):
 
 
 def test_override_gate_set_and_clear(monkeypatch):
-    fake_db = FakeDB()
-    deal_obj = SimpleNamespace(id=uuid4())
+    fake_db = FakeDB([_summary_row()])
+    deal_obj = SimpleNamespace(id=uuid4(), gate_status=DealStatus.NEEDS_WORK, gate_override_status=None)
     calls = []
     monkeypatch.setattr(deals, "_get_deal_with_access", lambda *_args, **_kwargs: deal_obj)
     monkeypatch.setattr(deals, "_get_deal_member", lambda *_args, **_kwargs: SimpleNamespace(role=MemberRole.OWNER))
 
     def _fake_set_gate_override(_db, _deal, override_status, reason, override_by):
         calls.append((override_status, reason, override_by))
+        _deal.gate_override_status = override_status
+        _deal.gate_status = override_status or DealStatus.NEEDS_WORK
+        return True
 
     monkeypatch.setattr(deals, "set_gate_override", _fake_set_gate_override)
 
@@ -123,3 +172,8 @@ def test_override_gate_set_and_clear(monkeypatch):
     assert calls[0][0] == DealStatus.BLOCKED
     assert calls[1][0] is None
     assert fake_db.committed is True
+    writes = fake_db.writes()
+    # The fake summary row always reads NEEDS_WORK without an override, so clearing moves no counters.
+    assert [name for name, _ in writes] == ["deal_gate_summary", "workspace_gate_counters", "deal_gate_summary"]
+    set_counters = {(row["metric"], row["bucket"]): row["value"] for row in writes[1][1]}
+    assert set_counters == {("status", "BLOCKED"): 1, ("status", "NEEDS_WORK"): -1, ("overrides", ""): 1}
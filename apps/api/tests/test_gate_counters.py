@@ -0,0 +1,132 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.api import portfolio
+from app.services.analytics import build_portfolio_summary_payload
+from app.services.gate_counters import counter_deltas, reconcile_gate_counters
+
+
+class FakeDB:
+    def __init__(self, results=(), scalars=()):
+        self.results = list(results)
+        self.scalar_lists = list(scalars)
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        if not stmt.is_select:
+            return None
+        rows = self.results.pop(0)
+        return SimpleNamespace(all=lambda: list(rows))
+
+    def scalars(self, stmt):
+        self.statements.append((stmt, None))
+        values = self.scalar_lists.pop(0)
+        return SimpleNamespace(all=lambda: list(values))
+
+    def commit(self):
+        self.commits += 1
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
+
+def _summary(workspace_id, status, ic_score, has_override=False, binding=None):
+    return {
+        "workspace_id": workspace_id,
+        "effective_status": status,
+        "has_override": has_override,
+        "ic_score": ic_score,
+        "binding_constraint": binding,
+    }
+
+
+def test_gate_transition_moves_counters_between_buckets():
+    ws = uuid4()
+    before = [_summary(ws, "NEEDS_WORK", 80, binding="DSCR")]
+    after = [_summary(ws, "BLOCKED", 55, has_override=True, binding="YOC"), _summary(ws, "ADVANCE", 100)]
+
+    assert counter_deltas(before, after) == {
+        (ws, "deals", ""): 1,
+        (ws, "status", "NEEDS_WORK"): -1,
+        (ws, "status", "BLOCKED"): 1,
+        (ws, "status", "ADVANCE"): 1,
+        (ws, "overrides", ""): 1,
+        (ws, "ic_score_sum", ""): 75,
+        (ws, "binding", "DSCR"): -1,
+        (ws, "binding", "YOC"): 1,
+    }
+    assert counter_deltas(before, before) == {}
+
+
+def test_portfolio_reads_counters_in_one_query():
+    ws_a, ws_b = uuid4(), uuid4()
+    summaries = [
+        {**_summary(ws_a, "ADVANCE", 90, binding="YOC"), "explainability": {"binding_constraint": "YOC"}},
+        {**_summary(ws_b, "BLOCKED", 55, True, "CoC"), "explainability": {"binding_constraint": "CoC"}},
+        {**_summary(ws_b, "ADVANCE", 80, binding="YOC"), "explainability": {"binding_constraint": "YOC"}},
+    ]
+    # (metric, bucket, SUM(value)) across the caller's workspaces; drained buckets stay behind as zeros.
+    counters = [
+        ("deals", "", 3),
+        ("status", "ADVANCE", 2),
+        ("status", "BLOCKED", 1),
+        ("status", "NEEDS_WORK", 0),
+        ("overrides", "", 1),
+        ("ic_score_sum", "", 225),
+        ("binding", "CoC", 1),
+        ("binding", "YOC", 2),
+    ]
+    db = FakeDB(results=[counters], scalars=[[ws_a, ws_b]])
+
+    payload = asyncio.run(portfolio.get_portfolio_summary(db, SimpleNamespace(id=uuid4())))
+
+    assert payload == build_portfolio_summary_payload(summaries)
+    assert len(db.statements) == 2
+    sql = str(db.statements[1][0].compile(dialect=postgresql.dialect()))
+    assert "FROM workspace_gate_counters" in sql and "deal_gate_summary" not in sql
+
+
+def test_reconciliation_repairs_drifted_counters():
+    ws = uuid4()
+    stored = [
+        SimpleNamespace(metric="deals", bucket="", value=3),
+        SimpleNamespace(metric="status", bucket="ADVANCE", value=3),
+        SimpleNamespace(metric="binding", bucket="DSCR", value=1),
+    ]
+    expected = [("deals", "", 2), ("status", "ADVANCE", 2), ("ic_score_sum", "", 190)]
+    db = FakeDB(results=[expected], scalars=[stored])
+
+    report = reconcile_gate_counters(db, [ws])
+
+    assert report["workspaces_checked"] == 1 and report["drifted_workspaces"] == 1
+    assert [(c["metric"], c["bucket"], c["stored"], c["expected"]) for c in report["corrections"]] == [
+        ("binding", "DSCR", 1, 0),
+        ("deals", "", 3, 2),
+        ("ic_score_sum", "", 0, 190),
+        ("status", "ADVANCE", 3, 2),
+    ]
+    lock_sql = str(db.statements[0][0].compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE" in lock_sql
+    (delete_stmt, _), (upsert_stmt, rows) = db.statements[2:]
+    assert "DELETE FROM workspace_gate_counters" in str(delete_stmt.compile(dialect=postgresql.dialect()))
+    assert "value = excluded.value" in str(upsert_stmt.compile(dialect=postgresql.dialect()))
+    assert {(row["metric"], row["bucket"]): row["value"] for row in rows} == {
+        ("deals", ""): 2,
+        ("status", "ADVANCE"): 2,
+        ("ic_score_sum", ""): 190,
+    }
+    assert db.commits == 1
+
+
+def test_reconciliation_leaves_matching_counters_alone():
+    stored = [SimpleNamespace(metric="deals", bucket="", value=2), SimpleNamespace(metric="status", bucket="X", value=0)]
+    db = FakeDB(results=[[("deals", "", 2)]], scalars=[stored])
+
+    report = reconcile_gate_counters(db, [uuid4()])
+
+    assert report["corrections"] == [] and len(db.statements) == 2
@@ -6,7 +6,7 @@ from fastapi import HTTPException
 
 from app.api.deps import require_deal_advance
 from app.api.router import api_router
-from app.models.enums import DealGateState
+from app.models.enums import DealGateState, MemberRole
 from app.services.gating import compute_gate_state, transition_deal_gate
 
 
@@ -47,12 +47,13 @@ def test_transition_no_log_when_state_unchanged():
     assert len(db.added) == 0
 
 
-class FakeScalarDB:
-    def __init__(self, responses):
-        self.responses = list(responses)
+class FakeAccessDB:
+    def __init__(self, row):
+        self.row = row
+        self.info = {}
 
-    def scalar(self, _stmt):
-        return self.responses.pop(0)
+    def execute(self, _stmt):
+        return SimpleNamespace(first=lambda: self.row)
 
 
 @pytest.fixture
@@ -60,26 +61,18 @@ def fake_user():
     return SimpleNamespace(id=uuid4())
 
 
-@pytest.fixture
-def fake_workspace():
-    return SimpleNamespace(id=uuid4())
-
-
 @pytest.mark.parametrize("state", [DealGateState.NO_RUN, DealGateState.KILL])
-def test_require_deal_advance_blocks_no_run_and_kill(fake_user, fake_workspace, state):
-    db = FakeScalarDB([
-        SimpleNamespace(id=uuid4(), workspace_id=uuid4(), current_gate_state=state),
-        fake_workspace,
-    ])
+def test_require_deal_advance_blocks_no_run_and_kill(fake_user, state):
+    db = FakeAccessDB((SimpleNamespace(id=uuid4(), workspace_id=uuid4(), current_gate_state=state), MemberRole.MEMBER))
     with pytest.raises(HTTPException) as exc:
         require_deal_advance(str(uuid4()), db=db, user=fake_user)
     assert exc.value.status_code == 403
     assert "Full underwriting is locked" in exc.value.detail
 
 
-def test_require_deal_advance_allows_advance(fake_user, fake_workspace):
+def test_require_deal_advance_allows_advance(fake_user):
     deal = SimpleNamespace(id=uuid4(), workspace_id=uuid4(), current_gate_state=DealGateState.ADVANCE)
-    db = FakeScalarDB([deal, fake_workspace])
+    db = FakeAccessDB((deal, MemberRole.MEMBER))
 
     result = require_deal_advance(str(uuid4()), db=db, user=fake_user)
     assert result == deal
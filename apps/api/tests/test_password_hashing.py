@@ -0,0 +1,113 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.api import auth
+from app.core import security
+from app.core.passwords import AttemptLimiter, PasswordHasher, PasswordHasherBusy
+from app.schemas.auth import LoginRequest
+
+
+def _context(rounds):
+    # sha256_crypt keeps the tests fast; the rounds policy behaves the same way as bcrypt's cost.
+    return CryptContext(
+        schemes=["sha256_crypt"],
+        sha256_crypt__default_rounds=rounds,
+        sha256_crypt__min_rounds=rounds,
+        sha256_crypt__max_rounds=rounds,
+    )
+
+
+class FakeDB:
+    def __init__(self, user):
+        self.user = user
+        self.commits = 0
+
+    def scalar(self, _stmt):
+        return self.user
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_verify_flags_hashes_made_at_another_cost():
+    old = PasswordHasher(_context(1000), workers=1, queue_depth=0)
+    hashed = old.hash("hunter2")
+    assert old.verify_and_update("hunter2", hashed) == (True, None)
+
+    new = PasswordHasher(_context(2000), workers=1, queue_depth=0)
+    valid, upgraded = new.verify_and_update("hunter2", hashed)
+    assert valid and upgraded.startswith("$5$rounds=2000$")
+    assert new.verify_and_update("wrong", hashed) == (False, None)
+
+    snapshot = new.snapshot()
+    assert snapshot["completed"] == 2 and snapshot["in_flight"] == 0
+    assert snapshot["hash_seconds_total"] >= snapshot["hash_seconds_max"] > 0
+
+
+def test_full_queue_rejects_instead_of_waiting():
+    hasher = PasswordHasher(_context(1000), workers=1, queue_depth=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    result = {}
+    worker = threading.Thread(target=lambda: result.setdefault("value", hasher.run(slow_hash)))
+    worker.start()
+    started.wait(5)
+    with pytest.raises(PasswordHasherBusy):
+        hasher.hash("hunter2")
+    release.set()
+    worker.join(5)
+
+    assert result["value"] == "done"
+    assert hasher.snapshot()["rejected"] == 1
+
+
+def test_attempt_limiter_uses_a_sliding_window():
+    now = [0.0]
+    limiter = AttemptLimiter(attempts=2, window_seconds=60, clock=lambda: now[0])
+
+    assert limiter.hit("a@example.com") is None
+    now[0] = 10
+    assert limiter.hit("a@example.com") is None
+    assert limiter.hit("a@example.com") == 50
+    assert limiter.hit("b@example.com") is None
+    now[0] = 61
+    assert limiter.hit("a@example.com") is None
+
+
+def test_login_upgrades_hash_after_cost_change(monkeypatch):
+    hashed = PasswordHasher(_context(1000), workers=1, queue_depth=0).hash("hunter2")
+    monkeypatch.setattr(security, "password_hasher", PasswordHasher(_context(2000), workers=1, queue_depth=0))
+    monkeypatch.setattr(auth, "auth_attempts", AttemptLimiter(attempts=5, window_seconds=60))
+    user = SimpleNamespace(id="u-1", hashed_password=hashed)
+    db = FakeDB(user)
+
+    out = auth.login(LoginRequest(email="Owner@Example.com", password="hunter2"), db)
+
+    assert out.access_token
+    assert user.hashed_password.startswith("$5$rounds=2000$") and db.commits == 1
+
+
+def test_login_is_rate_limited_per_email_and_sheds_load_when_busy(monkeypatch):
+    monkeypatch.setattr(auth, "auth_attempts", AttemptLimiter(attempts=1, window_seconds=60))
+    db = FakeDB(SimpleNamespace(id="u-1", hashed_password="x"))
+
+    def busy(*_args):
+        raise PasswordHasherBusy("full")
+
+    monkeypatch.setattr(auth, "verify_and_update_password", busy)
+    with pytest.raises(HTTPException) as exc:
+        auth.login(LoginRequest(email="owner@example.com", password="hunter2"), db)
+    assert exc.value.status_code == 503
+
+    with pytest.raises(HTTPException) as exc:
+        auth.login(LoginRequest(email="OWNER@example.com", password="hunter2"), db)
+    assert exc.value.status_code == 429 and int(exc.value.headers["Retry-After"]) >= 1
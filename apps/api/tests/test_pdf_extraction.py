@@ -0,0 +1,117 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.ingestors.files import parse_pdf
+from app.models.entities import CompListing, CompRollup, CompRun, CompSubject, CompSubjectVariance, Document, DocumentSpan
+from app.models.enums import CompRunStatus
+from app.workers import jobs
+
+pytest.importorskip("pdfplumber")
+
+RENT_ROLL = [
+    ["Property Address", "Unit", "Beds", "Baths", "Monthly Rent", "Lease Start", "Tenant"],
+    ["10 Main St", "2A", "1", "1", "$3,000", "01/05/2024", "Smith"],
+    ["", "2B", "1", "1", "$2,900", "", ""],
+    ["12 Main St", "3C", "2", "1.5", "$3,450.50", "2024-02-01", "Lee"],
+]
+SUMMARY = [["Metric", "Value"], ["Occupancy", "96%"]]
+
+
+def _table(rows, top=740.0, left=40.0, width=75.0, height=20.0) -> bytes:
+    n_rows, n_cols = len(rows), len(rows[0])
+    ops = ["0.5 w"]
+    for r in range(n_rows + 1):
+        y = top - r * height
+        ops.append(f"{left} {y} m {left + n_cols * width} {y} l S")
+    for c in range(n_cols + 1):
+        x = left + c * width
+        ops.append(f"{x} {top} m {x} {top - n_rows * height} l S")
+    for r, row in enumerate(rows):
+        for c, text in enumerate(row):
+            if text:
+                ops.append(f"BT /F1 8 Tf {left + c * width + 3} {top - (r + 1) * height + 6} Td ({text}) Tj ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def _pdf(path, pages) -> None:
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for i, content in enumerate(pages):
+        page_id, stream_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {stream_id} 0 R "
+            "/Resources << /Font << /F1 3 0 R >> >> >>"
+        ).encode()
+        objects[stream_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out, offsets = bytearray(b"%PDF-1.4\n"), {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[obj_id] for obj_id in sorted(objects))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+@pytest.fixture
+def rent_roll(tmp_path):
+    path = tmp_path / "om.pdf"
+    _pdf(path, [_table(SUMMARY), _table(RENT_ROLL)])
+    return str(path)
+
+
+def test_pdf_tables_map_onto_comp_rows(rent_roll):
+    rows, report = parse_pdf(rent_roll)
+
+    assert [(r.address, r.unit, r.beds, r.rent, r.date_observed.isoformat()) for r in rows] == [
+        ("10 Main St", "2A", 1.0, 3000.0, "2024-01-05"),
+        ("12 Main St", "3C", 2.0, 3450.5, "2024-02-01"),
+    ]
+    assert rows[0].source_ref == f"{rent_roll}#page=2"
+    assert (report["rows_parsed"], report["rows_dropped"], report["tables"]) == (2, 1, 2)
+    assert report["unmapped_columns"] == ["Metric", "Value", "Tenant"]
+    assert [page["page"] for page in report["pages"]] == [1, 2]
+    assert report["spans"] == sum(1 for row in SUMMARY + RENT_ROLL for cell in row if cell)
+
+
+def test_parallel_pages_match_sequential(rent_roll):
+    rows, _ = parse_pdf(rent_roll)
+    parallel_rows, _ = parse_pdf(rent_roll, workers=2)
+    assert [r.dedupe_key for r in parallel_rows] == [r.dedupe_key for r in rows]
+
+
+def test_missing_file_reports_instead_of_failing(tmp_path):
+    rows, report = parse_pdf(str(tmp_path / "nope.pdf"))
+    assert rows == [] and report["note"] == "file not found" and report["rows_parsed"] == 0
+
+
+def test_pdf_run_streams_pages_into_spans_and_listings(rent_roll):
+    engine = create_engine("sqlite://")
+    tables = [CompRun, CompListing, CompRollup, CompSubject, CompSubjectVariance, Document, DocumentSpan]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in tables])
+
+    with Session(engine) as db:
+        run = CompRun(workspace_id=uuid4(), deal_id=uuid4(), created_by=uuid4(), status=CompRunStatus.RUNNING)
+        db.add(run)
+        db.flush()
+        for _ in range(2):
+            report = {}
+            jobs._persist_rows_and_aggregates(db, run, jobs._pdf_rows(db, run, rent_roll, report), parse_report=report)
+            db.commit()
+
+        document = db.scalar(select(Document))
+        spans = db.scalars(select(DocumentSpan).order_by(DocumentSpan.page, DocumentSpan.table_cell)).all()
+        assert report["document_id"] == str(document.id) and document.doc_type == "comp_pdf"
+        assert len(spans) == report["spans"]
+        cell = next(span for span in spans if span.text_span == "$3,450.50")
+        assert cell.page == 2 and cell.table_cell == "t0r3c4"
+        assert cell.bbox["x0"] < cell.bbox["x1"] and cell.bbox["top"] < cell.bbox["bottom"]
+        assert db.scalars(select(CompListing.address).order_by(CompListing.address)).all() == ["10 Main St", "12 Main St"]
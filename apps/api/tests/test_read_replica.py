@@ -0,0 +1,121 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.api import deps
+from app.core.security import create_access_token
+from app.db.replica import (
+    ReadRouter,
+    RecentWrites,
+    ReplicaMonitor,
+    collect_deal_writes,
+    deal_writes_committed,
+    forget_deal_writes,
+)
+from app.models.entities import Deal, DealComment
+
+
+class FakeEngine:
+    def __init__(self, lags):
+        self.lags = list(lags)
+        self.checks = 0
+
+    @contextmanager
+    def connect(self):
+        self.checks += 1
+        lag = self.lags.pop(0)
+        if isinstance(lag, Exception):
+            raise lag
+        yield SimpleNamespace(execute=lambda _stmt: SimpleNamespace(scalar=lambda: lag))
+
+
+class BrokenRedis:
+    def exists(self, _key):
+        raise ConnectionError("redis down")
+
+
+def _clock(start=0.0):
+    now = [start]
+    return now, lambda: now[0]
+
+
+def test_recent_writes_expire_and_fail_safe_to_primary():
+    now, clock = _clock()
+    writes = RecentWrites(10, clock=clock)
+    user, deal = uuid4(), uuid4()
+
+    writes.record(user, [deal])
+    assert writes.is_recent(user, deal) and not writes.is_recent(uuid4(), deal)
+    now[0] = 10
+    assert not writes.is_recent(user, deal)
+
+    assert RecentWrites(10, redis=BrokenRedis(), clock=clock).is_recent(user, deal)
+
+
+def test_monitor_samples_lag_once_per_interval_and_falls_back_on_errors():
+    now, clock = _clock()
+    engine = FakeEngine([0.5, 12.0, RuntimeError("replica down")])
+    monitor = ReplicaMonitor(engine, max_lag_seconds=5, check_interval_seconds=5, clock=clock)
+
+    assert monitor.usable() and monitor.usable() and engine.checks == 1
+    now[0] = 5
+    assert not monitor.usable() and monitor.status.lag_seconds == 12.0
+    now[0] = 10
+    assert not monitor.usable() and monitor.status.check_errors == 1
+
+
+def test_router_keeps_recent_writers_and_lagging_replicas_on_primary():
+    now, clock = _clock()
+    writes = RecentWrites(10, clock=clock)
+    router = ReadRouter(ReplicaMonitor(FakeEngine([0.0, 30.0]), 5, 5, clock=clock), writes)
+    user, deal = uuid4(), uuid4()
+
+    assert router.use_replica(user, deal)
+    writes.record(user, [deal])
+    assert not router.use_replica(user, deal)
+    assert router.use_replica(user, uuid4())
+    now[0] = 20
+    assert not router.use_replica(user, deal)
+
+    snapshot = router.snapshot()
+    assert snapshot["lag_seconds"] == 30.0 and not snapshot["healthy"]
+    assert snapshot["routed"] == {"replica": 2, "primary_recent_write": 1, "primary_replica_lagging": 1}
+    assert ReadRouter(None, writes).snapshot() == {"enabled": False}
+
+
+def test_committed_deal_writes_are_recorded_for_the_authenticated_user():
+    writes = RecentWrites(10)
+    deal = Deal(id=uuid4(), workspace_id=uuid4(), name="Queens 24-Unit")
+    comment = DealComment(deal_id=uuid4(), body="Need revised debt quote.")
+    user = uuid4()
+    session = SimpleNamespace(new={comment}, dirty={deal}, deleted=set(), info={"user_id": user})
+
+    collect_deal_writes(session, None)
+    deal_writes_committed(writes)(session)
+
+    assert writes.is_recent(user, deal.id) and writes.is_recent(user, comment.deal_id)
+    assert "written_deal_ids" not in session.info
+
+    collect_deal_writes(session, None)
+    forget_deal_writes(session)
+    assert "written_deal_ids" not in session.info
+
+
+def test_read_dependency_routes_by_user_and_deal(monkeypatch):
+    router = SimpleNamespace(enabled=True, calls=[])
+
+    def use_replica(user_id, deal_id):
+        router.calls.append((user_id, deal_id))
+        return True
+
+    router.use_replica = use_replica
+    monkeypatch.setattr(deps, "read_router", router)
+    monkeypatch.setattr(deps, "read_session", lambda replica: SimpleNamespace(replica=replica, close=lambda: None))
+    user_id, deal_id = str(uuid4()), str(uuid4())
+    creds = SimpleNamespace(credentials=create_access_token(user_id))
+
+    db = next(deps.get_read_db(SimpleNamespace(path_params={"deal_id": deal_id}), creds))
+
+    assert db.replica and router.calls == [(user_id, deal_id)]
+    db = next(deps.get_read_db(SimpleNamespace(path_params={}), SimpleNamespace(credentials="garbage")))
+    assert not db.replica and len(router.calls) == 1
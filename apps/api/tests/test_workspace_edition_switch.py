@@ -14,6 +14,7 @@ class FakeDB:
     def __init__(self, scalar_responses=None):
         self.scalar_responses = list(scalar_responses or [])
         self.added = []
+        self.info = {}
         self.committed = False
 
     def scalar(self, _stmt):
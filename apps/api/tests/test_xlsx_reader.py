@@ -0,0 +1,70 @@
+import dataclasses
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook
+
+from app.ingestors.xlsx import compile_column_map, parse_workbook
+
+
+def _workbook(path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Queens"
+    ws.append(["Property Address", "Apt", "Bedrooms", "Bathrms", "Net Rent ($)", "Gross", "Lease Start", "Broker", "Notes"])
+    ws.append(["10 Main St", 7, 1, 1, 3000, 3200, datetime(2024, 1, 5), "Acme", "ok"])
+    ws.append([None, "1", 1, 1, 2000, 2100, None, None, None])
+    ws.append(["11 Main St", "2B", 2, 1.5, 3400.5, None, datetime(2024, 2, 1, 9, 30), None, None])
+    brooklyn = wb.create_sheet("Brooklyn")
+    brooklyn.append(["address", "UNIT", "beds", "rent", "Date Rented", "Concessions"])
+    brooklyn.append(["5 Bergen St", "3", 3, 4100, datetime(2024, 3, 1), "1 month"])
+    summary = wb.create_sheet("Summary")
+    summary.append(["Metric", "Value"])
+    summary.append(["Avg rent", 3100])
+    wb.save(path)
+
+
+def _comparable(rows):
+    return [{**dataclasses.asdict(row), "observed_at": None} for row in rows]
+
+
+def test_column_map_resolves_aliases_then_fuzzy_headers():
+    column_map = compile_column_map(["Adress", "Unit #", "BR", "Rent", "Net Rent", "Grss Rent", "Broker", None])
+
+    assert column_map.indices == {"unit": 1, "beds": 2, "rent": 3, "address": 0, "gross_rent": 5}
+    assert column_map.headers["address"] == "Adress"
+    assert column_map.unmapped == ["Net Rent", "Broker"]
+
+
+def test_workbook_parses_every_sheet_with_an_address_column(tmp_path):
+    path = tmp_path / "comps.xlsx"
+    _workbook(path)
+
+    rows, report = parse_workbook(str(path), backend="openpyxl")
+
+    assert [(row.address, row.unit, row.rent, row.date_observed) for row in rows] == [
+        ("10 Main St", "7", 3000.0, datetime(2024, 1, 5).date()),
+        ("11 Main St", "2B", 3400.5, datetime(2024, 2, 1).date()),
+        ("5 Bergen St", "3", 4100.0, datetime(2024, 3, 1).date()),
+    ]
+    assert (report["rows_parsed"], report["rows_dropped"]) == (3, 2)
+    assert report["unmapped_columns"] == ["Broker", "Concessions"]
+    queens, brooklyn, summary = report["sheets"]
+    assert queens["columns"]["rent"] == "Net Rent ($)" and queens["columns"]["baths"] == "Bathrms"
+    assert queens["seconds"] >= 0
+    assert brooklyn["rows_parsed"] == 1 and summary["skipped"] == "no address column"
+    assert (summary["rows_parsed"], summary["rows_dropped"]) == (0, 1)
+
+
+def test_parallel_sheets_and_backends_agree(tmp_path):
+    path = tmp_path / "comps.xlsx"
+    _workbook(path)
+    rows, report = parse_workbook(str(path), backend="openpyxl")
+
+    parallel_rows, _ = parse_workbook(str(path), backend="openpyxl", workers=2)
+    assert _comparable(parallel_rows) == _comparable(rows)
+
+    pytest.importorskip("python_calamine")
+    fast_rows, fast_report = parse_workbook(str(path), backend="calamine")
+    assert fast_report["backend"] == "calamine"
+    assert _comparable(fast_rows) == _comparable(rows)
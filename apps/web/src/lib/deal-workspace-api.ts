@@ -50,6 +50,7 @@ export type ActivityEvent = {
   actor: { id: string | null; email: string | null; name: string | null };
   summary: string;
   metadata: Record<string, unknown>;
+  cursor?: string | null;
 };
 
 export async function getDealWorkspaceSummary(workspaceId: string, dealId: string): Promise<DealWorkspaceSummary> {